@@ -0,0 +1,402 @@
+"""Benchmarks for the job pipeline on synthetic jobspy results.
+
+Run from the repository root:
+
+    python -m benchmarks.bench                          # 1k, 10k and 100k rows
+    python -m benchmarks.bench --sizes 1m -k export     # a million rows, export stages only
+    python -m benchmarks.bench --save                   # record the results as the baseline
+
+Each benchmark is timed (best of several runs), then run once more under
+tracemalloc for its peak Python memory. Results are compared with the saved
+baseline, and the exit status is 1 if anything got slower or bigger than the
+tolerance allows.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from rich.console import Console
+from rich.table import Table
+
+import jobpacker
+from benchmarks.synthetic import synthetic_jobs
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_SIZES = "1k,10k,100k"
+
+# A result regresses when it is this much worse than the baseline...
+TOLERANCE = 0.25
+# ...and worse by more than these, below which differences are noise
+MIN_SECONDS = 0.005
+MIN_MB = 1.0
+
+# save_config/load_config round trips per timed run
+CONFIG_ROUNDS = 100
+
+# Cold start in a fresh interpreter: import, banner and main menu, answering "4" to exit
+STARTUP_SCRIPT = """
+import io, sys
+sys.stdin = io.StringIO("4\\n")
+import jobpacker
+jobpacker.preload_scraper()
+jobpacker.display_banner()
+jobpacker.display_main_menu()
+"""
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str, sized: bool = True):
+    """Register a benchmark.
+
+    The decorated function takes a Workload (None when `sized` is False), does
+    any setup that should not be timed, and returns the function to time.
+    """
+
+    def register(setup):
+        BENCHMARKS[name] = (setup, sized)
+        return setup
+
+    return register
+
+
+class Workload:
+    """Synthetic results of one size, plus a scratch directory for output files."""
+
+    def __init__(self, rows: int, directory: Path):
+        self.frame = synthetic_jobs(rows)
+        self.jobs = jobpacker.JobRows.from_frame(self.frame)
+        self.directory = directory
+
+
+def consume(iterable) -> None:
+    """Run an iterator to the end without keeping what it yields."""
+    deque(iterable, maxlen=0)
+
+
+@benchmark("frame_to_rows")
+def bench_frame_to_rows(work: Workload):
+    return lambda: jobpacker.JobRows.from_frame(work.frame)
+
+
+@benchmark("to_cleansheet_jobs")
+def bench_to_cleansheet_jobs(work: Workload):
+    return lambda: consume(jobpacker.iter_cleansheet_jobs(work.jobs))
+
+
+@benchmark("write_export_json")
+def bench_write_export_json(work: Workload):
+    filename = str(work.directory / "jobs.json")
+    return lambda: jobpacker.write_export(jobpacker.iter_cleansheet_jobs(work.jobs), filename)
+
+
+@benchmark("write_export_ndjson_gz")
+def bench_write_export_ndjson_gz(work: Workload):
+    filename = str(work.directory / "jobs.ndjson.gz")
+    return lambda: jobpacker.write_export(
+        jobpacker.iter_cleansheet_jobs(work.jobs), filename, export_format="ndjson"
+    )
+
+
+@benchmark("export_jobs")
+def bench_export_jobs(work: Workload):
+    filename = work.directory / "export.json"
+
+    def run():
+        # A leftover file would turn the export into a merge
+        filename.unlink(missing_ok=True)
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(filename)):
+            jobpacker.export_jobs(work.jobs, "benchmark")
+
+    return run
+
+
+@benchmark("display_jobs_table")
+def bench_display_jobs_table(work: Workload):
+    return lambda: jobpacker.display_jobs_table(work.jobs)
+
+
+@benchmark("dedupe_jobs")
+def bench_dedupe_jobs(work: Workload):
+    return lambda: jobpacker.dedupe_jobs(work.jobs)
+
+
+@benchmark("drop_seen_jobs")
+def bench_drop_seen_jobs(work: Workload):
+    seen_index = jobpacker.SeenUrlIndex()
+    for url in work.jobs.column("job_url")[::2]:
+        seen_index.add(url)
+    return lambda: jobpacker.drop_seen_jobs(work.jobs, seen_index)
+
+
+@benchmark("sort_and_filter")
+def bench_sort_and_filter(work: Workload):
+    def run():
+        view = jobpacker.JobsView(work.jobs)
+        view.sort("salary")
+        view.filter("company", "acme")
+        view.go(view.page_count - 1)
+        view.render()
+
+    return run
+
+
+@benchmark("save_load_config", sized=False)
+def bench_save_load_config(work: None):
+    config = {**jobpacker.DEFAULT_CONFIG, "search_term": "python developer"}
+
+    def run():
+        for _ in range(CONFIG_ROUNDS):
+            jobpacker.save_config(config)
+            jobpacker.load_config()
+
+    return run
+
+
+@benchmark("startup", sized=False)
+def bench_startup(work: None):
+    # Time to the main menu, while jobspy is still importing in the background
+    command = [sys.executable, "-c", STARTUP_SCRIPT]
+    root = Path(__file__).parent.parent
+    return lambda: subprocess.run(command, cwd=root, capture_output=True, check=True)
+
+
+def measure(run, repeat: int, memory: bool = True) -> dict:
+    """Time `run` (best of `repeat`) and measure its peak traced memory.
+
+    Returns:
+        Dict with "seconds" and "peak_mb" (None if `memory` is False)
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        try:
+            run()
+            peak = round(tracemalloc.get_traced_memory()[1] / 2**20, 3)
+        finally:
+            tracemalloc.stop()
+    return {"seconds": round(min(times), 6), "peak_mb": peak}
+
+
+def parse_sizes(text: str) -> list:
+    """Parse "1k,10k,250" into row counts.
+
+    Raises:
+        argparse.ArgumentTypeError: If a size is not a known label or a number
+    """
+    sizes = []
+    for label in filter(None, (part.strip().lower() for part in text.split(","))):
+        if label in SIZES:
+            sizes.append((label, SIZES[label]))
+        elif label.isdigit() and int(label) > 0:
+            sizes.append((label, int(label)))
+        else:
+            raise argparse.ArgumentTypeError(f"unknown size {label!r}")
+    return sizes
+
+
+def run_benchmarks(sizes: list, names: list, memory: bool = True, repeat=None) -> dict:
+    """Run the named benchmarks at each size, isolated from the real config and data.
+
+    Returns:
+        Dict mapping "name/size" (or "name" for unsized benchmarks) to results
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="jobpacker-bench-") as scratch:
+        scratch = Path(scratch)
+        with (
+            open(os.devnull, "w") as devnull,
+            patch.multiple(
+                jobpacker,
+                console=Console(file=devnull, width=160, force_terminal=True),
+                CONFIG_PATH=scratch / "config.json",
+                CACHE_DIR=scratch / "cache",
+                HARVEST_STATE_PATH=scratch / "harvest_state.json",
+                DESCRIPTION_STORE_DIR=scratch / "descriptions",
+                SEEN_INDEX_PATH=scratch / "seen_urls.idx",
+                JOB_STORE_PATH=scratch / "jobs.db",
+            ),
+        ):
+            for name in names:
+                setup, sized = BENCHMARKS[name]
+                if not sized:
+                    results[name] = measure(setup(None), repeat or 5, memory)
+
+            for label, rows in sizes:
+                work = Workload(rows, scratch)
+                for name in names:
+                    setup, sized = BENCHMARKS[name]
+                    if sized:
+                        count = repeat or max(1, min(5, 200_000 // rows))
+                        results[f"{name}/{label}"] = {
+                            "rows": rows,
+                            **measure(setup(work), count, memory),
+                        }
+                del work
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float = TOLERANCE) -> list:
+    """Return a description of every result that regressed against the baseline."""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        seconds, base_seconds = result["seconds"], base["seconds"]
+        if seconds > base_seconds * (1 + tolerance) and seconds - base_seconds > MIN_SECONDS:
+            regressions.append(f"{key}: {base_seconds:.3f}s -> {seconds:.3f}s")
+        peak, base_peak = result.get("peak_mb"), base.get("peak_mb")
+        if peak is not None and base_peak is not None:
+            if peak > base_peak * (1 + tolerance) and peak - base_peak > MIN_MB:
+                regressions.append(f"{key}: {base_peak:.1f} MB -> {peak:.1f} MB")
+    return regressions
+
+
+def load_baseline(path: Path) -> dict:
+    """Load a saved baseline, or an empty one if there is none."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {"results": {}}
+
+
+def save_baseline(path: Path, results: dict) -> None:
+    """Merge results into the baseline at `path`, recording the machine they ran on."""
+    merged = {**load_baseline(path).get("results", {}), **results}
+    baseline = {
+        "machine": machine_info(),
+        "updated": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "results": dict(sorted(merged.items())),
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def machine_info() -> dict:
+    """Describe the machine and interpreter, since timings only compare on the same one."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def display_results(console: Console, results: dict, baseline: dict, tolerance: float) -> None:
+    """Print a table of results next to their baseline."""
+    table = Table(title="Benchmarks")
+    table.add_column("Benchmark", style="bold")
+    table.add_column("Rows", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Peak MB", justify="right")
+    table.add_column("vs baseline", justify="right")
+
+    for key, result in results.items():
+        base = baseline.get(key)
+        change = ""
+        if base:
+            ratio = result["seconds"] / base["seconds"] if base["seconds"] else 1.0
+            style = "red" if ratio > 1 + tolerance else "green" if ratio < 1 else ""
+            change = f"[{style}]{ratio:.2f}x[/]" if style else f"{ratio:.2f}x"
+        peak = result.get("peak_mb")
+        table.add_row(
+            key.split("/")[0],
+            f"{result['rows']:,}" if "rows" in result else "",
+            f"{result['seconds'] * 1000:,.1f} ms",
+            "" if peak is None else f"{peak:,.1f}",
+            change,
+        )
+    console.print(table)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the benchmark command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.bench",
+        description="Time the job pipeline on synthetic jobspy results.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=parse_sizes(DEFAULT_SIZES),
+        help=f"comma-separated row counts: {', '.join(SIZES)} or a number "
+        f"(default {DEFAULT_SIZES})",
+    )
+    parser.add_argument(
+        "-k", dest="select", default="", help="only run benchmarks whose name contains this"
+    )
+    parser.add_argument("--repeat", type=int, help="timed runs per benchmark (default 1-5)")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc run (faster)"
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=TOLERANCE,
+        help=f"allowed slowdown before failing, as a fraction (default {TOLERANCE})",
+    )
+    parser.add_argument("--save", action="store_true", help="save results into the baseline")
+    parser.add_argument("--output", type=Path, help="also write the results to this JSON file")
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    """Run the benchmarks and compare them with the baseline.
+
+    Returns:
+        0 if nothing regressed (or results were saved), 1 otherwise
+    """
+    args = build_arg_parser().parse_args(argv)
+    console = Console()
+
+    names = [name for name in BENCHMARKS if args.select in name]
+    if not names:
+        console.print(f"[red]No benchmark matches {args.select!r}[/]")
+        return 1
+
+    results = run_benchmarks(args.sizes, names, not args.no_memory, args.repeat)
+    baseline = load_baseline(args.baseline)
+    display_results(console, results, baseline.get("results", {}), args.tolerance)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"machine": machine_info(), "results": results}, f, indent=2)
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        console.print(f"[green]Saved {len(results)} results to {args.baseline}[/]")
+        return 0
+
+    if baseline.get("machine") and baseline["machine"] != machine_info():
+        console.print("[yellow]Baseline was recorded on a different machine[/]")
+    regressions = compare(results, baseline.get("results", {}), args.tolerance)
+    for regression in regressions:
+        console.print(f"[red]Regression: {regression}[/]")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Load test of the search path against the local mock job boards.
+
+    python -m benchmarks.loadtest --queries 300 --workers 64 --rate-429 0.05 --hang-rate 0.01
+
+Runs a batch of queries through iter_search_results(), the same concurrent
+pipeline batch searches use, against a mock board server started in this
+process (or an external one with --url), then reports throughput, latency
+percentiles and how each query ended.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+import jobpacker
+from benchmarks.mock_board import BoardProfile, parse_latency, start_server
+
+SEARCH_TERMS = ["python developer", "data engineer", "site reliability", "product manager"]
+LOCATIONS = ["New York, NY", "Austin, TX", "Remote", "Seattle, WA", "Chicago, IL"]
+
+# Rate limits that never hold a query back, so the pipeline itself is measured
+UNTHROTTLED = {"rate": 1e6, "burst": 1_000_000, "concurrency": 1024, "max_concurrency": 1024}
+
+
+def build_queries(count: int, boards: list) -> list:
+    """Return `count` distinct (board, search_term, location) queries."""
+    queries = []
+    for i in range(count):
+        term = f"{SEARCH_TERMS[i % len(SEARCH_TERMS)]} {i // len(SEARCH_TERMS)}"
+        queries.append((boards[i % len(boards)], term, LOCATIONS[i % len(LOCATIONS)]))
+    return queries
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Return the nearest-rank percentile of values (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def run_load(
+    url: str,
+    queries: list,
+    workers: int,
+    board_concurrency: int = 0,
+    board_timeout: float = 30,
+    timeout: float = 600,
+    results_per_query: int = 50,
+    throttle: bool = False,
+) -> dict:
+    """Run queries against the mock boards at `url` and summarize how they went.
+
+    Returns:
+        Dict of counts, throughput and latency percentiles (seconds)
+    """
+    config = {
+        **jobpacker.DEFAULT_CONFIG,
+        "mock_board_url": url,
+        "board_timeout": board_timeout,
+        "results_per_site": results_per_query,
+        "cache_ttl": 0,
+        "incremental": False,
+        "rate_limits": {} if throttle else dict.fromkeys(jobpacker.ALL_JOB_BOARDS, UNTHROTTLED),
+    }
+    jobpacker.RATE_LIMITERS.clear()
+
+    start = time.monotonic()
+    results = list(
+        jobpacker.iter_search_results(queries, config, timeout, workers, board_concurrency)
+    )
+    wall = time.monotonic() - start
+
+    latencies = [result.elapsed for result in results if result.status == "ok"]
+    statuses = {}
+    for result in results:
+        statuses[result.status] = statuses.get(result.status, 0) + 1
+    rows = sum(len(result.rows) for result in results)
+    return {
+        "queries": len(results),
+        "statuses": statuses,
+        "rows": rows,
+        "seconds": round(wall, 3),
+        "queries_per_second": round(len(results) / wall, 2) if wall else 0.0,
+        "rows_per_second": round(rows / wall, 1) if wall else 0.0,
+        "p50": round(percentile(latencies, 0.5), 3),
+        "p90": round(percentile(latencies, 0.9), 3),
+        "p99": round(percentile(latencies, 0.99), 3),
+        "max": round(max(latencies, default=0.0), 3),
+        "errors": sorted({result.error for result in results if result.error})[:5],
+    }
+
+
+def display_summary(console: Console, summary: dict) -> None:
+    """Print the load test summary."""
+    table = Table(title="Load test", show_header=False)
+    table.add_column(style="bold")
+    table.add_column(justify="right")
+    table.add_row("Queries", f"{summary['queries']:,}")
+    for status, count in sorted(summary["statuses"].items()):
+        table.add_row(f"  {status}", f"{count:,}")
+    table.add_row("Rows", f"{summary['rows']:,}")
+    table.add_row("Wall time", f"{summary['seconds']:.2f}s")
+    table.add_row("Throughput", f"{summary['queries_per_second']:.1f} queries/s")
+    table.add_row("", f"{summary['rows_per_second']:,.0f} rows/s")
+    for name in ("p50", "p90", "p99", "max"):
+        table.add_row(f"Latency {name}", f"{summary[name]:.3f}s")
+    console.print(table)
+    for error in summary["errors"]:
+        console.print(f"[dim]{error}[/]")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the load test command line."""
+    defaults = BoardProfile()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.loadtest",
+        description="Load test the search pipeline against mock job boards.",
+    )
+    parser.add_argument("--queries", type=int, default=200, help="queries to run (default 200)")
+    parser.add_argument("--workers", type=int, default=32, help="queries at once (default 32)")
+    parser.add_argument(
+        "--board-concurrency", type=int, default=0, help="queries at once per board (0: no limit)"
+    )
+    parser.add_argument("--boards", default=",".join(jobpacker.ALL_JOB_BOARDS))
+    parser.add_argument("--results", type=int, default=50, help="jobs wanted per query")
+    parser.add_argument("--board-timeout", type=float, default=30)
+    parser.add_argument("--timeout", type=float, default=600, help="deadline for the whole run")
+    parser.add_argument(
+        "--throttle", action="store_true", help="keep the built-in per-board rate limits"
+    )
+    parser.add_argument("--url", help="use a mock board server already running at this URL")
+    parser.add_argument("--latency", default=defaults.latency, help="see benchmarks.mock_board")
+    parser.add_argument("--page-size", type=int, default=defaults.page_size)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--hang-rate", type=float, default=0.0)
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    """Run the load test."""
+    args = build_arg_parser().parse_args(argv)
+    console = Console()
+    try:
+        parse_latency(args.latency)
+    except ValueError as e:
+        console.print(f"[red]{e}[/]")
+        return 1
+
+    server = None
+    url = args.url
+    if not url:
+        server = start_server(
+            BoardProfile(
+                latency=args.latency,
+                page_size=args.page_size,
+                jobs_per_query=args.results,
+                rate_429=args.rate_429,
+                rate_5xx=args.rate_5xx,
+                hang_rate=args.hang_rate,
+                # Hangs outlast the board timeout, so they end as timeouts
+                hang_seconds=args.board_timeout * 2,
+            )
+        )
+        url = server.url
+
+    boards = [board.strip() for board in args.boards.split(",") if board.strip()]
+    try:
+        summary = run_load(
+            url,
+            build_queries(args.queries, boards),
+            args.workers,
+            args.board_concurrency,
+            args.board_timeout,
+            args.timeout,
+            args.results,
+            args.throttle,
+        )
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    if server is not None:
+        summary["server"] = dict(server.stats)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        display_summary(console, summary)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
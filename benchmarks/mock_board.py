@@ -0,0 +1,277 @@
+"""Local stand-in for the job boards, for load and failure testing.
+
+    python -m benchmarks.mock_board --port 8765 --latency lognormal:0.4,0.8 --rate-429 0.05
+    python jobpacker.py search -t python --mock-boards http://127.0.0.1:8765 -o -
+
+GET /<board>/jobs?search_term=...&location=...&page=N&per_page=M answers with
+{"jobs": [...], "next_page": N + 1 or null} after a delay drawn from the
+board's latency distribution, or fails with HTTP 429, HTTP 503 or a hang at
+the board's configured rates. Jobs are synthetic jobspy rows; the same query
+always gets the same jobs.
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from dataclasses import asdict, dataclass, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.synthetic import synthetic_jobs
+
+# Distinct synthetic rows the server hands out (queries pick different slices)
+POOL_ROWS = 2000
+
+
+def parse_latency(spec: str):
+    """Parse a latency distribution into a function of a Random returning seconds.
+
+    Specs are "fixed:S", "uniform:LOW,HIGH", "exponential:MEAN" or
+    "lognormal:MEDIAN,SIGMA".
+
+    Raises:
+        ValueError: If the spec is not one of those
+    """
+    kind, _, params = spec.partition(":")
+    try:
+        values = [float(value) for value in params.split(",")] if params else []
+    except ValueError:
+        raise ValueError(f"bad latency {spec!r}") from None
+
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(*values)
+    if kind == "exponential" and len(values) == 1:
+        return lambda rng: rng.expovariate(1 / values[0]) if values[0] > 0 else 0.0
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"bad latency {spec!r}")
+
+
+@dataclass
+class BoardProfile:
+    """How one mock board behaves."""
+
+    latency: str = "lognormal:0.3,0.5"
+    page_size: int = 25
+    jobs_per_query: int = 100
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    hang_rate: float = 0.0
+    hang_seconds: float = 300.0
+
+
+class MockBoardServer(ThreadingHTTPServer):
+    """HTTP server answering board queries according to per-board profiles."""
+
+    daemon_threads = True
+    # Hundreds of queries may connect at once
+    request_queue_size = 1024
+
+    def __init__(self, address: tuple, default: BoardProfile, boards: dict | None = None):
+        super().__init__(address, MockBoardHandler)
+        self.default = default
+        self.boards = boards or {}
+        self.latencies = {}
+        self.rng = random.Random(0)
+        self.stats = {"requests": 0, "429": 0, "5xx": 0, "hangs": 0}
+        self._lock = threading.Lock()
+        pool = synthetic_jobs(POOL_ROWS).astype(object)
+        pool = pool.where(pool.notna(), None)
+        pool["date_posted"] = [str(value)[:10] if value else None for value in pool["date_posted"]]
+        self.pool = pool.to_dict("records")
+
+    @property
+    def url(self) -> str:
+        """Return the server's base URL."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def profile(self, board: str) -> BoardProfile:
+        """Return a board's profile."""
+        return self.boards.get(board, self.default)
+
+    def outcome(self, board: str) -> tuple:
+        """Draw a request's (delay in seconds, HTTP status or "hang")."""
+        profile = self.profile(board)
+        with self._lock:
+            if profile.latency not in self.latencies:
+                self.latencies[profile.latency] = parse_latency(profile.latency)
+            delay = max(0.0, self.latencies[profile.latency](self.rng))
+            roll = self.rng.random()
+            self.stats["requests"] += 1
+            if roll < profile.hang_rate:
+                self.stats["hangs"] += 1
+                return profile.hang_seconds, "hang"
+            roll -= profile.hang_rate
+            if roll < profile.rate_429:
+                self.stats["429"] += 1
+                return delay, 429
+            roll -= profile.rate_429
+            if roll < profile.rate_5xx:
+                self.stats["5xx"] += 1
+                return delay, 503
+        return delay, 200
+
+    def page(self, board: str, search_term: str, location: str, page: int, per_page: int):
+        """Return one page of a query's jobs and the next page number, or None."""
+        total = self.profile(board).jobs_per_query
+        query = zlib.crc32(f"{board}|{search_term}|{location}".lower().encode("utf-8"))
+        first = (page - 1) * per_page
+        jobs = []
+        for i in range(first, min(first + per_page, total)):
+            job = dict(self.pool[(query + i) % len(self.pool)])
+            job_id = f"{query:08x}-{i}"
+            url = f"{self.url}/{board}/job/{job_id}"
+            job.update(id=job_id, site=board, job_url=url, job_url_direct=url)
+            jobs.append(job)
+        return jobs, page + 1 if first + per_page < total else None
+
+
+class MockBoardHandler(BaseHTTPRequestHandler):
+    """Request handler for MockBoardServer."""
+
+    server: MockBoardServer
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = url.path.strip("/").split("/")
+        if len(parts) != 2 or parts[1] != "jobs":
+            self.send_json(404, {"error": "not found"})
+            return
+
+        board = parts[0]
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        delay, status = self.server.outcome(board)
+        time.sleep(delay)
+        if status == "hang":
+            return
+        if status != 200:
+            self.send_json(status, {"error": "rate limited" if status == 429 else "unavailable"})
+            return
+
+        try:
+            page = max(1, int(query.get("page", 1)))
+            per_page = int(query.get("per_page", self.server.profile(board).page_size))
+        except ValueError:
+            self.send_json(400, {"error": "bad page"})
+            return
+        per_page = max(1, min(per_page, self.server.profile(board).page_size))
+        jobs, next_page = self.server.page(
+            board, query.get("search_term", ""), query.get("location", ""), page, per_page
+        )
+        self.send_json(200, {"jobs": jobs, "next_page": next_page})
+
+    def send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        except OSError:
+            pass  # The client gave up (e.g. its board timeout expired)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(
+    default: BoardProfile | None = None,
+    boards: dict | None = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> MockBoardServer:
+    """Start a mock board server on a background thread (port 0 picks a free port).
+
+    Returns:
+        The running server; call shutdown() to stop it
+    """
+    server = MockBoardServer((host, port), default or BoardProfile(), boards)
+    threading.Thread(target=server.serve_forever, name="mock-board", daemon=True).start()
+    return server
+
+
+def load_profiles(path: str) -> dict:
+    """Load per-board profiles from a JSON file of {board: {setting: value}}.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not valid JSON or names unknown settings
+    """
+    with open(path) as f:
+        data = json.load(f)
+    names = {field.name for field in fields(BoardProfile)}
+    profiles = {}
+    for board, settings in data.items():
+        unknown = set(settings) - names
+        if unknown:
+            raise ValueError(f"unknown settings for {board}: {', '.join(sorted(unknown))}")
+        profiles[board] = BoardProfile(**settings)
+        parse_latency(profiles[board].latency)
+    return profiles
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the mock server's command line."""
+    defaults = BoardProfile()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.mock_board", description="Serve mock job board responses."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latency",
+        default=defaults.latency,
+        help="response time: fixed:S, uniform:LOW,HIGH, exponential:MEAN or "
+        f"lognormal:MEDIAN,SIGMA (default {defaults.latency})",
+    )
+    parser.add_argument("--page-size", type=int, default=defaults.page_size)
+    parser.add_argument("--jobs-per-query", type=int, default=defaults.jobs_per_query)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="share of 429 responses")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="share of 503 responses")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="share of requests that hang")
+    parser.add_argument("--hang-seconds", type=float, default=defaults.hang_seconds)
+    parser.add_argument("--profiles", help="JSON file of per-board settings overriding these")
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    """Serve until interrupted."""
+    args = build_arg_parser().parse_args(argv)
+    default = BoardProfile(
+        latency=args.latency,
+        page_size=args.page_size,
+        jobs_per_query=args.jobs_per_query,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        hang_rate=args.hang_rate,
+        hang_seconds=args.hang_seconds,
+    )
+    try:
+        parse_latency(default.latency)
+        boards = load_profiles(args.profiles) if args.profiles else {}
+    except (OSError, ValueError) as e:
+        print(f"mock_board: {e}")
+        return 1
+
+    server = MockBoardServer((args.host, args.port), default, boards)
+    print(f"Serving mock job boards on {server.url} ({json.dumps(asdict(default))})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served {json.dumps(server.stats)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,207 @@
+"""Synthetic jobspy results for benchmarks.
+
+Rows look like what scrape_jobs() returns for a real search: every jobspy
+column, salaries that are mostly missing (NaN) and sometimes hourly, dates that
+are dates, timestamps, ISO strings or missing, long markdown descriptions, and
+a share of postings repeated across boards for the dedupe stage to find.
+"""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+SITES = ["indeed", "linkedin", "glassdoor", "zip_recruiter", "google"]
+SITE_WEIGHTS = [0.4, 0.25, 0.15, 0.12, 0.08]
+SITE_URLS = {
+    "indeed": "https://www.indeed.com/viewjob?jk={}",
+    "linkedin": "https://www.linkedin.com/jobs/view/{}",
+    "glassdoor": "https://www.glassdoor.com/job-listing/j?jl={}",
+    "zip_recruiter": "https://www.ziprecruiter.com/jobs/{}",
+    "google": "https://www.google.com/search?q=jobs&htidocid={}",
+}
+
+SENIORITY = ["", "Junior ", "Senior ", "Staff ", "Lead ", "Principal "]
+ROLES = [
+    "Python Developer",
+    "Data Engineer",
+    "Software Engineer",
+    "Backend Engineer",
+    "Frontend Developer",
+    "DevOps Engineer",
+    "Machine Learning Engineer",
+    "Site Reliability Engineer",
+    "Data Scientist",
+    "Full Stack Developer",
+    "Platform Engineer",
+    "QA Automation Engineer",
+    "Security Engineer",
+    "Engineering Manager",
+    "Product Manager",
+    "Cloud Architect",
+    "Database Administrator",
+    "Mobile Developer",
+    "Solutions Engineer",
+    "Technical Writer",
+]
+COMPANY_WORDS = [
+    "Acme", "Globex", "Initech", "Umbrella", "Stark", "Wayne", "Hooli", "Pied", "Vandelay",
+    "Soylent", "Cyberdyne", "Tyrell", "Wonka", "Aperture", "Massive", "Dynamic", "Blue",
+    "Northwind", "Contoso", "Fabrikam", "Summit", "Harbor", "Pioneer", "Quantum", "Vertex",
+]  # fmt: skip
+COMPANY_SUFFIXES = ["", " Inc.", " LLC", " Corp", " Technologies", " Labs", ", Inc.", " Group"]
+LOCATIONS = [
+    "New York, NY", "San Francisco, CA", "Austin, TX", "Seattle, WA", "Boston, MA",
+    "Chicago, IL", "Denver, CO", "Atlanta, GA", "Remote", "Los Angeles, CA", "Raleigh, NC",
+    "Portland, OR", "Miami, FL", "Washington, DC", "Remote, US", "Salt Lake City, UT",
+]  # fmt: skip
+JOB_TYPES = ["fulltime", "fulltime", "fulltime", "contract", "parttime", "internship", None]
+
+PARAGRAPHS = [
+    "We are building the platform that {company} teams use every day to ship faster, and "
+    "we need a {title} who cares about reliability, clear code and the people using it.",
+    "You will design, build and operate services handling millions of requests a day, "
+    "work closely with product and design, and help shape our engineering practices.",
+    "Our stack is mostly **Python**, *Postgres*, Kafka and Kubernetes on AWS, with a "
+    "growing amount of TypeScript on the front end. We value pragmatic choices over hype.",
+    "{company} is an equal opportunity employer. We celebrate diversity and are committed "
+    "to creating an inclusive environment for all employees, regardless of background.",
+    "This role is based in {location}. Hybrid and remote arrangements are considered for "
+    "candidates with a strong track record of working asynchronously.",
+    "We offer competitive salary and equity, 401(k) matching, medical, dental and vision "
+    "coverage, a learning budget, and generous parental leave.",
+]
+BULLETS = [
+    "5+ years of professional software development experience",
+    "Strong experience with Python, SQL and distributed systems",
+    "Familiarity with CI/CD, infrastructure as code and observability tooling",
+    "Experience mentoring engineers and leading technical projects",
+    "Excellent written and verbal communication skills",
+    "Bachelor's degree in Computer Science or equivalent practical experience",
+    "Experience with [Terraform](https://www.terraform.io) is a plus",
+    "Comfortable owning services in production, including on-call",
+]
+
+
+def markdown_description(rng: np.random.Generator, company: str, title: str, location: str):
+    """Return a markdown job description of roughly 2-4 KB."""
+    fields = {"company": company, "title": title, "location": location}
+    parts = [f"## About the role\n\n{PARAGRAPHS[0].format(**fields)}"]
+    for heading in ("What you'll do", "Requirements", "Benefits"):
+        parts.append(f"### {heading}")
+        picks = rng.choice(len(BULLETS), size=int(rng.integers(3, 7)), replace=False)
+        parts.append("\n".join(f"* {BULLETS[i]}" for i in picks))
+        count = int(rng.integers(2, 6))
+        parts.extend(PARAGRAPHS[int(i)].format(**fields) for i in rng.integers(0, 6, count))
+    return "\n\n".join(parts)
+
+
+def synthetic_jobs(rows: int, seed: int = 0, duplicate_rate: float = 0.05) -> pd.DataFrame:
+    """Return a jobspy-style results DataFrame with `rows` rows.
+
+    Descriptions are drawn from a pool of up to 2,000 distinct texts, since
+    boards repeat boilerplate heavily and a million unique 3 KB strings would
+    not fit in memory. `duplicate_rate` of the rows repost an earlier row's
+    company, title and location on another board.
+
+    Returns:
+        DataFrame with jobspy's columns, in jobspy's dtypes
+    """
+    rng = np.random.default_rng(seed)
+
+    titles = np.array([f"{s}{r}" for s in SENIORITY for r in ROLES], dtype=object)
+    companies = np.array(
+        [
+            f"{a} {b}{suffix}"
+            for a in COMPANY_WORDS
+            for b in COMPANY_WORDS
+            if a != b
+            for suffix in COMPANY_SUFFIXES
+        ],
+        dtype=object,
+    )
+    locations = np.array(LOCATIONS, dtype=object)
+
+    site = np.array(SITES, dtype=object)[rng.choice(len(SITES), rows, p=SITE_WEIGHTS)]
+    title = titles[rng.integers(0, len(titles), rows)]
+    company = companies[rng.integers(0, len(companies), rows)]
+    location = locations[rng.integers(0, len(locations), rows)]
+
+    # Reposts: same posting, different board and URL
+    reposts = np.flatnonzero(rng.random(rows) < duplicate_rate)
+    reposts = reposts[reposts > 0]
+    originals = (rng.random(len(reposts)) * reposts).astype(np.int64)
+    title[reposts] = title[originals]
+    company[reposts] = company[originals]
+    location[reposts] = location[originals]
+
+    ids = rng.permutation(rows * 8)[:rows]
+    tracking = rng.random(rows) < 0.2
+    job_url = [
+        SITE_URLS[s].format(f"{i:x}") + ("&utm_source=feed" if t else "")
+        for s, i, t in zip(site, ids, tracking, strict=True)
+    ]
+
+    pool_size = min(rows, 2000)
+    pool_rows = rng.integers(0, rows, pool_size)
+    pool = np.array(
+        [markdown_description(rng, company[i], title[i], location[i]) for i in pool_rows],
+        dtype=object,
+    )
+    description = pool[rng.integers(0, pool_size, rows)]
+    description[rng.random(rows) < 0.08] = None
+
+    # Salaries: mostly missing, some hourly, some with only one end of the range
+    yearly = rng.integers(60, 250, rows) * 1000.0
+    hourly = rng.random(rows) < 0.15
+    min_amount = np.where(hourly, np.round(yearly / 2080, 2), yearly)
+    max_amount = np.round(min_amount * rng.uniform(1.1, 1.5, rows), 2)
+    missing = rng.random(rows) < 0.6
+    min_amount[missing | (rng.random(rows) < 0.05)] = np.nan
+    max_amount[missing | (rng.random(rows) < 0.05)] = np.nan
+    interval = np.where(missing, None, np.where(hourly, "hourly", "yearly"))
+
+    # Dates: jobspy gives dates, but merged frames also hold timestamps and strings
+    today = date(2025, 6, 1)
+    kinds = rng.choice(4, rows, p=[0.6, 0.15, 0.1, 0.15])
+    days = rng.integers(0, 60, rows)
+    date_posted = []
+    for kind, day in zip(kinds, days, strict=True):
+        posted = today - timedelta(days=int(day))
+        if kind == 0:
+            date_posted.append(posted)
+        elif kind == 1:
+            date_posted.append(pd.Timestamp(datetime.combine(posted, datetime.min.time())))
+        elif kind == 2:
+            date_posted.append(posted.isoformat())
+        else:
+            date_posted.append(None)
+
+    return pd.DataFrame(
+        {
+            "id": [f"{s[:2]}-{i:x}" for s, i in zip(site, ids, strict=True)],
+            "site": site,
+            "job_url": job_url,
+            "job_url_direct": np.where(rng.random(rows) < 0.3, None, job_url),
+            "title": title,
+            "company": company,
+            "location": location,
+            "date_posted": date_posted,
+            "job_type": np.array(JOB_TYPES, dtype=object)[rng.integers(0, len(JOB_TYPES), rows)],
+            "salary_source": np.where(missing, None, "direct_data"),
+            "interval": interval,
+            "min_amount": min_amount,
+            "max_amount": max_amount,
+            "currency": np.where(missing, None, "USD"),
+            "is_remote": np.array([loc.startswith("Remote") for loc in location]),
+            "job_level": None,
+            "job_function": None,
+            "listing_type": None,
+            "emails": None,
+            "description": description,
+            "company_industry": None,
+            "company_url": None,
+            "company_logo": None,
+            "company_url_direct": None,
+        }
+    )
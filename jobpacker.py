@@ -3,19 +3,48 @@
 JobPacker - Beautiful CLI job harvester for Cleansheet
 """
 
+import argparse
+import cProfile
+import gzip
+import hashlib
+import heapq
+import io
+import itertools
 import json
+import lzma
 import math
+import os
+import pickle
+import random
 import re
+import signal
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import unicodedata
+import urllib.request
 import uuid
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from jobspy import scrape_jobs
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
+from rich.markup import escape
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, IntPrompt, Prompt
+from rich.spinner import Spinner
 from rich.table import Table
 
 # Initialize rich console
@@ -24,6 +53,20 @@ console = Console()
 # Config file path (same directory as script)
 CONFIG_PATH = Path(__file__).parent / "config.json"
 
+# Search result cache directory (same directory as script)
+CACHE_DIR = Path(__file__).parent / "cache"
+
+# Incremental harvest state: last run time per query, and URLs already exported
+HARVEST_STATE_PATH = Path(__file__).parent / "harvest_state.json"
+DESCRIPTION_STORE_DIR = Path(__file__).parent / "descriptions"
+SEEN_INDEX_PATH = Path(__file__).parent / "seen_urls.idx"
+
+# Local store of every harvested job and search run (same directory as script)
+JOB_STORE_PATH = Path(__file__).parent / "jobs.db"
+
+# cProfile dump written by --profile (or the "profile" setting) when no file is named
+PROFILE_PATH = Path(__file__).parent / "jobpacker.prof"
+
 # Default configuration
 DEFAULT_CONFIG = {
     "default_search": "",
@@ -32,6 +75,33 @@ DEFAULT_CONFIG = {
     "remote_only": False,
     "job_type": None,
     "job_boards": ["indeed", "linkedin", "glassdoor", "zip_recruiter", "google"],
+    "board_timeout": 120,
+    "search_timeout": 300,
+    "batch_max_workers": 8,
+    "batch_board_concurrency": 2,
+    "batch_timeout": 3600,
+    "rate_limits": {},
+    "rate_limit_latency_target": 30,
+    "cache_ttl": 3600,
+    "cache_stale_ttl": 86400,
+    "cache_max_mb": 200,
+    "incremental": False,
+    "dedupe": True,
+    "dedupe_threshold": 0.8,
+    "export_compact": False,
+    "export_compression": "",
+    "export_compression_level": 6,
+    "description_store": "off",
+    "job_store": True,
+    "record_dir": "",
+    "replay_dir": "",
+    "replay_speed": "original",
+    "mock_board_url": "",
+    "profile": False,
+    "metrics_file": "",
+    "export_dir": "",
+    "daemon_interval": 3600,
+    "daemon_jitter": 0.1,
 }
 
 # Available job boards with reliability notes
@@ -47,6 +117,951 @@ BOARD_NOTES = {
 # Job type options
 JOB_TYPES = [None, "fulltime", "parttime", "internship", "contract"]
 
+# Maximum boards scraped at once (one worker per board by default)
+MAX_BOARD_WORKERS = len(ALL_JOB_BOARDS)
+
+# How often (seconds) the search loop re-checks board and search deadlines
+DEADLINE_POLL_INTERVAL = 0.5
+
+# Built-in rate limits per board; config["rate_limits"] overrides any of these keys.
+# rate is requests/second refilled into a bucket holding at most burst requests;
+# concurrency is the starting (and learned) number of simultaneous requests.
+DEFAULT_RATE_LIMITS = {
+    "indeed": {"rate": 1.0, "burst": 5, "concurrency": 4, "max_concurrency": 8},
+    "linkedin": {"rate": 0.2, "burst": 2, "concurrency": 1, "max_concurrency": 2},
+    "glassdoor": {"rate": 0.5, "burst": 3, "concurrency": 2, "max_concurrency": 4},
+    "zip_recruiter": {"rate": 0.5, "burst": 3, "concurrency": 2, "max_concurrency": 4},
+    "google": {"rate": 0.5, "burst": 3, "concurrency": 2, "max_concurrency": 4},
+}
+
+# Query-string parameters that only track the visitor and never identify a job
+TRACKING_PARAMS = {
+    "refid",
+    "trackingid",
+    "trk",
+    "from",
+    "src",
+    "source",
+    "ref",
+    "position",
+    "pagenum",
+}
+
+# Extra hours added to incremental fetch windows so postings on the boundary aren't missed
+INCREMENTAL_OVERLAP_HOURS = 1
+
+# MinHash/LSH settings for near-duplicate descriptions: DEDUPE_NUM_PERM hash functions
+# split into DEDUPE_BANDS bands, over shingles of DEDUPE_SHINGLE_WORDS words
+DEDUPE_NUM_PERM = 64
+DEDUPE_BANDS = 16
+DEDUPE_SHINGLE_WORDS = 3
+DEDUPE_MIN_WORDS = 20
+# Words of distinct descriptions shingled and hashed together per numpy batch, and
+# candidate pairs compared per batch, bounding the memory near-duplicate matching uses
+DEDUPE_BATCH_WORDS = 131072
+DEDUPE_BATCH_PAIRS = 4096
+
+# Jobs converted per batch while streaming an export, bounding its memory use
+EXPORT_CHUNK_ROWS = 1000
+
+# Rows written to the job store per executemany() batch
+STORE_BATCH_ROWS = 1000
+
+# Saved searches listed by the Saved Searches menu
+SAVED_RUNS_SHOWN = 20
+
+# Most matches returned by a search of saved jobs
+SAVED_SEARCH_LIMIT = 500
+
+# Newest jobs shown while a search is still running
+LIVE_PREVIEW_ROWS = 10
+
+# Results viewer: jobs per page, sortable fields, and filterable fields with their columns
+RESULTS_PAGE_SIZE = 20
+SORT_FIELDS = ["date", "salary", "company", "source", "title"]
+VIEW_FIELDS = {"title": "title", "company": "company", "location": "location", "source": "site"}
+
+# Fields Cleansheet users may change after import, which an upsert never overwrites
+UPSERT_KEEP_FIELDS = ("status", "tags")
+
+# Namespace for the version 5 UUIDs used as stable job IDs
+JOB_ID_NAMESPACE = uuid.UUID("5f0c3a52-8d0e-5d2c-9a57-4b1f0f3e6a21")
+
+# Compression level used for .gz/.xz exports unless one is given
+EXPORT_COMPRESSION_LEVEL = 6
+
+# How exports use the description store: keep descriptions inline ("off"), replace every
+# description with its hash ("hash"), or inline only descriptions the store hasn't seen
+DESCRIPTION_STORE_MODES = ["off", "hash", "first"]
+
+# Company name suffixes ignored when matching postings across boards
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "corp", "corporation", "co", "company", "plc", "gmbh"}
+
+# Fields counted when picking the richest copy of a duplicated posting
+RICH_FIELDS = ["title", "company", "location", "job_url", "description", "date_posted"]
+RICH_FIELDS += ["min_amount", "max_amount", "job_type", "company_url", "emails"]
+
+# Multiplicative decrease applied to a board's concurrency after an error or slow response
+AIMD_DECREASE = 0.5
+
+
+# Placeholder for a field a row doesn't have (distinct from a None value)
+_MISSING = object()
+
+
+class JobRows(Sequence):
+    """Job rows stored column by column.
+
+    Turning jobspy's DataFrame into one dict per row costs several times the
+    memory and time of its columns, so rows are kept as one list per column and
+    a row dict is only built when a row is indexed or iterated, e.g. for the
+    rows shown in the table or while writing an export. Rows built from dicts
+    keep their own set of keys.
+    """
+
+    def __init__(self, columns: dict | None = None, length: int = 0):
+        self.columns = columns or {}
+        self.length = length
+
+    @classmethod
+    def from_frame(cls, frame) -> "JobRows":
+        """Build rows from a jobspy results DataFrame."""
+        return cls(frame.to_dict("list"), len(frame))
+
+    @classmethod
+    def from_records(cls, records: list) -> "JobRows":
+        """Build rows from a list of row dicts."""
+        names = dict.fromkeys(name for record in records for name in record)
+        columns = {name: [record.get(name, _MISSING) for record in records] for name in names}
+        return cls(columns, len(records))
+
+    @classmethod
+    def coerce(cls, rows) -> "JobRows":
+        """Return rows as JobRows, converting a list of dicts if needed."""
+        return rows if isinstance(rows, JobRows) else cls.from_records(list(rows))
+
+    @classmethod
+    def concat(cls, parts: list) -> "JobRows":
+        """Join several row collections end to end."""
+        parts = [cls.coerce(part) for part in parts]
+        names = dict.fromkeys(name for part in parts for name in part.columns)
+        columns = {name: [] for name in names}
+        for part in parts:
+            for name, values in columns.items():
+                values.extend(part.columns.get(name, [_MISSING] * part.length))
+        return cls(columns, sum(part.length for part in parts))
+
+    def column(self, name: str, default=None) -> list:
+        """Return one column, with `default` for rows that lack the field."""
+        values = self.columns.get(name)
+        if values is None:
+            return [default] * self.length
+        return [default if value is _MISSING else value for value in values]
+
+    def take(self, indices: list) -> "JobRows":
+        """Return the rows at the given positions, in that order."""
+        columns = {name: [values[i] for i in indices] for name, values in self.columns.items()}
+        return JobRows(columns, len(indices))
+
+    def with_column(self, name: str, values: list) -> "JobRows":
+        """Return these rows with a column added or replaced (use _MISSING to leave a row out)."""
+        return JobRows({**self.columns, name: values}, self.length)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(range(self.length)[index])
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("job row index out of range")
+        return {
+            name: values[index]
+            for name, values in self.columns.items()
+            if values[index] is not _MISSING
+        }
+
+    def __iter__(self):
+        names = list(self.columns)
+        for values in zip(*self.columns.values(), strict=True):
+            yield {
+                name: value
+                for name, value in zip(names, values, strict=True)
+                if value is not _MISSING
+            }
+        if not names:
+            yield from ({} for _ in range(self.length))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    def __repr__(self) -> str:
+        return f"JobRows({self.length} rows, {len(self.columns)} columns)"
+
+
+@dataclass
+class BoardResult:
+    """Outcome of scraping a single job board."""
+
+    board: str
+    rows: JobRows = field(default_factory=JobRows)
+    status: str = "ok"  # ok, timeout, error or cancelled
+    error: str = ""
+    error_type: str = ""  # see error_type()
+    elapsed: float = 0.0
+    search_term: str = ""
+    location: str = ""
+    cache: str = ""  # "", "hit" or "stale"
+
+
+def error_type(error: Exception) -> str:
+    """Name the kind of a scrape error, e.g. "http_429" or "ConnectionError"."""
+    status = getattr(error, "code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return f"http_{status}" if isinstance(status, int) else type(error).__name__
+
+
+@dataclass
+class Phase:
+    """Time spent and work done in one phase of a run, summed over its calls."""
+
+    seconds: float = 0.0
+    calls: int = 0
+    rows: int = 0
+    bytes: int = 0
+
+
+class PhaseTimings:
+    """Wall time, rows and bytes handled by each phase of a run.
+
+    Phases are named like "scrape" or "export"; a dotted name such as
+    "scrape.indeed" or "export.convert" is a part of the phase before the dot.
+    Parts can overlap (boards are scraped concurrently), so they need not add
+    up to their phase. Repeated phases, e.g. several searches in one session,
+    are summed.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float, rows: int = 0, size: int = 0) -> None:
+        """Record one call of a phase."""
+        with self._lock:
+            phase = self.phases.setdefault(name, Phase())
+            phase.seconds += seconds
+            phase.calls += 1
+            phase.rows += rows
+            phase.bytes += size
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block as one call of a phase; set rows and bytes on the yielded Phase."""
+        counts = Phase()
+        start = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            self.add(name, time.perf_counter() - start, counts.rows, counts.bytes)
+
+    def timed_iter(self, name: str, iterable):
+        """Yield from iterable, recording the time spent producing its items as one call."""
+        iterator = iter(iterable)
+        seconds = 0.0
+        count = 0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    seconds += time.perf_counter() - start
+                count += 1
+                yield item
+        finally:
+            self.add(name, seconds, count)
+
+    def reset(self) -> None:
+        """Forget every phase recorded so far."""
+        with self._lock:
+            self.phases.clear()
+
+    def summary(self) -> list:
+        """Return one dict per phase, in the order phases started, each followed by its parts."""
+        with self._lock:
+            groups = {}
+            for name in self.phases:
+                groups.setdefault(name.split(".")[0], []).append(name)
+            summary = []
+            for parent, names in groups.items():
+                for name in sorted(names, key=lambda name: name != parent):
+                    phase = asdict(self.phases[name])
+                    phase["seconds"] = round(phase["seconds"], 4)
+                    summary.append({"phase": name, **phase})
+            return summary
+
+
+# Phase timings for this session (see PhaseTimings)
+TIMINGS = PhaseTimings()
+
+
+class BoardRateLimiter:
+    """Token bucket plus an AIMD concurrency window for one job board.
+
+    Each request takes a token from a bucket refilled at `rate` per second and a
+    slot in the concurrency window. Fast successful requests widen the window by
+    roughly one slot per window's worth of requests (additive increase); errors,
+    empty results and responses slower than `latency_target` shrink it by
+    AIMD_DECREASE (multiplicative decrease), never below one.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        concurrency: float,
+        max_concurrency: int,
+        latency_target: float,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.limit = float(min(max(concurrency, 1), max_concurrency))
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.active = 0
+        self._refilled = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Wait for a token and a concurrency slot. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.active < int(self.limit) and self.tokens >= 1:
+                    self.tokens -= 1
+                    self.active += 1
+                    return True
+
+                # Sleep until the next token arrives, or until a slot is released
+                wait_for = None if self.active >= int(self.limit) else (1 - self.tokens) / self.rate
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return False
+                    wait_for = remaining if wait_for is None else min(wait_for, remaining)
+                self._cond.wait(wait_for)
+
+    def release(self, ok: bool, latency: float) -> None:
+        """Free a slot and adapt the concurrency window to the request's outcome."""
+        with self._cond:
+            self.active -= 1
+            if ok and latency <= self.latency_target:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            else:
+                self.limit = max(1.0, self.limit * AIMD_DECREASE)
+            self._cond.notify_all()
+
+
+# jobspy pulls in pandas, numpy and a TLS client stack, which takes longer to import
+# than everything else combined, so it is loaded in the background behind the menu
+_scraper_loader = None
+_scraper_lock = threading.Lock()
+
+
+def _import_scraper() -> None:
+    """Import the scraping stack (run on the background loader thread)."""
+    try:
+        import jobspy  # noqa: F401
+    except ImportError:
+        # Re-raised with its traceback by load_scraper() when a search needs it
+        pass
+
+
+def preload_scraper() -> None:
+    """Start importing jobspy in a background thread, if it hasn't been already."""
+    global _scraper_loader
+    with _scraper_lock:
+        if _scraper_loader is None and "jobspy" not in sys.modules:
+            _scraper_loader = threading.Thread(
+                target=_import_scraper, name="jobspy-import", daemon=True
+            )
+            _scraper_loader.start()
+
+
+def load_scraper():
+    """Return jobspy's scrape_jobs, waiting for the background import if needed."""
+    loader = _scraper_loader
+    if loader is not None and loader.is_alive():
+        loader.join()
+    with _scraper_lock:
+        from jobspy import scrape_jobs as jobspy_scrape_jobs
+
+    return jobspy_scrape_jobs
+
+
+def scrape_jobs(**kwargs):
+    """Call jobspy's scrape_jobs, importing jobspy on first use."""
+    return load_scraper()(**kwargs)
+
+
+def scrape_mock_board(base_url: str, timeout: float, **kwargs):
+    """Scrape the local mock board server (benchmarks/mock_board.py) the way jobspy would.
+
+    Takes scrape_jobs' arguments and pages through the board's results until
+    results_wanted jobs or the last page.
+
+    Returns:
+        jobspy-style results DataFrame
+
+    Raises:
+        OSError: If a page request fails, e.g. HTTP 429 or 5xx, or times out
+    """
+    import pandas as pd
+
+    board = kwargs["site_name"][0]
+    wanted = kwargs["results_wanted"]
+    jobs = []
+    page = 1
+    while page and len(jobs) < wanted:
+        query = urlencode(
+            {
+                "search_term": kwargs["search_term"],
+                "location": kwargs["location"],
+                "page": page,
+                "per_page": wanted,
+            }
+        )
+        url = f"{base_url.rstrip('/')}/{board}/jobs?{query}"
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            body = json.load(response)
+        jobs.extend(body["jobs"])
+        page = body.get("next_page")
+    return pd.DataFrame(jobs[:wanted])
+
+
+# Rate limiters shared by every search in this session, keyed by board
+RATE_LIMITERS = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def rate_limit_settings(board: str, config: dict) -> dict:
+    """Return the effective rate limit settings for a board."""
+    defaults = DEFAULT_RATE_LIMITS.get(board, DEFAULT_RATE_LIMITS["indeed"])
+    return {**defaults, **config["rate_limits"].get(board, {})}
+
+
+def get_rate_limiter(board: str, config: dict) -> BoardRateLimiter:
+    """Return the session's rate limiter for a board, creating it from config."""
+    with _rate_limiters_lock:
+        if board not in RATE_LIMITERS:
+            settings = rate_limit_settings(board, config)
+            RATE_LIMITERS[board] = BoardRateLimiter(
+                rate=settings["rate"],
+                burst=settings["burst"],
+                concurrency=settings["concurrency"],
+                max_concurrency=settings["max_concurrency"],
+                latency_target=config["rate_limit_latency_target"],
+            )
+        return RATE_LIMITERS[board]
+
+
+def save_rate_limit_state(config: dict) -> None:
+    """Store each board's learned concurrency in config.json for the next run.
+
+    Only the saved file's "rate_limits" entry is rewritten, so CLI and grid
+    overrides in the in-memory config never leak into the user's settings.
+    """
+    if not RATE_LIMITERS:
+        return
+
+    try:
+        with open(CONFIG_PATH) as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        saved = {}
+    except (OSError, json.JSONDecodeError) as e:
+        console.print(f"[yellow]Could not save rate limit state: {e}[/]")
+        return
+
+    rate_limits = dict(saved.get("rate_limits", {}))
+    for board, limiter in RATE_LIMITERS.items():
+        rate_limits[board] = {**rate_limits.get(board, {}), "concurrency": round(limiter.limit, 2)}
+    saved["rate_limits"] = rate_limits
+    config["rate_limits"] = {**config["rate_limits"], **rate_limits}
+
+    try:
+        save_config(saved)
+    except OSError as e:
+        console.print(f"[yellow]Could not save rate limit state: {e}[/]")
+
+
+class ResultCache:
+    """On-disk cache of per-board search results with TTL and LRU eviction.
+
+    Each entry is one pickle file holding a board's results DataFrame. Entries
+    younger than `ttl` seconds are fresh; entries younger than `stale_ttl` may
+    be served while a background refresh replaces them (stale-while-revalidate).
+    A hit touches the file's mtime, and once the directory exceeds `max_bytes`
+    the least recently used files are deleted.
+    """
+
+    # Keys with a background refresh in flight, shared by every cache instance
+    _refreshing = set()
+    _lock = threading.Lock()
+
+    def __init__(self, directory: Path, ttl: float, stale_ttl: float, max_bytes: int):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_config(cls, config: dict):
+        """Return the cache described by config, or None if caching is disabled."""
+        if config["cache_ttl"] <= 0:
+            return None
+        return cls(
+            CACHE_DIR,
+            ttl=config["cache_ttl"],
+            stale_ttl=config["cache_stale_ttl"],
+            max_bytes=int(config["cache_max_mb"] * 1024 * 1024),
+        )
+
+    @staticmethod
+    def key(board: str, search_term: str, location: str, config: dict) -> str:
+        """Return the cache key for one board query under the given settings."""
+        parts = [
+            board,
+            search_term.strip().lower(),
+            location.strip().lower(),
+            config["remote_only"],
+            config["job_type"],
+            config["results_per_site"],
+        ]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()[:32]
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str):
+        """Return (results, age in seconds) for a usable entry, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+
+        age = time.time() - entry["created"]
+        if age > self.stale_ttl:
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+        return entry["results"], age
+
+    def put(self, key: str, results) -> None:
+        """Store a board's results and evict old entries if over the size limit."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"created": time.time(), "results": results}, f)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+    def refresh_in_background(self, key: str, fetch) -> None:
+        """Re-fetch an entry on a daemon thread unless a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                results = fetch()
+                if results is not None and len(results) > 0:
+                    self.put(key, results)
+            except Exception:
+                pass  # Keep serving the stale entry; the next search will retry
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name="jobpacker-cache-refresh", daemon=True).start()
+
+
+class ScrapeRecording:
+    """Board responses captured from live searches, for replaying offline.
+
+    A recording is a directory holding calls.ndjson, one line per board query
+    (the query, jobspy's arguments, when it started, how long it took, and its
+    row count or error), plus one pickle per query with the results DataFrame.
+    Replays hand back each query's recorded outcome in recording order, after
+    the recorded delay unless `fast`, so a search can be rerun identically with
+    no network.
+    """
+
+    INDEX = "calls.ndjson"
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._count = None
+        self._calls = None
+        self._played = {}
+
+    @staticmethod
+    def key(board: str, search_term: str, location: str) -> tuple:
+        """Return the replay key for one board query."""
+        return board, search_term.strip().lower(), location.strip().lower()
+
+    def record(
+        self,
+        board: str,
+        search_term: str,
+        location: str,
+        kwargs: dict,
+        started: float,
+        elapsed: float,
+        results=None,
+        error: Exception | None = None,
+    ) -> None:
+        """Append one board query's outcome to the recording.
+
+        Raises:
+            OSError: If the recording cannot be written
+        """
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            index = self.directory / self.INDEX
+            if self._count is None:
+                # Recording into an existing directory adds to it
+                self._count = 0
+                if index.exists():
+                    with open(index) as f:
+                        self._count = sum(1 for _ in f)
+            self._count += 1
+
+            call = {
+                "board": board,
+                "search_term": search_term,
+                "location": location,
+                "kwargs": kwargs,
+                "offset": round(started - self.started, 3),
+                "elapsed": round(elapsed, 3),
+                "rows": 0 if results is None else len(results),
+                "error": None if error is None else f"{type(error).__name__}: {error}",
+                "file": None,
+            }
+            if results is not None:
+                call["file"] = f"{self._count:05d}.pkl"
+                with open(self.directory / call["file"], "wb") as f:
+                    pickle.dump(results, f)
+            with open(index, "a") as f:
+                f.write(json.dumps(call, default=str) + "\n")
+
+    def load(self) -> dict:
+        """Return the recorded calls grouped by replay key, in recording order.
+
+        Raises:
+            OSError: If the directory holds no recording
+        """
+        calls = {}
+        with open(self.directory / self.INDEX) as f:
+            for line in f:
+                call = json.loads(line)
+                key = self.key(call["board"], call["search_term"], call["location"])
+                calls.setdefault(key, []).append(call)
+        return calls
+
+    def replay(self, board: str, search_term: str, location: str, fast: bool = False):
+        """Return a board query's recorded results, or raise its recorded error.
+
+        A query asked more often than it was recorded starts over from its first
+        recorded outcome, so one recording can drive repeated runs.
+
+        Raises:
+            LookupError: If the query was never recorded
+            RuntimeError: If the recorded query failed
+        """
+        key = self.key(board, search_term, location)
+        with self._lock:
+            if self._calls is None:
+                self._calls = self.load()
+            calls = self._calls.get(key)
+            if not calls:
+                raise LookupError(
+                    f"no recorded {board} response for {search_term!r} in {location!r}"
+                )
+            call = calls[self._played.get(key, 0) % len(calls)]
+            self._played[key] = self._played.get(key, 0) + 1
+
+        if not fast:
+            time.sleep(call["elapsed"])
+        if call["error"]:
+            raise RuntimeError(f"recorded {call['error']}")
+        if call["file"] is None:
+            return None
+        with open(self.directory / call["file"], "rb") as f:
+            return pickle.load(f)
+
+
+# Recordings being written or replayed in this session, keyed by directory
+RECORDINGS = {}
+_recordings_lock = threading.Lock()
+
+
+def get_recording(directory) -> ScrapeRecording:
+    """Return the session's recording for a directory, creating it on first use."""
+    path = Path(directory).resolve()
+    with _recordings_lock:
+        if path not in RECORDINGS:
+            RECORDINGS[path] = ScrapeRecording(path)
+        return RECORDINGS[path]
+
+
+def canonicalize_job_url(url: str) -> str:
+    """Return a canonical form of a job URL for matching across runs.
+
+    Lowercases the scheme and host, drops the fragment, trailing slashes and
+    tracking parameters (utm_* and TRACKING_PARAMS), and sorts what remains.
+    """
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+class SeenUrlIndex:
+    """Persistent set of job URLs that have already been exported.
+
+    URLs are stored as 64-bit fingerprints of their canonical form. A Bloom
+    filter in front of the fingerprints answers the common case (a new URL)
+    without building the exact set, which is only materialized the first time
+    the filter reports a possible match.
+    """
+
+    MAGIC = b"JPSEEN1\n"
+    FALSE_POSITIVE_RATE = 0.01
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, capacity: int = 1024):
+        self._fingerprints = array("Q")
+        self._exact = None
+        self._reset_filter(capacity)
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def _reset_filter(self, capacity: int) -> None:
+        """Size the Bloom filter for `capacity` URLs and re-add every fingerprint."""
+        self.capacity = capacity
+        self.num_bits = max(
+            64, int(-capacity * math.log(self.FALSE_POSITIVE_RATE) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        for fingerprint in self._fingerprints:
+            self._set_bits(fingerprint)
+
+    @staticmethod
+    def fingerprint(url: str) -> int:
+        """Return the 64-bit fingerprint of a URL's canonical form."""
+        digest = hashlib.blake2b(canonicalize_job_url(url).encode("utf-8"), digest_size=8)
+        return int.from_bytes(digest.digest(), "little")
+
+    def _positions(self, fingerprint: int):
+        # Double hashing: derive every probe from the fingerprint and a mixed copy of it
+        step = ((fingerprint * 0x9E3779B97F4A7C15) & self._MASK64) | 1
+        return ((fingerprint + i * step) % self.num_bits for i in range(self.num_hashes))
+
+    def _set_bits(self, fingerprint: int) -> None:
+        for pos in self._positions(fingerprint):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def _has_fingerprint(self, fingerprint: int) -> bool:
+        if not all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint)):
+            return False
+        if self._exact is None:
+            self._exact = set(self._fingerprints)
+        return fingerprint in self._exact
+
+    def __contains__(self, url: str) -> bool:
+        return self._has_fingerprint(self.fingerprint(url))
+
+    def add(self, url: str) -> None:
+        """Record a URL as seen."""
+        fingerprint = self.fingerprint(url)
+        if self._has_fingerprint(fingerprint):
+            return
+        self._fingerprints.append(fingerprint)
+        if self._exact is not None:
+            self._exact.add(fingerprint)
+        if len(self._fingerprints) > self.capacity:
+            self._reset_filter(self.capacity * 2)
+        else:
+            self._set_bits(fingerprint)
+
+    @classmethod
+    def load(cls, path: Path) -> "SeenUrlIndex":
+        """Load an index from disk, or return an empty one if missing or unreadable."""
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            return cls()
+
+        header = len(cls.MAGIC) + 16
+        if not data.startswith(cls.MAGIC) or len(data) < header:
+            return cls()
+        capacity, count = struct.unpack_from("<QQ", data, len(cls.MAGIC))
+
+        index = cls(capacity)
+        num_bytes = len(index._bits)
+        if len(data) != header + num_bytes + count * 8:
+            return cls()
+        index._bits[:] = data[header : header + num_bytes]
+        index._fingerprints.frombytes(data[header + num_bytes :])
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write the index to disk atomically."""
+        path = Path(path)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<QQ", self.capacity, len(self._fingerprints)))
+            f.write(self._bits)
+            f.write(self._fingerprints.tobytes())
+        os.replace(tmp_path, path)
+
+
+def harvest_query_key(board: str, search_term: str, location: str, config: dict) -> str:
+    """Return the key under which a query's last run time is recorded."""
+    parts = [board, search_term.strip().lower(), location.strip().lower()]
+    parts += [str(config["remote_only"]), str(config["job_type"] or "")]
+    return "|".join(parts)
+
+
+def load_harvest_state() -> dict:
+    """Load incremental harvest state, or an empty state if none exists."""
+    try:
+        with open(HARVEST_STATE_PATH) as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {"last_run": {}}
+    return state if isinstance(state.get("last_run"), dict) else {"last_run": {}}
+
+
+def incremental_enabled(config: dict) -> bool:
+    """Return whether a run reads and updates the harvest state and seen-URL index.
+
+    Runs against the mock boards or a replayed recording never do, so their
+    synthetic or old jobs can't mark real postings as already harvested.
+    """
+    return (
+        bool(config.get("incremental"))
+        and not config.get("mock_board_url")
+        and not config.get("replay_dir")
+    )
+
+
+def pending_harvest_runs(results: list, started_at: float, config: dict) -> dict:
+    """Return the start time of each successful query, keyed by harvest_query_key.
+
+    The times are only saved (see save_harvest_runs) once the jobs are
+    exported, so a failed or skipped export leaves the next run's window
+    covering them. Empty unless incremental_enabled(config).
+    """
+    if not incremental_enabled(config):
+        return {}
+    return {
+        harvest_query_key(result.board, result.search_term, result.location, config): started_at
+        for result in results
+        if result.status == "ok" and not result.cache
+    }
+
+
+def save_harvest_runs(runs: dict | None) -> None:
+    """Save last-run times from pending_harvest_runs to the harvest state."""
+    if not runs:
+        return
+
+    state = load_harvest_state()
+    state["last_run"].update(runs)
+    try:
+        with open(HARVEST_STATE_PATH, "w") as f:
+            json.dump(state, f, indent=2)
+    except OSError as e:
+        console.print(f"[yellow]Could not save harvest state: {e}[/]")
+
+
+def record_harvest_runs(results: list, started_at: float, config: dict) -> None:
+    """Record the start time of each successful query for incremental harvests."""
+    save_harvest_runs(pending_harvest_runs(results, started_at, config))
+
+
+def incremental_hours_old(board: str, search_term: str, location: str, config: dict):
+    """Return jobspy's hours_old window covering postings since the query last ran.
+
+    Returns None (fetch everything) when incremental mode is off or the query has
+    never run. Indeed can't combine hours_old with remote or job type filters, so
+    those searches also fetch the full window and rely on the seen-URL index.
+    """
+    if not incremental_enabled(config):
+        return None
+    if board == "indeed" and (config["remote_only"] or config["job_type"]):
+        return None
+
+    last_run = load_harvest_state()["last_run"].get(
+        harvest_query_key(board, search_term, location, config)
+    )
+    if last_run is None:
+        return None
+    hours = math.ceil(max(0.0, time.time() - last_run) / 3600)
+    return hours + INCREMENTAL_OVERLAP_HOURS
+
 
 def load_config() -> dict:
     """Load configuration from file or return defaults."""
@@ -91,9 +1106,15 @@ def display_main_menu() -> str:
     console.print("  [2] Settings")
     console.print("  [3] Export Results")
     console.print("  [4] Exit")
+    console.print("  [5] Batch Search (from file)")
+    console.print("  [6] Saved Searches")
+    console.print("  [7] Search Saved Jobs (offline)")
+    console.print("  [8] Browse Results")
     console.print()
 
-    return Prompt.ask("[bold]Select option[/]", choices=["1", "2", "3", "4"], default="1")
+    return Prompt.ask(
+        "[bold]Select option[/]", choices=["1", "2", "3", "4", "5", "6", "7", "8"], default="1"
+    )
 
 
 def display_settings_menu(config: dict) -> dict:
@@ -106,11 +1127,14 @@ def display_settings_menu(config: dict) -> dict:
         console.print(f"  [4] Remote Only: [yellow]{config['remote_only']}[/]")
         console.print(f"  [5] Job Type: [yellow]{config['job_type'] or 'Any'}[/]")
         console.print(f"  [6] Job Boards: [yellow]{', '.join(config['job_boards'])}[/]")
+        console.print(f"  [7] Incremental Harvest: [yellow]{config['incremental']}[/]")
         console.print("  [0] Back to Main Menu")
         console.print()
 
         choice = Prompt.ask(
-            "[bold]Select option[/]", choices=["0", "1", "2", "3", "4", "5", "6"], default="0"
+            "[bold]Select option[/]",
+            choices=["0", "1", "2", "3", "4", "5", "6", "7"],
+            default="0",
         )
 
         if choice == "0":
@@ -136,6 +1160,10 @@ def display_settings_menu(config: dict) -> dict:
             config["job_type"] = job_type if job_type in JOB_TYPES[1:] else None
         elif choice == "6":
             config["job_boards"] = select_job_boards(config["job_boards"])
+        elif choice == "7":
+            config["incremental"] = Confirm.ask(
+                "Only fetch and export jobs new since the last run?", default=config["incremental"]
+            )
 
     return config
 
@@ -164,11 +1192,14 @@ def select_job_boards(current: list) -> list:
         return current
 
 
-def search_jobs(config: dict) -> tuple[list, str]:
+def search_jobs(config: dict, harvest_runs: dict | None = None) -> tuple[JobRows, str]:
     """Search for jobs using current config or custom parameters.
 
+    The successful queries' start times are added to `harvest_runs`, for
+    export_jobs to record once the jobs are exported.
+
     Returns:
-        Tuple of (jobs list, search term used)
+        Tuple of (JobRows of the jobs found, search term used)
     """
     console.print("\n[bold cyan]Job Search[/]")
 
@@ -176,7 +1207,7 @@ def search_jobs(config: dict) -> tuple[list, str]:
     search_term = Prompt.ask("Job title / keywords", default=config["default_search"])
     if not search_term:
         console.print("[red]Search term is required[/]")
-        return [], ""
+        return JobRows(), ""
 
     location = Prompt.ask("Location", default=config["default_location"])
 
@@ -189,41 +1220,41 @@ def search_jobs(config: dict) -> tuple[list, str]:
     if config["job_type"]:
         console.print(f"[dim]Job type: {config['job_type']}[/]")
 
-    # Perform search with progress indicator
-    jobs = []
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-        transient=True,
-    ) as progress:
-        task = progress.add_task("Searching job boards...", total=None)
-
+    # Perform search, showing each board's status and its jobs the moment it finishes
+    parts = []
+    outcomes = {}
+    started_at = time.time()
+    dashboard = SearchDashboard(config["job_boards"])
+    with Live(dashboard, console=console, refresh_per_second=8, transient=True):
         try:
-            results = scrape_jobs(
-                site_name=config["job_boards"],
-                search_term=search_term,
-                location=location,
-                results_wanted=config["results_per_site"],
-                is_remote=config["remote_only"],
-                job_type=config["job_type"],
-                country_indeed="USA",
-            )
+            for result in iter_board_results(config["job_boards"], search_term, location, config):
+                outcomes[result.board] = result
+                parts.append(result.rows)
+                dashboard.add(result)
 
-            progress.update(task, description="Processing results...")
+        except KeyboardInterrupt:
+            # Stop waiting on in-flight boards but keep everything collected so far
+            for board in config["job_boards"]:
+                outcomes.setdefault(board, BoardResult(board, status="cancelled"))
+            collected = sum(len(rows) for rows in parts)
+            console.print(f"\n[yellow]Search cancelled, keeping {collected} jobs collected[/]")
 
-            # Convert DataFrame to list of dicts
-            if results is not None and len(results) > 0:
-                jobs = results.to_dict("records")
-
-        except Exception as e:
-            console.print(f"[red]Search error: {e}[/]")
-            return [], search_term
+    if dashboard.first_result is not None:
+        console.print(
+            f"[dim]First jobs after {dashboard.first_result:.1f}s, "
+            f"all boards after {time.monotonic() - dashboard.started:.1f}s[/]"
+        )
+    display_search_summary(list(outcomes.values()))
+    save_rate_limit_state(config)
+    if harvest_runs is not None:
+        harvest_runs.update(pending_harvest_runs(list(outcomes.values()), started_at, config))
+    jobs = dedupe_search_results(JobRows.concat(parts), config)
+    save_search_run(jobs, "search", search_term, location, config, started_at)
 
     # Display results
     if not jobs:
         console.print("\n[yellow]No jobs found. Try different search terms or location.[/]")
-        return [], search_term
+        return JobRows(), search_term
 
     console.print(f"\n[green]Found {len(jobs)} jobs![/]")
     display_jobs_table(jobs)
@@ -231,140 +1262,3182 @@ def search_jobs(config: dict) -> tuple[list, str]:
     return jobs, search_term
 
 
-def display_jobs_table(jobs: list) -> None:
-    """Display jobs in a formatted table."""
-    table = Table(box=box.ROUNDED, show_lines=True)
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Title", style="bold", max_width=30)
-    table.add_column("Company", max_width=25)
-    table.add_column("Location", max_width=20)
-    table.add_column("Source", style="cyan", width=12)
+def scrape_board(board: str, search_term: str, location: str, config: dict):
+    """Scrape a single job board and return jobspy's results DataFrame.
 
-    for i, job in enumerate(jobs[:50], 1):  # Show max 50 in table
-        title = str(job.get("title", ""))[:30]
-        company = str(job.get("company", ""))[:25]
-        location = str(job.get("location", ""))[:20]
-        source = str(job.get("site", ""))
+    The call waits for the board's rate limiter first, and reports its outcome
+    back so the limiter can adapt. jobspy usually answers a block (e.g. HTTP 429)
+    with an empty result rather than an exception, so empty results count as errors.
 
-        table.add_row(str(i), title, company, location, source)
+    With config["mock_board_url"] set, the local mock board server stands in for
+    every board. With config["replay_dir"] set, no board is contacted (or rate limited):
+    the query's outcome comes from that recording. With config["record_dir"]
+    set, every outcome and its timing are added to that recording.
+    """
+    if config["replay_dir"]:
+        return get_recording(config["replay_dir"]).replay(
+            board, search_term, location, fast=config["replay_speed"] == "fast"
+        )
 
-    console.print(table)
+    limiter = get_rate_limiter(board, config)
+    if not limiter.acquire(timeout=config["board_timeout"]):
+        raise TimeoutError(f"rate limiter wait exceeded {config['board_timeout']}s")
 
-    if len(jobs) > 50:
-        console.print(f"[dim]...and {len(jobs) - 50} more (all will be exported)[/]")
+    kwargs = {
+        "site_name": [board],
+        "search_term": search_term,
+        "location": location,
+        "results_wanted": config["results_per_site"],
+        "is_remote": config["remote_only"],
+        "job_type": config["job_type"],
+        "country_indeed": "USA",
+        "hours_old": incremental_hours_old(board, search_term, location, config),
+    }
+    start = time.monotonic()
+    ok = False
+    results = error = None
+    try:
+        if config["mock_board_url"]:
+            results = scrape_mock_board(config["mock_board_url"], config["board_timeout"], **kwargs)
+        else:
+            results = scrape_jobs(**kwargs)
+        ok = results is not None and len(results) > 0
+        return results
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        elapsed = time.monotonic() - start
+        limiter.release(ok, elapsed)
+        if config["record_dir"]:
+            try:
+                get_recording(config["record_dir"]).record(
+                    board, search_term, location, kwargs, start, elapsed, results, error
+                )
+            except OSError as e:
+                console.print(f"[yellow]Could not record {board} results: {e}[/]")
 
 
-def export_jobs(jobs: list, search_term: str = "") -> None:
-    """Export jobs to Cleansheet-compatible JSON."""
-    if not jobs:
-        console.print("\n[yellow]No jobs to export. Run a search first.[/]")
-        return
+def fetch_board(board: str, search_term: str, location: str, config: dict) -> tuple:
+    """Return (results, cache status) for a board query, using the result cache.
 
-    console.print(f"\n[bold cyan]Export {len(jobs)} Jobs[/]")
+    Fresh entries are returned without touching the board. Stale entries are
+    returned at once while a background refresh updates the cache. Misses are
+    scraped and cached when they return rows. Queries narrowed to an incremental
+    window bypass the cache, so their partial results never answer a full search.
+    """
+    cache = ResultCache.from_config(config)
+    # Recordings must capture, and replays must answer, every query themselves, and
+    # synthetic mock board jobs must never be cached under the real boards' keys
+    if (
+        cache is None
+        or config["record_dir"]
+        or config["replay_dir"]
+        or config["mock_board_url"]
+        or incremental_hours_old(board, search_term, location, config) is not None
+    ):
+        return scrape_board(board, search_term, location, config), ""
 
-    # Build filename with search term and timezone
-    # Sanitize search term for filename (replace spaces/special chars)
-    safe_search = re.sub(r"[^\w\-]", "_", search_term.lower()).strip("_") if search_term else "jobs"
-    safe_search = re.sub(r"_+", "_", safe_search)  # Collapse multiple underscores
+    key = ResultCache.key(board, search_term, location, config)
+    cached = cache.get(key)
+    if cached is not None:
+        results, age = cached
+        if age <= cache.ttl:
+            return results, "hit"
+        cache.refresh_in_background(key, lambda: scrape_board(board, search_term, location, config))
+        return results, "stale"
+
+    results = scrape_board(board, search_term, location, config)
+    if results is not None and len(results) > 0:
+        try:
+            cache.put(key, results)
+        except OSError as e:
+            console.print(f"[yellow]Could not cache {board} results: {e}[/]")
+    return results, ""
+
+
+def iter_board_results(
+    boards: list, search_term: str, location: str, config: dict, max_workers: int = 0
+):
+    """Scrape boards concurrently, yielding a BoardResult as each board finishes.
+
+    Each board runs on its own worker thread, a bounded number at once, so total search
+    time approaches that of the slowest board rather than the sum of all boards.
+    A board that raises is reported with status "error"; one that runs past
+    config["board_timeout"] seconds, or is still running when
+    config["search_timeout"] expires, is abandoned with status "timeout".
+    """
+    queries = [(board, search_term, location) for board in boards]
+    yield from iter_search_results(
+        queries, config, config["search_timeout"], max_workers or MAX_BOARD_WORKERS
+    )
+
+
+def run_in_daemon(fn, *args, name: str = "jobpacker-board") -> Future:
+    """Call fn(*args) on a new daemon thread and return a Future for its result.
+
+    Unlike ThreadPoolExecutor workers, which the interpreter joins at exit, an
+    abandoned daemon thread cannot keep the process alive after a timeout.
+    """
+    future = Future()
+
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name=name, daemon=True).start()
+    return future
+
+
+def iter_search_results(
+    queries: list,
+    config: dict,
+    timeout: float,
+    max_workers: int,
+    board_concurrency: int = 0,
+):
+    """Run (board, search_term, location) queries concurrently, yielding BoardResults.
+
+    At most max_workers queries run at once, and at most board_concurrency
+    (0 for no limit) of those hit the same board. Queries are started in the
+    order given, skipping ahead past boards that are already at their limit.
+    """
+    if not queries:
+        return
+
+    board_timeout = config["board_timeout"]
+    search_deadline = time.monotonic() + timeout
+    search_started = time.perf_counter()
+    started = {}
+    rows = 0
+
+    def run(key, board, search_term, location):
+        started[key] = time.monotonic()
+        return fetch_board(board, search_term, location, config)
+
+    waiting = list(enumerate(queries))
+    in_flight = {}  # board -> number of running queries
+    try:
+        futures = {}
+        pending = set()
+
+        while waiting or pending:
+            # Start as many waiting queries as the global and per-board limits allow
+            for item in list(waiting):
+                if len(pending) >= max_workers:
+                    break
+                key, (board, search_term, location) = item
+                if board_concurrency and in_flight.get(board, 0) >= board_concurrency:
+                    continue
+                waiting.remove(item)
+                in_flight[board] = in_flight.get(board, 0) + 1
+                future = run_in_daemon(run, key, board, search_term, location)
+                futures[future] = item
+                pending.add(future)
+
+            done, pending = wait(
+                pending, timeout=DEADLINE_POLL_INTERVAL, return_when=FIRST_COMPLETED
+            )
+            now = time.monotonic()
+
+            for future in done:
+                key, (board, search_term, location) = futures[future]
+                in_flight[board] -= 1
+                result = BoardResult(
+                    board,
+                    elapsed=now - started.get(key, now),
+                    search_term=search_term,
+                    location=location,
+                )
+                try:
+                    results, result.cache = future.result()
+                except Exception as e:
+                    result.status, result.error = "error", str(e)
+                    result.error_type = error_type(e)
+                else:
+                    if results is not None and len(results) > 0:
+                        with TIMINGS.phase("scrape.to_rows") as phase:
+                            result.rows = JobRows.from_frame(results)
+                            phase.rows = len(result.rows)
+                TIMINGS.add(f"scrape.{board}", result.elapsed, len(result.rows))
+                rows += len(result.rows)
+                yield result
+
+            # Abandon queries that have overrun their own budget or the whole search
+            expired = now >= search_deadline
+            for future in list(pending):
+                key, (board, search_term, location) = futures[future]
+                elapsed = now - started[key] if key in started else 0.0
+                if expired:
+                    error = "search deadline reached"
+                elif elapsed > board_timeout:
+                    error = f"no response after {board_timeout}s"
+                else:
+                    continue
+                future.cancel()
+                pending.discard(future)
+                in_flight[board] -= 1
+                TIMINGS.add(f"scrape.{board}", elapsed)
+                yield BoardResult(
+                    board,
+                    status="timeout",
+                    error=error,
+                    elapsed=elapsed,
+                    search_term=search_term,
+                    location=location,
+                )
+
+            if expired:
+                for _, (board, search_term, location) in waiting:
+                    yield BoardResult(
+                        board,
+                        status="timeout",
+                        error="search deadline reached",
+                        search_term=search_term,
+                        location=location,
+                    )
+                return
+    finally:
+        # Never block on stuck boards; their daemon threads finish (or not) in the background
+        TIMINGS.add("scrape", time.perf_counter() - search_started, rows)
+
+
+def load_search_grid(path) -> dict:
+    """Load a batch search grid from a JSON file.
+
+    The file holds "search_terms" and "locations" lists, plus optional overrides
+    for any config key (e.g. "job_boards", "results_per_site", "remote_only").
+
+    Raises:
+        ValueError: If the grid is missing its terms or locations
+    """
+    with open(path, encoding="utf-8") as f:
+        grid = json.load(f)
+
+    if not isinstance(grid, dict):
+        raise ValueError("Search grid must be a JSON object")
+    for key in ("search_terms", "locations"):
+        values = grid.get(key)
+        if not isinstance(values, list) or not values:
+            raise ValueError(f"Search grid needs a non-empty '{key}' list")
+        if not all(isinstance(value, str) and value.strip() for value in values):
+            raise ValueError(f"Every entry in '{key}' must be a non-empty string")
+
+    unknown = [board for board in grid.get("job_boards", []) if board not in ALL_JOB_BOARDS]
+    if unknown:
+        raise ValueError(f"Unknown job boards: {', '.join(unknown)}")
+
+    return grid
+
+
+def build_search_queries(grid: dict, boards: list) -> list:
+    """Return the (board, search_term, location) cross product for a grid.
+
+    Boards vary fastest so consecutive queries hit different boards.
+    """
+    return [
+        (board, search_term, location)
+        for search_term, location, board in itertools.product(
+            grid["search_terms"], grid["locations"], boards
+        )
+    ]
+
+
+def merge_job_rows(results: list) -> JobRows:
+    """Merge rows from many BoardResults, keeping the first row per job URL."""
+    rows = JobRows.concat([result.rows for result in results])
+    keep = []
+    seen_urls = set()
+    for i, url in enumerate(rows.column("job_url")):
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        keep.append(i)
+    return rows if len(keep) == len(rows) else rows.take(keep)
+
+
+def run_search_grid(grid: dict, config: dict) -> tuple[JobRows, list]:
+    """Run every query in a search grid through the batch scheduler.
+
+    Returns:
+        Tuple of (JobRows of the merged jobs, list of BoardResults)
+    """
+    config = {**config, **{k: v for k, v in grid.items() if k in DEFAULT_CONFIG}}
+    queries = build_search_queries(grid, config["job_boards"])
+
+    results = []
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+    ) as progress:
+        task = progress.add_task("Running batch search...", total=len(queries))
+        try:
+            for result in iter_search_results(
+                queries,
+                config,
+                config["batch_timeout"],
+                config["batch_max_workers"],
+                config["batch_board_concurrency"],
+            ):
+                results.append(result)
+                progress.advance(task)
+        except KeyboardInterrupt:
+            console.print(
+                f"\n[yellow]Batch cancelled after {len(results)} of {len(queries)} queries[/]"
+            )
+
+    return dedupe_search_results(merge_job_rows(results), config), results
+
+
+def batch_search(config: dict, harvest_runs: dict | None = None) -> tuple[JobRows, str]:
+    """Run a batch search grid loaded from a JSON file.
+
+    Successful queries are added to `harvest_runs`, as in search_jobs.
+
+    Returns:
+        Tuple of (JobRows of the merged jobs, label used for the export filename)
+    """
+    console.print("\n[bold cyan]Batch Search[/]")
+
+    path = Prompt.ask("Search grid file (JSON)", default="search_grid.json")
+    try:
+        grid = load_search_grid(path)
+    except (OSError, json.JSONDecodeError, ValueError) as e:
+        console.print(f"[red]Could not load search grid: {e}[/]")
+        return JobRows(), ""
+
+    # Harvest state and the job store see the grid's settings, as the searches did
+    config = {**config, **{k: v for k, v in grid.items() if k in DEFAULT_CONFIG}}
+    console.print(
+        f"\n[dim]{len(grid['search_terms'])} search terms × {len(grid['locations'])} locations "
+        f"× {len(config['job_boards'])} boards[/]"
+    )
+
+    started_at = time.time()
+    jobs, results = run_search_grid(grid, config)
+    save_rate_limit_state(config)
+    if harvest_runs is not None:
+        harvest_runs.update(pending_harvest_runs(results, started_at, config))
+    save_search_run(jobs, "batch", Path(path).stem, "", config, started_at)
+    for result in results:
+        if result.status != "ok":
+            console.print(
+                f"{describe_board_result(result)} [dim]({result.search_term} / {result.location})[/]"
+            )
+
+    if not jobs:
+        console.print("\n[yellow]No jobs found for any query in the grid.[/]")
+        return JobRows(), ""
+
+    console.print(f"\n[green]Found {len(jobs)} unique jobs across {len(results)} queries![/]")
+    display_jobs_table(jobs)
+
+    return jobs, Path(path).stem
+
+
+class SearchDashboard:
+    """Live view of a search: each board's status, and jobs as they arrive.
+
+    Rendered by rich's Live, which re-renders it several times a second, so
+    running boards show a spinner and their elapsed time, and the newest rows
+    appear as soon as the fastest board finishes instead of after the slowest.
+    """
+
+    STATUS = {
+        "ok": "[green]✓ done[/]",
+        "timeout": "[yellow]⏱ timed out[/]",
+        "cancelled": "[yellow]✗ cancelled[/]",
+        "error": "[red]✗ failed[/]",
+    }
+
+    def __init__(self, boards: list):
+        self.boards = list(boards)
+        self.results = {}
+        self.recent = deque(maxlen=LIVE_PREVIEW_ROWS)
+        self.total = 0
+        self.started = time.monotonic()
+        self.first_result = None
+        self.spinner = Spinner("dots", style="cyan")
+
+    def add(self, result: BoardResult) -> None:
+        """Record a finished board and its rows."""
+        self.results[result.board] = result
+        if len(result.rows):
+            if self.first_result is None:
+                self.first_result = time.monotonic() - self.started
+            self.total += len(result.rows)
+            self.recent.extend(result.rows[-LIVE_PREVIEW_ROWS:])
+
+    def __rich__(self):
+        boards = Table(box=box.SIMPLE, show_edge=False, pad_edge=False)
+        boards.add_column("Board", style="bold")
+        boards.add_column("Status")
+        boards.add_column("Jobs", justify="right")
+        boards.add_column("Time", justify="right")
+        for board in self.boards:
+            result = self.results.get(board)
+            if result is None:
+                elapsed = time.monotonic() - self.started
+                boards.add_row(board, self.spinner, "", f"{elapsed:.1f}s")
+            else:
+                status = self.STATUS.get(result.status, self.STATUS["error"])
+                if result.status == "ok" and result.cache:
+                    status = "[green]✓ cached[/]"
+                boards.add_row(board, status, str(len(result.rows)), f"{result.elapsed:.1f}s")
+
+        if not self.total:
+            return boards
+
+        jobs = Table(
+            box=box.ROUNDED,
+            caption=f"{self.total} jobs so far from {len(self.results)} of "
+            f"{len(self.boards)} boards (newest last)",
+        )
+        jobs.add_column("Title", style="bold", max_width=30, no_wrap=True)
+        jobs.add_column("Company", max_width=25, no_wrap=True)
+        jobs.add_column("Location", max_width=20, no_wrap=True)
+        jobs.add_column("Source", style="cyan", no_wrap=True)
+        for job in self.recent:
+            jobs.add_row(
+                escape(str(job.get("title", ""))),
+                escape(str(job.get("company", ""))),
+                escape(str(job.get("location", ""))),
+                str(job.get("site", "")),
+            )
+        return Group(boards, jobs)
+
+
+def describe_board_result(result: BoardResult) -> str:
+    """Return a one-line rich description of a board's outcome."""
+    if result.status == "ok":
+        timing = {"hit": "cached", "stale": "cached, refreshing"}.get(
+            result.cache, f"{result.elapsed:.1f}s"
+        )
+        return f"[green]✓[/] {result.board}: {len(result.rows)} jobs ({timing})"
+    if result.status == "timeout":
+        return f"[yellow]⏱[/] {result.board}: timed out ({result.error})"
+    if result.status == "cancelled":
+        return f"[yellow]✗[/] {result.board}: cancelled"
+    return f"[red]✗[/] {result.board}: failed ({result.error})"
+
+
+def display_search_summary(results: list) -> None:
+    """Report boards that timed out, failed or were cancelled."""
+    for result in results:
+        if result.status != "ok":
+            console.print(describe_board_result(result))
+
+
+def is_present(value) -> bool:
+    """Return True if a scraped field holds a real value (not None, NaN or blank)."""
+    if value is None:
+        return False
+    if isinstance(value, float):
+        return not math.isnan(value)
+    if isinstance(value, str):
+        return bool(value.strip())
+    return True
+
+
+def normalize_words(value) -> list:
+    """Return a value's lowercased words, without punctuation."""
+    if not is_present(value):
+        return []
+    return re.findall(r"\w+", str(value).lower())
+
+
+def normalize_text(value) -> str:
+    """Lowercase, strip punctuation and collapse whitespace for matching."""
+    return " ".join(normalize_words(value))
+
+
+def normalize_company(value) -> str:
+    """Normalize a company name, ignoring suffixes like Inc or LLC."""
+    words = normalize_text(value).split()
+    while words and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+def exact_job_keys(job: dict) -> list:
+    """Return the exact-match keys for a job: canonical URL and company/title/location."""
+    return posting_keys(
+        job.get("job_url"), job.get("company"), job.get("title"), job.get("location")
+    )
+
+
+def posting_keys(url, company, title, location) -> list:
+    """Return the exact-match keys for one posting's URL, company, title and location."""
+    keys = []
+    if isinstance(url, str) and url.strip():
+        keys.append(("url", canonicalize_job_url(url)))
+
+    company = normalize_company(company)
+    title = normalize_text(title)
+    location = normalize_text(location)
+    if company and title and location:
+        keys.append(("posting", company, title, location))
+    return keys
+
+
+@lru_cache(maxsize=1)
+def minhash_params() -> tuple:
+    """Return the fixed (a, b) coefficients of the MinHash hash family.
+
+    Shingle hash h maps to (a*h + b) mod 2**64 for an odd 64-bit a, a
+    multiply-add-shift universal hash whose high bits decide the minimum.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(0x10B9AC)
+    a = rng.integers(0, 1 << 64, DEDUPE_NUM_PERM, dtype=np.uint64, endpoint=False) | np.uint64(1)
+    b = rng.integers(0, 1 << 64, DEDUPE_NUM_PERM, dtype=np.uint64, endpoint=False)
+    return a, b
+
+
+@lru_cache(maxsize=65536)
+def word_hash(word: str) -> int:
+    """Return a 64-bit hash of a word that is the same in every process.
+
+    The built-in hash() is salted per process (PYTHONHASHSEED), which would
+    make near-duplicate matching differ from run to run.
+    """
+    return int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def minhash_signatures(descriptions) -> tuple:
+    """Return MinHash signatures for every description long enough to sign.
+
+    Identical descriptions are signed once. The rest are shingled, hashed and
+    minimized about DEDUPE_BATCH_WORDS words at a time with whole-batch numpy
+    operations.
+
+    Returns:
+        Tuple of (row indices, uint64 array with one signature row per index)
+    """
+    import numpy as np
+
+    slots = {}  # description -> its position in `texts`
+    texts = []
+    text_rows = []  # (row index, slot) per row with a description
+    for i, description in enumerate(descriptions):
+        if is_present(description):
+            slot = slots.setdefault(description, len(texts))
+            if slot == len(texts):
+                texts.append(description)
+            text_rows.append((i, slot))
+
+    signed = np.full(len(texts), -1, dtype=np.int64)  # slot -> row in `signatures`
+    parts = [np.empty((0, DEDUPE_NUM_PERM), dtype=np.uint64)]
+    count = 0
+    for batch_slots, batch in _word_batches(texts):
+        signed[batch_slots] = np.arange(count, count + len(batch))
+        count += len(batch)
+        parts.append(_minhash_batch(batch))
+
+    rows = [(i, signed[slot]) for i, slot in text_rows if signed[slot] >= 0]
+    positions = np.array([position for _, position in rows], dtype=np.int64)
+    return [i for i, _ in rows], np.concatenate(parts)[positions]
+
+
+def _word_batches(texts: list):
+    """Yield (positions, word lists) for the texts with at least DEDUPE_MIN_WORDS words."""
+    positions, batch, words_in_batch = [], [], 0
+    for position, text in enumerate(texts):
+        words = normalize_words(text)
+        if len(words) < DEDUPE_MIN_WORDS:
+            continue
+        positions.append(position)
+        batch.append(words)
+        words_in_batch += len(words)
+        if words_in_batch >= DEDUPE_BATCH_WORDS:
+            yield positions, batch
+            positions, batch, words_in_batch = [], [], 0
+    if batch:
+        yield positions, batch
+
+
+def _minhash_batch(documents: list):
+    """Return the MinHash signatures of word lists with at least DEDUPE_MIN_WORDS words."""
+    import numpy as np
+    import pandas as pd
+
+    # Hash each distinct word once, then roll k consecutive word hashes into one
+    # shingle hash (uint64 arithmetic wraps, and the high 32 bits are the best mixed)
+    codes, vocabulary = pd.factorize(np.fromiter(itertools.chain.from_iterable(documents), object))
+    word_hashes = np.fromiter(map(word_hash, vocabulary), dtype=np.uint64, count=len(vocabulary))
+    word_hashes = word_hashes[codes]
+
+    k = DEDUPE_SHINGLE_WORDS
+    count = len(word_hashes) - k + 1
+    hashes = word_hashes[:count].copy()
+    for offset in range(1, k):
+        hashes = hashes * np.uint64(0x100000001B3) + word_hashes[offset : offset + count]
+    hashes >>= np.uint64(32)
+
+    # Drop the shingles that straddle two documents
+    lengths = np.fromiter(map(len, documents), dtype=np.int64, count=len(documents))
+    shingles = lengths - k + 1
+    starts = np.cumsum(lengths) - lengths
+    segments = np.cumsum(shingles) - shingles
+    hashes = hashes[np.arange(shingles.sum()) + np.repeat(starts - segments, shingles)]
+
+    # One hash function at a time over every shingle in the batch, reusing one buffer
+    # (uint64 arithmetic wraps, which is the mod 2**64 of the hash family)
+    a, b = minhash_params()
+    values = np.empty_like(hashes)
+    signatures = np.empty((len(documents), DEDUPE_NUM_PERM), dtype=np.uint64)
+    for j in range(DEDUPE_NUM_PERM):
+        np.multiply(hashes, a[j], out=values)
+        values += b[j]
+        signatures[:, j] = np.minimum.reduceat(values, segments)
+    return signatures
+
+
+def job_richness(job: dict) -> tuple:
+    """Rank copies of a posting: more filled-in fields first, then longer description."""
+    filled = sum(1 for name in RICH_FIELDS if is_present(job.get(name)))
+    description = job.get("description")
+    return filled, len(description) if is_present(description) else 0
+
+
+def dedupe_jobs(jobs, threshold: float = 0.8) -> JobRows:
+    """Collapse copies of the same posting returned by different boards or queries.
+
+    Jobs are grouped when they share a canonical job URL or a normalized
+    (company, title, location), or when MinHash/LSH finds descriptions with
+    estimated Jaccard similarity of at least `threshold` at the same company.
+    Each group keeps its richest copy, with the other copies' boards and URLs
+    recorded under "other_sources" and "other_urls". Runs in roughly linear time.
+    """
+    import numpy as np
+
+    jobs = JobRows.coerce(jobs)
+    urls = jobs.column("job_url")
+    companies = [normalize_company(company) for company in jobs.column("company")]
+    parent = list(range(len(jobs)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    first_with_key = {}
+    postings = zip(
+        urls, jobs.column("company"), jobs.column("title"), jobs.column("location"), strict=True
+    )
+    for i, posting in enumerate(postings):
+        for key in posting_keys(*posting):
+            if key in first_with_key:
+                union(first_with_key[key], i)
+            else:
+                first_with_key[key] = i
+
+    # Near duplicates: compare each job only with the first job in each shared LSH
+    # bucket, so even a bucket full of boilerplate text costs linear time
+    rows, signatures = minhash_signatures(jobs.column("description"))
+    rows_per_band = DEDUPE_NUM_PERM // DEDUPE_BANDS
+    bucket_key = np.dtype((np.void, rows_per_band * signatures.itemsize))
+    firsts, others = [], []
+    for band in range(DEDUPE_BANDS):
+        chunk = signatures[:, band * rows_per_band : (band + 1) * rows_per_band]
+        keys = np.ascontiguousarray(chunk).view(bucket_key).ravel()
+        _, first, bucket = np.unique(keys, return_index=True, return_inverse=True)
+        first = first[bucket]
+        other = np.flatnonzero(first != np.arange(len(rows)))
+        firsts.append(first[other])
+        others.append(other)
+
+    # Each candidate pair once, skipping pairs at two different (known) companies
+    pairs = np.unique(np.concatenate(firsts) * len(rows) + np.concatenate(others))
+    first, other = np.divmod(pairs, max(len(rows), 1))
+    codes = {}
+    company_codes = np.array(
+        [codes.setdefault(companies[i], len(codes)) if companies[i] else -1 for i in rows],
+        dtype=np.int64,
+    )
+    first_company, other_company = company_codes[first], company_codes[other]
+    same = (first_company < 0) | (other_company < 0) | (first_company == other_company)
+    first, other = first[same], other[same]
+
+    for start in range(0, len(first), DEDUPE_BATCH_PAIRS):
+        a, b = first[start : start + DEDUPE_BATCH_PAIRS], other[start : start + DEDUPE_BATCH_PAIRS]
+        similar = (signatures[a] == signatures[b]).mean(axis=1) >= threshold
+        for i, j in zip(a[similar].tolist(), b[similar].tolist(), strict=True):
+            union(rows[i], rows[j])
+
+    groups = {}
+    for i in range(len(jobs)):
+        groups.setdefault(find(i), []).append(i)
+    if len(groups) == len(jobs):
+        return jobs
+
+    # Only merged groups need their rows built to pick the richest copy
+    sites = jobs.column("site")
+    keep = []
+    other_sources = []
+    other_urls = []
+    for members in groups.values():
+        if len(members) == 1:
+            keep.append(members[0])
+            other_sources.append(_MISSING)
+            other_urls.append(_MISSING)
+            continue
+
+        best = max(members, key=lambda i: job_richness(jobs[i]))
+        others = [i for i in members if i != best]
+        keep.append(best)
+        other_sources.append(
+            sorted({str(sites[i] or "") for i in others} - {str(sites[best] or ""), ""})
+        )
+        other_urls.append(
+            [urls[i] for i in others if is_present(urls[i]) and urls[i] != urls[best]]
+        )
+
+    deduped = jobs.take(keep)
+    return deduped.with_column("other_sources", other_sources).with_column("other_urls", other_urls)
+
+
+def dedupe_search_results(jobs, config: dict):
+    """Apply the duplicate detection stage to a search's results if enabled."""
+    if not config["dedupe"] or len(jobs) < 2:
+        return jobs
+
+    with TIMINGS.phase("dedupe") as phase:
+        deduped = dedupe_jobs(jobs, config["dedupe_threshold"])
+        phase.rows = len(jobs)
+    if len(deduped) < len(jobs):
+        console.print(f"[dim]Merged {len(jobs) - len(deduped)} duplicate postings[/]")
+    return deduped
+
+
+def display_jobs_table(jobs: list) -> None:
+    """Display the first page of jobs in a formatted table."""
+    with TIMINGS.phase("display") as phase:
+        view = JobsView(jobs, page_size=50)
+        console.print(view.render(lines=True))
+        phase.rows = min(len(jobs), 50)
+
+    if len(jobs) > 50:
+        console.print(
+            f"[dim]...and {len(jobs) - 50} more (all will be exported; "
+            "see them with Browse Results)[/]"
+        )
+
+
+class JobsView:
+    """A sorted, filtered and paged view of job rows.
+
+    Only the visible page is ever turned into row dicts and table rows. Sort
+    keys and sorted orders are computed once per field and cached, as are the
+    lowercased columns filters search, so paging, re-sorting and filtering a
+    large session only moves lists of row positions around.
+    """
+
+    def __init__(self, jobs, page_size: int = RESULTS_PAGE_SIZE):
+        self.jobs = JobRows.coerce(jobs)
+        self.page_size = page_size
+        self.sort_field = None
+        self.descending = False
+        self.filters = {}
+        self.page = 0
+        self.positions = range(len(self.jobs))
+        self._keys = {}
+        self._orders = {}
+        self._folded = {}
+
+    def sort_keys(self, field: str) -> list:
+        """Return each row's sort key for a field, None where the row has no value."""
+        if field not in self._keys:
+            if field == "date":
+                dates = [d if is_present(d) else None for d in self.jobs.column("date_posted")]
+                keys = [key or None for key in date_column(dates, "")]
+            elif field == "salary":
+                # Rank ranges by their top end, or their only end
+                lows = self.jobs.column("min_amount")
+                highs = self.jobs.column("max_amount")
+                keys = [
+                    (
+                        float(high)
+                        if is_valid_number(high)
+                        else float(low) if is_valid_number(low) else None
+                    )
+                    for low, high in zip(lows, highs, strict=True)
+                ]
+            else:
+                keys = [value or None for value in self.folded(field)]
+            self._keys[field] = keys
+        return self._keys[field]
+
+    def folded(self, field: str) -> list:
+        """Return a column as lowercase text for filtering and sorting."""
+        if field not in self._folded:
+            values = self.jobs.column(VIEW_FIELDS[field])
+            self._folded[field] = [
+                str(value).casefold() if is_present(value) else "" for value in values
+            ]
+        return self._folded[field]
+
+    def order(self, field: str, descending: bool) -> list:
+        """Return row positions sorted on a field, rows without a value last."""
+        if (field, descending) not in self._orders:
+            keys = self.sort_keys(field)
+            present = [i for i, key in enumerate(keys) if key is not None]
+            missing = [i for i, key in enumerate(keys) if key is None]
+            ordered = sorted(present, key=keys.__getitem__, reverse=descending)
+            self._orders[field, descending] = ordered + missing
+        return self._orders[field, descending]
+
+    def sort(self, field: str) -> None:
+        """Sort on a field; sorting on it again reverses the order.
+
+        Dates and salaries start newest/highest first, text A to Z.
+        """
+        if field == self.sort_field:
+            self.descending = not self.descending
+        else:
+            self.sort_field = field
+            self.descending = field in ("date", "salary")
+        self.refresh()
+
+    def filter(self, field: str, text: str) -> None:
+        """Keep only rows whose field contains `text` (ignoring case); empty text clears it."""
+        if text.strip():
+            self.filters[field] = text.strip().casefold()
+        else:
+            self.filters.pop(field, None)
+        self.refresh()
+
+    def clear_filters(self) -> None:
+        """Drop every filter."""
+        self.filters.clear()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Recompute the visible row positions and go back to the first page."""
+        if self.sort_field:
+            positions = self.order(self.sort_field, self.descending)
+        else:
+            positions = range(len(self.jobs))
+        for name, needle in self.filters.items():
+            folded = self.folded(name)
+            positions = [i for i in positions if needle in folded[i]]
+        self.positions = positions
+        self.page = 0
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages, at least one."""
+        return max(1, math.ceil(len(self.positions) / self.page_size))
+
+    def go(self, page: int) -> None:
+        """Show a page (0-based), clamped to the pages there are."""
+        self.page = min(max(page, 0), self.page_count - 1)
+
+    def render(self, lines: bool = False) -> Table:
+        """Build the table for the visible page only."""
+        start = self.page * self.page_size
+        visible = self.positions[start : start + self.page_size]
+
+        sort = ""
+        if self.sort_field:
+            sort = f" · by {self.sort_field} {'↓' if self.descending else '↑'}"
+        filters = "".join(f" · {name}~{escape(text)}" for name, text in self.filters.items())
+        table = Table(
+            box=box.ROUNDED,
+            show_lines=lines,
+            caption=f"Page {self.page + 1}/{self.page_count} · {len(self.positions)} jobs"
+            f"{sort}{filters}",
+        )
+        table.add_column("#", style="dim", justify="right")
+        table.add_column("Title", style="bold", max_width=30)
+        table.add_column("Company", max_width=25)
+        table.add_column("Location", max_width=20)
+        table.add_column("Salary", no_wrap=True)
+        table.add_column("Posted", no_wrap=True)
+        table.add_column("Source", style="cyan", no_wrap=True)
+
+        for number, i in enumerate(visible, start + 1):
+            job = self.jobs[i]
+            source = str(job.get("site", ""))
+            if job.get("other_sources"):
+                source += f" +{len(job['other_sources'])}"
+            table.add_row(
+                str(number),
+                escape(str(job.get("title", ""))[:30]),
+                escape(str(job.get("company", ""))[:25]),
+                escape(str(job.get("location", ""))[:20]),
+                cleansheet_salary(job.get("min_amount"), job.get("max_amount")),
+                self.sort_keys("date")[i] or "",
+                source,
+            )
+        return table
+
+
+def apply_browse_command(view: JobsView, command: str) -> bool:
+    """Apply one results viewer command to a view.
+
+    Returns:
+        False when the command is to leave the viewer, True otherwise
+    """
+    words = command.strip().split(maxsplit=2)
+    action = words[0].lower() if words else "n"
+
+    if action == "q":
+        return False
+    if action == "n":
+        view.go(view.page + 1)
+    elif action == "p":
+        view.go(view.page - 1)
+    elif action.isdigit() or (action == "g" and len(words) > 1 and words[1].isdigit()):
+        view.go(int(words[-1] if action == "g" else action) - 1)
+    elif action == "s" and len(words) > 1 and words[1].lower() in SORT_FIELDS:
+        view.sort(words[1].lower())
+    elif action == "f" and len(words) == 1:
+        view.clear_filters()
+    elif action == "f" and words[1].lower() in VIEW_FIELDS:
+        view.filter(words[1].lower(), words[2] if len(words) > 2 else "")
+    else:
+        console.print(f"[red]Unknown command: {escape(command)}[/]")
+    return True
+
+
+def browse_jobs(jobs) -> None:
+    """Page through jobs, sorting and filtering them, until the user quits."""
+    if not jobs:
+        console.print("\n[yellow]No jobs to browse. Run a search first.[/]")
+        return
+
+    view = JobsView(jobs)
+    while True:
+        console.print(view.render())
+        console.print(
+            f"[dim]n/p: next/previous page · g N: go to page · s FIELD: sort by "
+            f"{', '.join(SORT_FIELDS)} (again to reverse) · f FIELD TEXT: filter "
+            f"{', '.join(VIEW_FIELDS)} (f alone clears) · q: back[/]"
+        )
+        last_page = view.page == view.page_count - 1
+        if not apply_browse_command(view, Prompt.ask("Browse", default="q" if last_page else "n")):
+            break
+
+
+def default_export_filename(search_term: str, extension: str = ".json") -> str:
+    """Build an export filename from the search term and local time with timezone."""
+    # Sanitize search term for filename (replace spaces/special chars)
+    safe_search = re.sub(r"[^\w\-]", "_", search_term.lower()).strip("_") if search_term else "jobs"
+    safe_search = re.sub(r"_+", "_", safe_search)  # Collapse multiple underscores
+
+    # Get local timezone offset (e.g., -0500, +0100)
+    now = datetime.now().astimezone()
+    tz_offset = now.strftime("%z")  # Returns like -0500 or +0100
+
+    return f"{safe_search}_{now.strftime('%Y%m%d_%H%M%S')}{tz_offset}{extension}"
+
+
+def is_valid_number(val) -> bool:
+    """Check if value is a valid number (not None, not NaN)."""
+    if val is None:
+        return False
+    try:
+        return not math.isnan(float(val))
+    except (ValueError, TypeError):
+        return False
+
+
+def cleansheet_salary(min_sal, max_sal) -> str:
+    """Format a salary range from jobspy's min/max amounts."""
+    try:
+        if is_valid_number(min_sal) and is_valid_number(max_sal):
+            return f"${int(min_sal):,} - ${int(max_sal):,}"
+        elif is_valid_number(min_sal):
+            return f"${int(min_sal):,}+"
+        elif is_valid_number(max_sal):
+            return f"Up to ${int(max_sal):,}"
+    except (ValueError, TypeError):
+        pass
+    return ""
+
+
+def cleansheet_date(date_posted, today: str) -> str:
+    """Format a posting date as YYYY-MM-DD, falling back to today's date."""
+    if not date_posted:
+        return today
+    if hasattr(date_posted, "strftime"):
+        return date_posted.strftime("%Y-%m-%d")
+    return str(date_posted)[:10]
+
+
+def to_cleansheet_job(job: dict) -> dict:
+    """Convert one jobspy row to a Cleansheet job."""
+    return {
+        "id": stable_job_id(
+            job.get("job_url"),
+            job.get("company"),
+            job.get("title"),
+            job.get("location"),
+            job.get("description"),
+        ),
+        "company": str(job.get("company", "")),
+        "title": str(job.get("title", "")),
+        "location": str(job.get("location", "")),
+        "url": str(job.get("job_url", "")),
+        "description": str(job.get("description", "")),
+        "salary": cleansheet_salary(job.get("min_amount"), job.get("max_amount")),
+        "datePosted": cleansheet_date(job.get("date_posted"), datetime.now().strftime("%Y-%m-%d")),
+        "source": str(job.get("site", "")),
+        "status": "Saved",
+        "tags": [],
+    }
+
+
+def salary_column(min_amounts: list, max_amounts: list) -> list:
+    """Format salary ranges for whole columns, exactly as cleansheet_salary would."""
+    import numpy as np
+
+    amounts = itertools.chain(min_amounts, max_amounts)
+    if not all(value is None or type(value) in (int, float) for value in amounts):
+        # Strings, Decimals etc. keep the per-row parsing rules
+        return list(map(cleansheet_salary, min_amounts, max_amounts))
+
+    lows = np.array(min_amounts, dtype=float)
+    highs = np.array(max_amounts, dtype=float)
+    # Amounts int64 can't hold keep the per-row rules (and their errors)
+    if (np.abs(np.nan_to_num(lows)) >= 2**63).any() or (
+        np.abs(np.nan_to_num(highs)) >= 2**63
+    ).any():
+        return list(map(cleansheet_salary, min_amounts, max_amounts))
+
+    has_low = ~np.isnan(lows)
+    has_high = ~np.isnan(highs)
+
+    def dollars(values, present):
+        # int() truncates toward zero, as does the int64 cast; salaries repeat a lot,
+        # so each distinct amount is formatted once
+        whole = np.where(present, values, 0).astype(np.int64)
+        distinct, positions = np.unique(whole, return_inverse=True)
+        labels = np.array([f"${amount:,}" for amount in distinct.tolist()], dtype=object)
+        return labels[positions]
+
+    low_text = dollars(lows, has_low)
+    high_text = dollars(highs, has_high)
+    salaries = np.where(
+        has_low & has_high,
+        low_text + " - " + high_text,
+        np.where(has_low, low_text + "+", np.where(has_high, "Up to " + high_text, "")),
+    )
+    return salaries.tolist()
+
+
+def date_column(dates: list, today: str) -> list:
+    """Format a whole column of posting dates, formatting each distinct date once."""
+    try:
+        formatted = {date: cleansheet_date(date, today) for date in dict.fromkeys(dates)}
+    except TypeError:  # unhashable values
+        return [cleansheet_date(date, today) for date in dates]
+    return [formatted[date] for date in dates]
+
+
+def to_cleansheet_jobs(jobs) -> list:
+    """Convert jobs to Cleansheet jobs a column at a time.
+
+    Produces the same jobs as calling to_cleansheet_job on every row, but
+    formats salaries with array operations, formats each distinct date once
+    and never builds the jobspy row dicts. IDs come from stable_job_id.
+    """
+    jobs = JobRows.coerce(jobs)
+    today = datetime.now().strftime("%Y-%m-%d")
+
+    def text(name):
+        return list(map(str, jobs.column(name, "")))
+
+    ids = list(
+        map(
+            stable_job_id,
+            jobs.column("job_url"),
+            jobs.column("company"),
+            jobs.column("title"),
+            jobs.column("location"),
+            jobs.column("description"),
+        )
+    )
+    columns = zip(
+        ids,
+        text("company"),
+        text("title"),
+        text("location"),
+        text("job_url"),
+        text("description"),
+        salary_column(jobs.column("min_amount"), jobs.column("max_amount")),
+        date_column(jobs.column("date_posted"), today),
+        text("site"),
+        strict=True,
+    )
+    return [
+        {
+            "id": job_id,
+            "company": company,
+            "title": title,
+            "location": location,
+            "url": url,
+            "description": description,
+            "salary": salary,
+            "datePosted": date_posted,
+            "source": source,
+            "status": "Saved",
+            "tags": [],
+        }
+        for job_id, company, title, location, url, description, salary, date_posted, source in columns
+    ]
+
+
+def stable_job_id(url, company, title, location, description) -> str:
+    """Return a job ID derived from the posting, so re-exports give it the same ID.
+
+    The ID is a version 5 UUID of the canonical job URL, or failing that of the
+    normalized company/title/location, or of the description. A job with none
+    of these gets a random UUID.
+    """
+    if isinstance(url, str) and url.strip():
+        name = "url:" + canonicalize_job_url(url)
+    elif is_present(company) or is_present(title) or is_present(location):
+        posting = (normalize_company(company), normalize_text(title), normalize_text(location))
+        name = "posting:" + "|".join(posting)
+    elif is_present(description):
+        name = "description:" + normalize_text(description)
+    else:
+        return str(uuid.uuid4())
+    return str(uuid.uuid5(JOB_ID_NAMESPACE, name))
+
+
+class DescriptionStore:
+    """Content-addressed store holding each distinct job description once.
+
+    Descriptions are normalized (Unicode NFC, LF line endings, no trailing
+    whitespace) and saved as UTF-8 text files named by the BLAKE2b hash of the
+    normalized text, sharded by the first two hex digits. Exports can then
+    carry the hash instead of the text, and rehydrate_export() puts it back.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._known = set()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize description text so trivially different copies share a hash."""
+        text = unicodedata.normalize("NFC", text).replace("\r\n", "\n").replace("\r", "\n")
+        return "\n".join(line.rstrip() for line in text.split("\n")).strip()
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Return the hash of already-normalized text."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.txt"
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._known or self._path(key).exists()
+
+    def put(self, text: str) -> tuple[str, bool]:
+        """Store a description.
+
+        Returns:
+            Tuple of (hash, whether the store had not seen it before)
+        """
+        text = self.normalize(text)
+        key = self.key(text)
+        if key in self:
+            self._known.add(key)
+            return key, False
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+        self._known.add(key)
+        return key, True
+
+    def get(self, key: str) -> str | None:
+        """Return the description stored under a hash, or None if it is missing."""
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except (OSError, ValueError):
+            return None
+
+
+def externalize_descriptions(cleansheet_jobs, mode: str, store: DescriptionStore | None = None):
+    """Move Cleansheet jobs' descriptions into the description store as they stream past.
+
+    Each job with a description gains a "descriptionHash". In "hash" mode its
+    description is emptied; in "first" mode it is only kept the first time the
+    store sees that text. "off" passes jobs through untouched.
+
+    Raises:
+        OSError: If the store cannot be written
+    """
+    if mode == "off":
+        yield from cleansheet_jobs
+        return
+
+    store = store or DescriptionStore(DESCRIPTION_STORE_DIR)
+    for job in cleansheet_jobs:
+        if job.get("description"):
+            key, new = store.put(job["description"])
+            job["descriptionHash"] = key
+            if mode == "hash" or not new:
+                job["description"] = ""
+        yield job
+
+
+def read_export(filename: str):
+    """Yield the Cleansheet jobs in an export file (JSON or NDJSON, optionally .gz/.xz).
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not a valid export
+    """
+    compression = export_compression(filename)
+    if compression == "gz":
+        f = gzip.open(filename, "rt", encoding="utf-8")
+    elif compression == "xz":
+        f = lzma.open(filename, "rt", encoding="utf-8")
+    else:
+        f = open(filename, encoding="utf-8")
+
+    with f:
+        name = filename[: -len(compression) - 1] if compression else filename
+        if name.lower().endswith(".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)["jobs"]
+
+
+def rehydrate_jobs(cleansheet_jobs, store: DescriptionStore, missing: list | None = None):
+    """Put stored descriptions back into jobs that carry only a descriptionHash.
+
+    Hashes not found in the store are appended to `missing` (if given) and
+    leave the description empty.
+    """
+    for job in cleansheet_jobs:
+        key = job.pop("descriptionHash", None)
+        if key and not job.get("description"):
+            text = store.get(key)
+            if text is None:
+                if missing is not None:
+                    missing.append(key)
+            else:
+                job["description"] = text
+        yield job
+
+
+def rehydrate_export(
+    source: str,
+    destination: str,
+    export_format: str = "json",
+    compact: bool = False,
+    compression: str | None = None,
+    level: int | None = None,
+) -> tuple["ExportStats", list]:
+    """Rebuild a full Cleansheet export from one written with the description store.
+
+    Returns:
+        Tuple of (ExportStats for the new file, list of hashes missing from the store)
+
+    Raises:
+        OSError: If either file cannot be read or written
+        json.JSONDecodeError: If the source is not a valid export
+    """
+    store = DescriptionStore(DESCRIPTION_STORE_DIR)
+    missing = []
+    stats = write_export(
+        rehydrate_jobs(read_export(source), store, missing),
+        destination,
+        export_format,
+        compact=compact,
+        compression=compression,
+        level=level,
+    )
+    return stats, missing
+
+
+class ExportWriter:
+    """Writes a Cleansheet export to an open text file one job at a time.
+
+    "json" writes the Cleansheet import document, indented like json.dump with
+    indent=2 unless `compact` is set; "ndjson" writes one job per line and
+    flushes after each, so a reader on the other end of a pipe sees jobs as
+    they are written. Only the current job is held in memory. `raw_bytes`
+    counts the UTF-8 bytes written, before any compression.
+    """
+
+    def __init__(self, f, export_format: str = "json", compact: bool = False):
+        self.f = f
+        self.export_format = export_format
+        self.compact = compact
+        self.count = 0
+        self.raw_bytes = 0
+
+    def _emit(self, text: str) -> None:
+        self.f.write(text)
+        self.raw_bytes += len(text.encode("utf-8"))
+
+    def write(self, job: dict) -> None:
+        """Write one Cleansheet job."""
+        if self.export_format == "ndjson":
+            self._emit(json.dumps(job, ensure_ascii=False) + "\n")
+            self.f.flush()
+        elif self.compact:
+            if self.count == 0:
+                self._emit('{"exportType":"jobspy_harvest","jobs":[')
+            else:
+                self._emit(",")
+            self._emit(json.dumps(job, ensure_ascii=False, separators=(",", ":")))
+        else:
+            if self.count == 0:
+                self._emit('{\n  "exportType": "jobspy_harvest",\n  "jobs": [\n    ')
+            else:
+                self._emit(",\n    ")
+            self._emit(json.dumps(job, indent=2, ensure_ascii=False).replace("\n", "\n    "))
+        self.count += 1
+
+    def close(self) -> None:
+        """Finish the document (the file itself is left open)."""
+        if self.export_format == "ndjson":
+            return
+        if self.compact:
+            self._emit("]}" if self.count else '{"exportType":"jobspy_harvest","jobs":[]}')
+        elif self.count:
+            self._emit("\n  ]\n}")
+        else:
+            self._emit('{\n  "exportType": "jobspy_harvest",\n  "jobs": []\n}')
+
+
+@dataclass
+class ExportStats:
+    """Size and timing of a finished export."""
+
+    jobs: int
+    raw_bytes: int
+    file_bytes: int | None  # None when written to stdout
+    elapsed: float
+    compression: str = ""
+
+    def describe(self) -> str:
+        """Summarize sizes and throughput for the export summary."""
+        rate = self.raw_bytes / self.elapsed if self.elapsed > 0 else 0
+        text = f"{format_bytes(self.raw_bytes)} JSON"
+        if self.compression and self.file_bytes:
+            ratio = self.raw_bytes / self.file_bytes
+            text += f" → {format_bytes(self.file_bytes)} {self.compression} ({ratio:.1f}x smaller)"
+        return f"{text} in {self.elapsed:.2f}s ({format_bytes(rate)}/s)"
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count with a binary unit, e.g. 1.5 MB."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def export_compression(filename: str) -> str:
+    """Return the compression implied by an export filename: "gz", "xz" or ""."""
+    suffix = Path(filename).suffix.lower()
+    return suffix[1:] if suffix in (".gz", ".xz") else ""
+
+
+def open_export(filename: str, compression: str = "", level: int | None = None):
+    """Open an export destination ("-" for stdout) for writing UTF-8 text.
+
+    With compression "gz" or "xz" the text is compressed as it is written, at
+    `level` (1-9 for gzip, 0-9 for xz). Newlines are never translated, so
+    exports are byte-identical on Windows and ExportWriter's byte count
+    matches the file. The caller closes the returned file unless it is
+    sys.stdout; closing a compressed stdout stream leaves stdout open.
+
+    Raises:
+        OSError: If the file cannot be opened
+    """
+    if not compression:
+        return (
+            sys.stdout if filename == "-" else open(filename, "w", encoding="utf-8", newline="\n")
+        )
+
+    level = EXPORT_COMPRESSION_LEVEL if level is None else level
+    if compression == "gz":
+        if filename == "-":
+            binary = gzip.GzipFile(fileobj=sys.stdout.buffer, mode="wb", compresslevel=level)
+        else:
+            binary = gzip.open(filename, "wb", compresslevel=level)
+    elif compression == "xz":
+        binary = lzma.LZMAFile(
+            sys.stdout.buffer if filename == "-" else filename, "wb", preset=level
+        )
+    else:
+        raise ValueError(f"Unknown compression: {compression}")
+    return io.TextIOWrapper(binary, encoding="utf-8", newline="\n")
+
+
+def iter_cleansheet_jobs(jobs, seen_ids: set | None = None):
+    """Convert jobs to Cleansheet jobs in chunks of EXPORT_CHUNK_ROWS, yielding one at a time.
+
+    Only the first job with each ID is yielded: without dedupe, one posting
+    from two boards or two queries would otherwise appear twice under the
+    same ID. Pass `seen_ids` to skip IDs across several calls; the IDs
+    yielded are added to it.
+    """
+    jobs = JobRows.coerce(jobs)
+    if seen_ids is None:
+        seen_ids = set()
+    chunks = (
+        to_cleansheet_jobs(jobs[start : start + EXPORT_CHUNK_ROWS])
+        for start in range(0, len(jobs), EXPORT_CHUNK_ROWS)
+    )
+    for job in TIMINGS.timed_iter("export.convert", itertools.chain.from_iterable(chunks)):
+        if job["id"] not in seen_ids:
+            seen_ids.add(job["id"])
+            yield job
+
+
+def write_export(
+    cleansheet_jobs,
+    filename: str,
+    export_format: str = "json",
+    compact: bool = False,
+    compression: str | None = None,
+    level: int | None = None,
+) -> ExportStats:
+    """Stream Cleansheet jobs (any iterable) to a file, or "-" for stdout.
+
+    Compression defaults to the one implied by the filename (.gz or .xz).
+
+    Returns:
+        ExportStats for the written export
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    if compression is None:
+        compression = export_compression(filename)
+    start = time.perf_counter()
+    f = open_export(filename, compression, level)
+    try:
+        writer = ExportWriter(f, export_format, compact)
+        for job in cleansheet_jobs:
+            writer.write(job)
+        writer.close()
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+    stats = ExportStats(
+        jobs=writer.count,
+        raw_bytes=writer.raw_bytes,
+        file_bytes=None if filename == "-" else os.path.getsize(filename),
+        elapsed=time.perf_counter() - start,
+        compression=compression,
+    )
+    TIMINGS.add("export", stats.elapsed, stats.jobs, stats.raw_bytes)
+    return stats
+
+
+def upsert_export(
+    cleansheet_jobs, filename: str, compact: bool = False, level: int | None = None
+) -> tuple[ExportStats, int, int]:
+    """Merge Cleansheet jobs into an existing export file by job ID.
+
+    Existing entries whose ID comes in again are updated in place, keeping the
+    fields in UPSERT_KEEP_FIELDS; the rest are copied unchanged and new jobs
+    are appended. The file keeps its format (JSON or NDJSON) and compression,
+    and is only replaced once the merged copy is complete. A missing file is
+    simply written.
+
+    Returns:
+        Tuple of (ExportStats for the merged file, jobs added, jobs updated)
+
+    Raises:
+        OSError: If the file cannot be read or written
+        json.JSONDecodeError: If the existing file is not a valid export
+    """
+    compression = export_compression(filename)
+    stem = filename[: -len(compression) - 1] if compression else filename
+    export_format = "ndjson" if stem.lower().endswith(".ndjson") else "json"
+
+    if not os.path.exists(filename):
+        stats = write_export(
+            cleansheet_jobs, filename, export_format, compact, compression=compression, level=level
+        )
+        return stats, stats.jobs, 0
+
+    # The first copy of an ID wins, as it does in iter_cleansheet_jobs
+    incoming = {}
+    for job in cleansheet_jobs:
+        incoming.setdefault(job["id"], job)
+    counts = {"existing": 0, "updated": 0}
+
+    def merged():
+        for old in read_export(filename):
+            counts["existing"] += 1
+            new = incoming.pop(old.get("id"), None)
+            if new is not None:
+                new = {**new, **{name: old[name] for name in UPSERT_KEEP_FIELDS if name in old}}
+                # A description already inlined stays inline when it comes back as a hash
+                same_text = new.get("descriptionHash") == old.get("descriptionHash")
+                if not new.get("description") and same_text and old.get("description"):
+                    new["description"] = old["description"]
+                if new != old:
+                    counts["updated"] += 1
+                    old = new
+            yield old
+        yield from incoming.values()
+
+    path = Path(filename)
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    try:
+        stats = write_export(
+            merged(), str(tmp_path), export_format, compact, compression=compression, level=level
+        )
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    stats.file_bytes = path.stat().st_size
+    return stats, stats.jobs - counts["existing"], counts["updated"]
+
+
+def fts_query(text: str) -> str:
+    """Turn search box text into an FTS5 query.
+
+    Words must all match (words like node.js become a phrase), "quoted text"
+    is a phrase, a trailing * matches a prefix and AND, OR and NOT keep their
+    meaning. Everything else is quoted, so punctuation can't break the query.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text):
+        if word in ("AND", "OR", "NOT"):
+            terms.append(word)
+            continue
+        tokens = re.findall(r"\w+", phrase or word)
+        if tokens:
+            prefix = "*" if word.endswith("*") else ""
+            terms.append('"' + " ".join(tokens) + '"' + prefix)
+    return " ".join(terms)
+
+
+class JobStore:
+    """SQLite store of every harvested job and every search run.
+
+    Jobs are keyed on stable_job_id, so a posting seen by many runs is stored
+    once (its latest copy, with the time it was first seen) and each run links
+    to its jobs in the order they were found. The database runs in WAL mode
+    with indexes on job URL, company, site and posting date, so saved searches
+    and filtered queries are read back without scraping again. Each row keeps
+    every jobspy field as JSON, so stored jobs export exactly like fresh ones.
+
+    An FTS5 index over title, company, location and description answers
+    keyword queries offline (search()). save_run() indexes new jobs a batch at
+    a time, and triggers reindex jobs whose text changes. SQLite builds
+    without FTS5 still store jobs; only search() fails.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            label TEXT NOT NULL,
+            location TEXT NOT NULL,
+            boards TEXT NOT NULL,
+            started_at REAL NOT NULL,
+            finished_at REAL NOT NULL,
+            jobs INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY,
+            job_id TEXT NOT NULL UNIQUE,
+            job_url TEXT,
+            site TEXT,
+            title TEXT,
+            company TEXT,
+            location TEXT,
+            description TEXT,
+            date_posted TEXT,
+            first_seen REAL NOT NULL,
+            last_seen REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS run_jobs (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            job INTEGER NOT NULL REFERENCES jobs(id),
+            PRIMARY KEY (run_id, position)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS jobs_job_url ON jobs(job_url);
+        CREATE INDEX IF NOT EXISTS jobs_company ON jobs(company COLLATE NOCASE);
+        CREATE INDEX IF NOT EXISTS jobs_site ON jobs(site);
+        CREATE INDEX IF NOT EXISTS jobs_date_posted ON jobs(date_posted);
+        CREATE INDEX IF NOT EXISTS run_jobs_job ON run_jobs(job);
+    """
+    # External-content index: the text lives in jobs only. New rows are indexed by
+    # save_run() with one INSERT ... SELECT per batch, since FTS5 flushes its pending
+    # index data at every savepoint and an insert trigger would open one per row.
+    FTS_SCHEMA = """
+        CREATE VIRTUAL TABLE jobs_fts USING fts5(
+            title, company, location, description,
+            content = 'jobs', content_rowid = 'id',
+            tokenize = 'porter unicode61 remove_diacritics 2'
+        );
+        CREATE TRIGGER jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+        END;
+        CREATE TRIGGER jobs_fts_update AFTER UPDATE OF title, company, location, description
+        ON jobs
+        WHEN old.title IS NOT new.title OR old.company IS NOT new.company
+            OR old.location IS NOT new.location OR old.description IS NOT new.description
+        BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, description)
+            VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+            INSERT INTO jobs_fts (rowid, title, company, location, description)
+            VALUES (new.id, new.title, new.company, new.location, new.description);
+        END;
+        INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild');
+    """
+    # Schema changes in order; PRAGMA user_version counts how many have been applied
+    MIGRATIONS = (SCHEMA, FTS_SCHEMA)
+    # bm25() column weights: title, company, location, description
+    SEARCH_WEIGHTS = (10.0, 5.0, 2.0, 1.0)
+    UPSERT_JOB = """
+        INSERT INTO jobs (
+            job_id, job_url, site, title, company, location, description, date_posted,
+            first_seen, last_seen, data
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (job_id) DO UPDATE SET
+            job_url = excluded.job_url,
+            site = excluded.site,
+            title = excluded.title,
+            company = excluded.company,
+            location = excluded.location,
+            description = excluded.description,
+            date_posted = excluded.date_posted,
+            last_seen = excluded.last_seen,
+            data = excluded.data
+    """
+    INDEX_NEW_JOBS = """
+        INSERT INTO jobs_fts (rowid, title, company, location, description)
+        SELECT id, title, company, location, description FROM jobs WHERE id > ?
+    """
+    LINK_JOB = (
+        "INSERT INTO run_jobs (run_id, position, job) SELECT ?, ?, id FROM jobs WHERE job_id = ?"
+    )
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        # WAL stays consistent at NORMAL; only the last commits can be lost on power failure
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.migrate()
+        self.has_search = bool(
+            self.conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'").fetchone()
+        )
+
+    def migrate(self) -> None:
+        """Apply any schema changes the database hasn't had yet.
+
+        Raises:
+            sqlite3.Error: If a migration fails for any reason but missing FTS5
+        """
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, script in enumerate(self.MIGRATIONS[version:], version + 1):
+            try:
+                self.conn.executescript(f"BEGIN; {script} PRAGMA user_version = {number}; COMMIT;")
+            except sqlite3.OperationalError as e:
+                if self.conn.in_transaction:
+                    self.conn.rollback()
+                if "fts5" in str(e):
+                    break
+                raise
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+    @staticmethod
+    def job_record(job: dict, seen_at: float) -> tuple:
+        """Return the jobs table parameters for one jobspy row."""
+        job_id = stable_job_id(
+            job.get("job_url"),
+            job.get("company"),
+            job.get("title"),
+            job.get("location"),
+            job.get("description"),
+        )
+        data = dict(job)
+        # Text descriptions live in their own column; anything else stays in the JSON as is
+        description = data.pop("description") if isinstance(job.get("description"), str) else None
+        date_posted = job.get("date_posted")
+        return (
+            job_id,
+            job.get("job_url") if isinstance(job.get("job_url"), str) else None,
+            job.get("site") if isinstance(job.get("site"), str) else None,
+            job.get("title") if isinstance(job.get("title"), str) else None,
+            job.get("company") if isinstance(job.get("company"), str) else None,
+            job.get("location") if isinstance(job.get("location"), str) else None,
+            description,
+            cleansheet_date(date_posted, None) if is_present(date_posted) else None,
+            seen_at,
+            seen_at,
+            json.dumps(data, default=str),
+        )
+
+    @staticmethod
+    def stored_job(description: str | None, data: str) -> dict:
+        """Rebuild a jobspy row from its stored description and JSON."""
+        job = json.loads(data)
+        if description is not None:
+            job["description"] = description
+        return job
+
+    def save_run(
+        self,
+        jobs,
+        kind: str,
+        label: str,
+        location: str = "",
+        boards: list | None = None,
+        started_at: float | None = None,
+    ) -> int:
+        """Store a search run and its jobs in one transaction, returning the run ID.
+
+        Jobs are upserted STORE_BATCH_ROWS at a time with executemany(), and
+        each batch's new jobs are added to the full-text index.
+        """
+        jobs = JobRows.coerce(jobs)
+        finished_at = time.time()
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (kind, label, location, boards, started_at, finished_at, jobs) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    label,
+                    location or "",
+                    ",".join(boards or []),
+                    started_at or finished_at,
+                    finished_at,
+                    len(jobs),
+                ),
+            ).lastrowid
+            for start in range(0, len(jobs), STORE_BATCH_ROWS):
+                batch = jobs[start : start + STORE_BATCH_ROWS]
+                records = [self.job_record(job, finished_at) for job in batch]
+                # New jobs get IDs above the current highest, so they can be indexed together
+                newest = self.conn.execute("SELECT coalesce(max(id), 0) FROM jobs").fetchone()[0]
+                # Only the last copy of a job repeated in the batch is stored; updating a
+                # row that isn't indexed yet would remove text the index never had
+                latest = {record[0]: record for record in records}
+                self.conn.executemany(self.UPSERT_JOB, latest.values())
+                if self.has_search:
+                    self.conn.execute(self.INDEX_NEW_JOBS, (newest,))
+                self.conn.executemany(
+                    self.LINK_JOB,
+                    ((run_id, start + offset, record[0]) for offset, record in enumerate(records)),
+                )
+        return run_id
+
+    def runs(self, limit: int | None = None) -> list:
+        """Return saved runs as dicts, newest first."""
+        rows = self.conn.execute(
+            "SELECT * FROM runs ORDER BY id DESC LIMIT ?", (-1 if limit is None else limit,)
+        )
+        return [dict(row) for row in rows]
+
+    def latest_run(self) -> dict | None:
+        """Return the newest saved run, or None if there are none."""
+        runs = self.runs(1)
+        return runs[0] if runs else None
+
+    def query(
+        self,
+        run_id: int | None = None,
+        site: str | None = None,
+        company: str | None = None,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> JobRows:
+        """Return stored jobs, optionally one run's and filtered, as JobRows.
+
+        A run's jobs come back in the order the run found them; otherwise jobs
+        come back in the order they were first stored. `company` matches the
+        whole name ignoring case, and `since` is a YYYY-MM-DD posting date.
+        """
+        if run_id is None:
+            sql = "SELECT j.description, j.data FROM jobs j WHERE 1"
+            params = []
+        else:
+            sql = (
+                "SELECT j.description, j.data FROM run_jobs r JOIN jobs j ON j.id = r.job "
+                "WHERE r.run_id = ?"
+            )
+            params = [run_id]
+        if site:
+            sql += " AND j.site = ?"
+            params.append(site)
+        if company:
+            sql += " AND j.company = ? COLLATE NOCASE"
+            params.append(company)
+        if since:
+            sql += " AND j.date_posted >= ?"
+            params.append(since)
+        sql += " ORDER BY j.id" if run_id is None else " ORDER BY r.position"
+        sql += " LIMIT ?"
+        params.append(-1 if limit is None else limit)
+
+        rows = self.conn.execute(sql, params)
+        return JobRows.from_records([self.stored_job(*row) for row in rows])
+
+    def search(
+        self,
+        text: str,
+        site: str | None = None,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> JobRows:
+        """Return stored jobs matching a keyword query, best matches first.
+
+        Matches are ranked with BM25, weighting title over company over
+        location over description (SEARCH_WEIGHTS). Each row gets a "snippet"
+        column with the best matching stretch of text, matches wrapped in
+        \x02 and \x03. See fts_query() for the query syntax.
+
+        Raises:
+            sqlite3.OperationalError: If the query is invalid or FTS5 is unavailable
+        """
+        if not self.has_search:
+            raise sqlite3.OperationalError("full-text search needs SQLite with FTS5")
+        query = fts_query(text)
+        if not query:
+            return JobRows()
+
+        # Ordering by FTS5's rank column lets it skip work bm25() in ORDER BY can't
+        sql = (
+            "SELECT j.description, j.data, "
+            "snippet(jobs_fts, -1, char(2), char(3), '…', 16) AS snippet "
+            "FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid "
+            "WHERE jobs_fts MATCH ? AND rank MATCH ?"
+        )
+        params = [query, f"bm25({', '.join(map(str, self.SEARCH_WEIGHTS))})"]
+        if site:
+            sql += " AND j.site = ?"
+            params.append(site)
+        if since:
+            sql += " AND j.date_posted >= ?"
+            params.append(since)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(-1 if limit is None else limit)
+
+        rows = self.conn.execute(sql, params)
+        records = [
+            {**self.stored_job(description, data), "snippet": snippet}
+            for description, data, snippet in rows
+        ]
+        return JobRows.from_records(records)
+
+
+def save_search_run(
+    jobs,
+    kind: str,
+    label: str,
+    location: str,
+    config: dict,
+    started_at: float | None = None,
+) -> int | None:
+    """Save a search run to the job store if it is enabled, returning the run ID.
+
+    A store that can't be written is reported and otherwise ignored, since the
+    jobs themselves are still in memory for export. Runs against the mock boards
+    or a replayed recording are never saved.
+    """
+    if (
+        not config.get("job_store", True)
+        or config.get("mock_board_url")
+        or config.get("replay_dir")
+    ):
+        return None
+    try:
+        with TIMINGS.phase("store") as phase, JobStore(JOB_STORE_PATH) as store:
+            phase.rows = len(jobs)
+            return store.save_run(jobs, kind, label, location, config.get("job_boards"), started_at)
+    except sqlite3.Error as e:
+        console.print(f"[yellow]Could not save search to the job store: {e}[/]")
+        return None
+
+
+def describe_run(run: dict) -> str:
+    """Return a short description of a saved run for prompts and tables."""
+    started = datetime.fromtimestamp(run["started_at"]).strftime("%Y-%m-%d %H:%M")
+    where = f" / {run['location']}" if run["location"] else ""
+    return f"{started} {run['kind']}: {run['label']}{where}"
+
+
+def load_saved_search(config: dict) -> tuple[JobRows, str]:
+    """Pick a saved search run from the job store and load its jobs.
+
+    Returns:
+        Tuple of (JobRows of the saved jobs, label used for the export filename)
+    """
+    console.print("\n[bold cyan]Saved Searches[/]")
+
+    if not JOB_STORE_PATH.exists():
+        console.print("[yellow]No saved searches yet. Run a search first.[/]")
+        return JobRows(), ""
+
+    try:
+        with JobStore(JOB_STORE_PATH) as store:
+            runs = store.runs(SAVED_RUNS_SHOWN)
+            if not runs:
+                console.print("[yellow]No saved searches yet. Run a search first.[/]")
+                return JobRows(), ""
+
+            table = Table(box=box.ROUNDED)
+            table.add_column("Run", style="dim", justify="right")
+            table.add_column("When")
+            table.add_column("Search", style="bold", max_width=40)
+            table.add_column("Jobs", justify="right")
+            for run in runs:
+                started = datetime.fromtimestamp(run["started_at"]).strftime("%Y-%m-%d %H:%M")
+                search = run["label"] + (f" / {run['location']}" if run["location"] else "")
+                table.add_row(str(run["id"]), started, search, str(run["jobs"]))
+            console.print(table)
+
+            run_ids = [str(run["id"]) for run in runs]
+            choice = Prompt.ask("Run to load", choices=run_ids, default=run_ids[0])
+            run = runs[run_ids.index(choice)]
+            jobs = store.query(run_id=run["id"])
+    except sqlite3.Error as e:
+        console.print(f"[red]Could not read the job store: {e}[/]")
+        return JobRows(), ""
+
+    if not jobs:
+        console.print("\n[yellow]That search found no jobs.[/]")
+        return JobRows(), ""
+
+    console.print(f"\n[green]Loaded {len(jobs)} jobs from {describe_run(run)}[/]")
+    display_jobs_table(jobs)
+
+    return jobs, run["label"]
+
+
+def format_snippet(snippet) -> str:
+    """Return a search snippet as rich markup, highlighting the matched words."""
+    if not isinstance(snippet, str):
+        return ""
+    text = escape(" ".join(snippet.split()))
+    return text.replace("\x02", "[bold yellow]").replace("\x03", "[/]")
+
+
+def display_matches_table(jobs) -> None:
+    """Display full-text search matches with the matching text."""
+    table = Table(box=box.ROUNDED, show_lines=True)
+    table.add_column("#", style="dim", width=4)
+    table.add_column("Title", style="bold", max_width=30)
+    table.add_column("Company", max_width=20)
+    table.add_column("Source", style="cyan", width=12)
+    table.add_column("Match", ratio=1)
+
+    for i, job in enumerate(jobs[:50], 1):
+        table.add_row(
+            str(i),
+            str(job.get("title", ""))[:30],
+            str(job.get("company", ""))[:20],
+            str(job.get("site", "")),
+            format_snippet(job.get("snippet")),
+        )
+
+    console.print(table)
+
+    if len(jobs) > 50:
+        console.print(f"[dim]...and {len(jobs) - 50} more (all will be exported)[/]")
+
+
+def search_saved_jobs(config: dict) -> tuple[JobRows, str]:
+    """Search the descriptions of every stored job, without network access.
+
+    Returns:
+        Tuple of (JobRows of the matching jobs, query used for the export filename)
+    """
+    console.print("\n[bold cyan]Search Saved Jobs[/]")
+
+    if not JOB_STORE_PATH.exists():
+        console.print("[yellow]No saved jobs yet. Run a search first.[/]")
+        return JobRows(), ""
+
+    console.print('[dim]All words must match; use "quoted phrases", prefix*, OR and NOT[/]')
+    text = Prompt.ask("Keywords")
+    if not text.strip():
+        return JobRows(), ""
+
+    start = time.perf_counter()
+    try:
+        with JobStore(JOB_STORE_PATH) as store:
+            jobs = store.search(text, limit=SAVED_SEARCH_LIMIT)
+    except sqlite3.Error as e:
+        console.print(f"[red]Search failed: {e}[/]")
+        return JobRows(), ""
+    elapsed = time.perf_counter() - start
+
+    if not jobs:
+        console.print("\n[yellow]No saved jobs match.[/]")
+        return JobRows(), ""
+
+    console.print(f"\n[green]{len(jobs)} matching jobs[/] [dim]({elapsed * 1000:.0f} ms)[/]")
+    display_matches_table(jobs)
+
+    return jobs, text
+
+
+def is_seen_url(url, seen_index: SeenUrlIndex) -> bool:
+    """Return True if a job URL is already in the seen-URL index."""
+    return isinstance(url, str) and bool(url) and url in seen_index
+
+
+def drop_seen_jobs(jobs, seen_index: SeenUrlIndex) -> JobRows:
+    """Return the jobs whose URL is not in the seen-URL index."""
+    jobs = JobRows.coerce(jobs)
+    urls = jobs.column("job_url")
+    return jobs.take([i for i, url in enumerate(urls) if not is_seen_url(url, seen_index)])
+
+
+def remember_exported_jobs(jobs, seen_index: SeenUrlIndex) -> None:
+    """Add exported jobs' URLs to the seen-URL index and save it."""
+    for url in JobRows.coerce(jobs).column("job_url"):
+        if isinstance(url, str) and url:
+            seen_index.add(url)
+    try:
+        seen_index.save(SEEN_INDEX_PATH)
+    except OSError as e:
+        console.print(f"[yellow]Could not save seen-URL index: {e}[/]")
 
-    # Get local timezone offset (e.g., -0500, +0100)
-    now = datetime.now().astimezone()
-    tz_offset = now.strftime("%z")  # Returns like -0500 or +0100
 
-    default_name = f"{safe_search}_{now.strftime('%Y%m%d_%H%M%S')}{tz_offset}.json"
-    filename = Prompt.ask("Filename", default=default_name)
+def export_jobs(
+    jobs: list,
+    search_term: str = "",
+    incremental: bool = False,
+    compact: bool = False,
+    compression: str = "",
+    compression_level: int = EXPORT_COMPRESSION_LEVEL,
+    description_store: str = "off",
+    harvest_runs: dict | None = None,
+) -> None:
+    """Export jobs to Cleansheet-compatible JSON, indented unless `compact` is set.
 
-    if not filename.endswith(".json"):
+    `compression` ("gz" or "xz") picks the default filename; a filename ending
+    in .gz or .xz is compressed at `compression_level` either way. With a
+    `description_store` mode other than "off", descriptions are written to the
+    description store and replaced by their hash (see externalize_descriptions).
+
+    In incremental mode, jobs whose URL was exported by an earlier run are
+    skipped, and the URLs written are added to the seen-URL index. The
+    searches' `harvest_runs` are saved once nothing is left to export.
+    """
+    if not jobs:
+        console.print("\n[yellow]No jobs to export. Run a search first.[/]")
+        return
+
+    seen_index = None
+    if incremental:
+        seen_index = SeenUrlIndex.load(SEEN_INDEX_PATH)
+        new_jobs = drop_seen_jobs(jobs, seen_index)
+        if len(new_jobs) < len(jobs):
+            console.print(f"[dim]Skipping {len(jobs) - len(new_jobs)} jobs exported earlier[/]")
+        jobs = new_jobs
+        if not jobs:
+            console.print("\n[yellow]No new jobs since the last export.[/]")
+            save_harvest_runs(harvest_runs)
+            return
+
+    console.print(f"\n[bold cyan]Export {len(jobs)} Jobs[/]")
+
+    extension = f".json.{compression}" if compression else ".json"
+    filename = Prompt.ask("Filename", default=default_export_filename(search_term, extension))
+
+    if not re.search(r"\.json(\.gz|\.xz)?$", filename, re.IGNORECASE):
         filename += ".json"
 
-    # Convert to Cleansheet format
-    cleansheet_jobs = []
-    for job in jobs:
-        # Handle date formatting
-        date_posted = job.get("date_posted")
-        if date_posted:
-            if hasattr(date_posted, "strftime"):
-                date_posted = date_posted.strftime("%Y-%m-%d")
-            else:
-                date_posted = str(date_posted)[:10]
+    # An existing file can take the new jobs by ID instead of being replaced
+    merge = os.path.exists(filename) and Confirm.ask(
+        "File exists. Merge into it (update changed jobs, add new ones)?", default=True
+    )
+
+    # Convert to Cleansheet format and write file
+    cleansheet_jobs = externalize_descriptions(iter_cleansheet_jobs(jobs), description_store)
+    try:
+        if merge:
+            stats, added, updated = upsert_export(
+                cleansheet_jobs, filename, compact=compact, level=compression_level
+            )
+            console.print(
+                f"\n[green]Merged into {filename}: {added} new, {updated} updated, "
+                f"{stats.jobs} jobs in total[/]"
+            )
         else:
-            date_posted = datetime.now().strftime("%Y-%m-%d")
+            stats = write_export(
+                cleansheet_jobs, filename, compact=compact, level=compression_level
+            )
+            console.print(f"\n[green]Exported {stats.jobs} jobs to {filename}[/]")
+        console.print(f"[dim]{stats.describe()}[/]")
+        console.print("[dim]Import this file into Cleansheet Job Opportunities[/]")
+
+    except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+        console.print(f"[red]Export failed: {e}[/]")
+        return
+
+    if seen_index is not None:
+        remember_exported_jobs(jobs, seen_index)
+    save_harvest_runs(harvest_runs)
+
+
+# Exit codes for headless runs (argparse itself exits with 2 on bad arguments)
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_NO_JOBS = 3
+EXIT_PARTIAL = 4
+EXIT_INTERRUPTED = 130
+
+
+def emit_event(event: str, **fields) -> None:
+    """Write one machine-readable progress event as a JSON line on stderr."""
+    record = {"event": event, "time": round(time.time(), 3), **fields}
+    sys.stderr.write(json.dumps(record, default=str) + "\n")
+    sys.stderr.flush()
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser for headless runs."""
+    parser = argparse.ArgumentParser(
+        prog="jobpacker",
+        description="Harvest job listings to Cleansheet JSON. Run with no arguments for the menu.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument(
+        "-o", "--output", help="output file, or - for stdout (default: auto-named file)"
+    )
+    output.add_argument(
+        "-f", "--format", choices=["json", "ndjson"], default="json", help="output format"
+    )
+    output.add_argument(
+        "--compact", action="store_true", help="write JSON without indentation (default: config)"
+    )
+    output.add_argument(
+        "--compress",
+        choices=["gz", "xz"],
+        help="compress the output (default: from the -o suffix, or config for auto-named files)",
+    )
+    output.add_argument(
+        "--level", type=int, help="compression level, 1-9 for gz and 0-9 for xz (default: config)"
+    )
+    output.add_argument(
+        "--profile",
+        nargs="?",
+        const=str(PROFILE_PATH),
+        metavar="FILE",
+        help=f"write a cProfile dump to FILE (default: {PROFILE_PATH.name}) and report "
+        "each phase's time, rows and bytes in a final profile event",
+    )
+
+    harvest = argparse.ArgumentParser(add_help=False)
+    harvest.add_argument(
+        "--stream",
+        action="store_true",
+        help="write each query's jobs as soon as it finishes (implies --format ndjson; "
+        "duplicates are matched by URL, company, title and location only)",
+    )
+    harvest.add_argument(
+        "--incremental",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="only fetch and export jobs new since the last run (default: config)",
+    )
+    harvest.add_argument(
+        "--upsert",
+        action="store_true",
+        help="merge into the -o file if it exists: update jobs by ID and append new ones",
+    )
+    harvest.add_argument(
+        "--description-store",
+        choices=DESCRIPTION_STORE_MODES,
+        help="replace descriptions with hashes into the local description store: always "
+        "(hash) or once inlined (first) (default: config)",
+    )
+    harvest.add_argument(
+        "--store",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="save the run and its jobs to the local job store (default: config)",
+    )
+    recording = harvest.add_mutually_exclusive_group()
+    recording.add_argument(
+        "--record", metavar="DIR", help="save every board response and its timing to DIR"
+    )
+    recording.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="answer board queries from a recording in DIR, without the network",
+    )
+    harvest.add_argument(
+        "--replay-fast", action="store_true", help="replay without the recorded delays"
+    )
+    harvest.add_argument(
+        "--output-dir",
+        metavar="DIR",
+        help="write auto-named exports into DIR (default: config, or the current directory)",
+    )
+    harvest.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="write Prometheus textfile metrics for the run to FILE (default: config)",
+    )
+    harvest.add_argument(
+        "--mock-boards",
+        metavar="URL",
+        help="scrape a local mock board server (python -m benchmarks.mock_board) instead",
+    )
+
+    search = commands.add_parser("search", parents=[output, harvest], help="run one search")
+    search.add_argument("-t", "--term", required=True, help="job title / keywords")
+    search.add_argument("-l", "--location", help="location (default: config)")
+    search.add_argument(
+        "-b", "--boards", help=f"comma-separated boards from {', '.join(ALL_JOB_BOARDS)}"
+    )
+    search.add_argument("-n", "--results", type=int, help="results per board")
+    search.add_argument(
+        "--remote", action=argparse.BooleanOptionalAction, default=None, help="remote jobs only"
+    )
+    search.add_argument("--job-type", choices=JOB_TYPES[1:], help="job type filter")
+
+    batch = commands.add_parser("batch", parents=[output, harvest], help="run a search grid file")
+    batch.add_argument("grid", help="search grid JSON file")
+
+    daemon = commands.add_parser(
+        "daemon",
+        parents=[output, harvest],
+        help="keep running search grid files on jittered intervals",
+    )
+    daemon.add_argument("grids", nargs="+", help="search grid JSON files")
+    daemon.add_argument(
+        "--interval", type=float, help="seconds between runs of each grid (default: config)"
+    )
+    daemon.add_argument(
+        "--jitter",
+        type=float,
+        help="vary each interval by up to this fraction either way (default: config)",
+    )
+    daemon.add_argument(
+        "--runs", type=int, default=0, help="stop after this many runs (default: run until stopped)"
+    )
+
+    rehydrate = commands.add_parser(
+        "rehydrate",
+        parents=[output],
+        help="rebuild a full export from one written with the description store",
+    )
+    rehydrate.add_argument("source", help="export file with description hashes")
+
+    export = commands.add_parser(
+        "export", parents=[output], help="export jobs from the local job store without scraping"
+    )
+    which = export.add_mutually_exclusive_group()
+    which.add_argument("--run", type=int, help="saved run to export (default: the latest)")
+    which.add_argument("--all", action="store_true", help="export every stored job")
+    export.add_argument("--site", choices=ALL_JOB_BOARDS, help="only jobs from this board")
+    export.add_argument("--company", help="only jobs at this company (ignoring case)")
+    export.add_argument("--since", help="only jobs posted on or after this date (YYYY-MM-DD)")
+
+    find = commands.add_parser(
+        "find", parents=[output], help="export stored jobs matching keywords, best first"
+    )
+    find.add_argument(
+        "query", help='keywords; all must match ("quoted phrases", prefix*, OR and NOT work)'
+    )
+    find.add_argument("--site", choices=ALL_JOB_BOARDS, help="only jobs from this board")
+    find.add_argument("--since", help="only jobs posted on or after this date (YYYY-MM-DD)")
+    find.add_argument(
+        "-n", "--limit", type=int, default=SAVED_SEARCH_LIMIT, help="most matches to export"
+    )
+
+    runs = commands.add_parser("runs", help="list saved runs as JSON lines on stdout")
+    runs.add_argument(
+        "-n", "--limit", type=int, default=SAVED_RUNS_SHOWN, help="newest runs to list"
+    )
+
+    return parser
+
+
+def apply_cli_overrides(config: dict, args: argparse.Namespace) -> dict:
+    """Return config with any search settings given on the command line applied."""
+    config = dict(config)
+    if getattr(args, "boards", None):
+        boards = [board.strip() for board in args.boards.split(",") if board.strip()]
+        unknown = [board for board in boards if board not in ALL_JOB_BOARDS]
+        if unknown:
+            raise ValueError(f"Unknown job boards: {', '.join(unknown)}")
+        config["job_boards"] = boards
+    if getattr(args, "results", None) is not None:
+        config["results_per_site"] = args.results
+    if getattr(args, "remote", None) is not None:
+        config["remote_only"] = args.remote
+    if getattr(args, "job_type", None):
+        config["job_type"] = args.job_type
+    if getattr(args, "incremental", None) is not None:
+        config["incremental"] = args.incremental
+    if getattr(args, "description_store", None):
+        config["description_store"] = args.description_store
+    if getattr(args, "store", None) is not None:
+        config["job_store"] = args.store
+    if getattr(args, "record", None):
+        config["record_dir"] = args.record
+    if getattr(args, "replay", None):
+        if not (Path(args.replay) / ScrapeRecording.INDEX).exists():
+            raise ValueError(f"No recording in {args.replay}")
+        config["replay_dir"] = args.replay
+    if getattr(args, "replay_fast", False):
+        config["replay_speed"] = "fast"
+    if getattr(args, "mock_boards", None):
+        config["mock_board_url"] = args.mock_boards
+    if getattr(args, "metrics", None):
+        config["metrics_file"] = args.metrics
+    if getattr(args, "output_dir", None):
+        config["export_dir"] = args.output_dir
+    if getattr(args, "interval", None) is not None:
+        config["daemon_interval"] = args.interval
+    if getattr(args, "jitter", None) is not None:
+        config["daemon_jitter"] = args.jitter
+    return config
+
+
+def run_rehydrate(args: argparse.Namespace) -> int:
+    """Rebuild a full Cleansheet export from the description store, returning an exit code."""
+    config = load_config()
+    source = Path(args.source)
+    extension = ".ndjson" if args.format == "ndjson" else ".json"
+    if args.compress:
+        extension += f".{args.compress}"
+    stem = re.sub(r"\.(nd)?json(\.gz|\.xz)?$", "", source.name, flags=re.IGNORECASE)
+    filename = args.output or str(source.with_name(f"{stem}_full{extension}"))
+    compression = args.compress or export_compression(filename)
+    if filename != "-" and Path(filename).resolve() == source.resolve():
+        emit_event("error", message="Output would overwrite the source export")
+        return EXIT_ERROR
+
+    try:
+        stats, missing = rehydrate_export(
+            args.source,
+            filename,
+            args.format,
+            compact=args.compact or config["export_compact"],
+            compression=compression,
+            level=config["export_compression_level"] if args.level is None else args.level,
+        )
+    except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+        emit_event("error", message=f"Rehydrate failed: {e}")
+        return EXIT_ERROR
+
+    emit_event(
+        "done",
+        jobs=stats.jobs,
+        output=filename,
+        missing_descriptions=len(missing),
+        raw_bytes=stats.raw_bytes,
+        file_bytes=stats.file_bytes,
+    )
+    return EXIT_PARTIAL if missing else EXIT_OK
+
+
+def run_store_export(args: argparse.Namespace) -> int:
+    """Export jobs from the local job store without scraping, returning an exit code."""
+    config = load_config()
+    if not JOB_STORE_PATH.exists():
+        emit_event("error", message="No local job store yet; run a search first")
+        return EXIT_ERROR
+
+    try:
+        with JobStore(JOB_STORE_PATH) as store:
+            if args.all:
+                run_id, label = None, "saved_jobs"
+            elif args.run is not None:
+                run_id, label = args.run, f"run_{args.run}"
+            else:
+                run = store.latest_run()
+                if run is None:
+                    emit_event("done", jobs=0)
+                    return EXIT_NO_JOBS
+                run_id, label = run["id"], run["label"]
+            jobs = store.query(run_id, args.site, args.company, args.since)
+    except sqlite3.Error as e:
+        emit_event("error", message=f"Could not read the job store: {e}")
+        return EXIT_ERROR
+
+    return export_stored_jobs(args, config, jobs, label, run_id=run_id)
+
+
+def run_find(args: argparse.Namespace) -> int:
+    """Export stored jobs matching a keyword query, returning an exit code."""
+    config = load_config()
+    if not JOB_STORE_PATH.exists():
+        emit_event("error", message="No local job store yet; run a search first")
+        return EXIT_ERROR
+
+    start = time.perf_counter()
+    try:
+        with JobStore(JOB_STORE_PATH) as store:
+            jobs = store.search(args.query, args.site, args.since, args.limit)
+    except sqlite3.Error as e:
+        emit_event("error", message=f"Search failed: {e}")
+        return EXIT_ERROR
+    query_ms = round((time.perf_counter() - start) * 1000, 3)
+
+    return export_stored_jobs(args, config, jobs, args.query, query_ms=query_ms)
+
+
+def export_stored_jobs(args: argparse.Namespace, config: dict, jobs, label: str, **fields) -> int:
+    """Write jobs read from the job store as a headless export, returning an exit code.
+
+    `fields` are added to the "done" event.
+    """
+    if not jobs:
+        emit_event("done", jobs=0, **fields)
+        return EXIT_NO_JOBS
+
+    extension = ".ndjson" if args.format == "ndjson" else ".json"
+    if not args.output and (args.compress or config["export_compression"]):
+        extension += f".{args.compress or config['export_compression']}"
+    filename = args.output or default_export_filename(label, extension)
+    try:
+        stats = write_export(
+            iter_cleansheet_jobs(jobs),
+            filename,
+            args.format,
+            compact=args.compact or config["export_compact"],
+            compression=args.compress or export_compression(filename),
+            level=config["export_compression_level"] if args.level is None else args.level,
+        )
+    except (OSError, TypeError) as e:
+        emit_event("error", message=f"Export failed: {e}")
+        return EXIT_ERROR
+
+    emit_event(
+        "done",
+        jobs=stats.jobs,
+        output=filename,
+        raw_bytes=stats.raw_bytes,
+        file_bytes=stats.file_bytes,
+        **fields,
+    )
+    return EXIT_OK
+
+
+def run_list_runs(args: argparse.Namespace) -> int:
+    """Write the newest saved runs to stdout as JSON lines, returning an exit code."""
+    if not JOB_STORE_PATH.exists():
+        return EXIT_NO_JOBS
+    try:
+        with JobStore(JOB_STORE_PATH) as store:
+            runs = store.runs(args.limit)
+    except sqlite3.Error as e:
+        emit_event("error", message=f"Could not read the job store: {e}")
+        return EXIT_ERROR
+
+    for run in runs:
+        sys.stdout.write(json.dumps(run) + "\n")
+    sys.stdout.flush()
+    return EXIT_OK if runs else EXIT_NO_JOBS
+
+
+# Upper bounds (seconds) of the scrape latency histogram buckets in metrics files
+SCRAPE_LATENCY_BUCKETS = (0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+
+@dataclass
+class RunMetrics:
+    """What a headless harvest did, for a Prometheus textfile collector.
+
+    Every value describes the latest run only, labelled with the run's search
+    term or grid name so several scheduled harvests can share one collector
+    directory (each writing its own file).
+    """
+
+    harvest: str
+    results: list = field(default_factory=list)
+    jobs_scraped: int = 0
+    jobs_unique: int | None = None  # None when dedupe didn't run over every row
+    export: ExportStats | None = None
+    started: float = field(default_factory=time.monotonic)
+
+    def render(self, exit_code: int) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP jobpacker_{name} {help_text}")
+            lines.append(f"# TYPE jobpacker_{name} {kind}")
+            for suffix, labels, value in samples:
+                labels = {"harvest": self.harvest, **labels}
+                text = ",".join(f'{key}="{prometheus_escape(v)}"' for key, v in labels.items())
+                lines.append(f"jobpacker_{name}{suffix}{{{text}}} {format_metric(value)}")
+
+        requests, errors, latencies = {}, {}, {}
+        rows, cache_hits = {}, {}
+        for result in self.results:
+            key = (result.board, result.status)
+            requests[key] = requests.get(key, 0) + 1
+            rows[result.board] = rows.get(result.board, 0) + len(result.rows)
+            cache_hits[result.board] = cache_hits.get(result.board, 0) + (result.cache == "hit")
+            if result.status != "ok":
+                key = (result.board, result.error_type or result.status)
+                errors[key] = errors.get(key, 0) + 1
+            if result.status == "ok" and result.cache != "hit":
+                latencies.setdefault(result.board, []).append(result.elapsed)
+
+        metric(
+            "board_requests",
+            "gauge",
+            "Board queries in the last run, by outcome.",
+            [("", {"board": b, "status": st}, n) for (b, st), n in sorted(requests.items())],
+        )
+        metric(
+            "board_cache_hits",
+            "gauge",
+            "Board queries answered from the result cache in the last run.",
+            [("", {"board": board}, count) for board, count in sorted(cache_hits.items())],
+        )
+        metric(
+            "board_rows",
+            "gauge",
+            "Jobs returned by each board in the last run.",
+            [("", {"board": board}, count) for board, count in sorted(rows.items())],
+        )
+        metric(
+            "board_errors",
+            "gauge",
+            "Failed board queries in the last run, by error type.",
+            [("", {"board": b, "type": kind}, n) for (b, kind), n in sorted(errors.items())],
+        )
+
+        samples = []
+        for board in sorted(latencies):
+            values = latencies[board]
+            for bound in SCRAPE_LATENCY_BUCKETS:
+                count = sum(value <= bound for value in values)
+                samples.append(("_bucket", {"board": board, "le": str(bound)}, count))
+            samples.append(("_bucket", {"board": board, "le": "+Inf"}, len(values)))
+            samples.append(("_sum", {"board": board}, sum(values)))
+            samples.append(("_count", {"board": board}, len(values)))
+        metric(
+            "scrape_duration_seconds",
+            "histogram",
+            "Time each successful board query took in the last run (cache hits excluded).",
+            samples,
+        )
+
+        metric(
+            "jobs_scraped", "gauge", "Jobs returned by all boards.", [("", {}, self.jobs_scraped)]
+        )
+        if self.jobs_unique is not None:
+            removed = self.jobs_scraped - self.jobs_unique
+            ratio = removed / self.jobs_scraped if self.jobs_scraped else 0.0
+            metric("jobs_unique", "gauge", "Jobs left after dedupe.", [("", {}, self.jobs_unique)])
+            metric(
+                "dedupe_ratio",
+                "gauge",
+                "Share of scraped jobs merged as duplicates.",
+                [("", {}, ratio)],
+            )
+        export = self.export
+        metric(
+            "export_jobs",
+            "gauge",
+            "Jobs written to the export.",
+            [("", {}, export.jobs if export else 0)],
+        )
+        samples = [("", {"encoding": "json"}, export.raw_bytes if export else 0)]
+        if export and export.file_bytes is not None:
+            samples.append(("", {"encoding": export.compression or "none"}, export.file_bytes))
+        metric("export_bytes", "gauge", "Size of the export, as JSON and on disk.", samples)
+
+        metric(
+            "phase_seconds",
+            "gauge",
+            "Wall time of each phase of the last run.",
+            [("", {"phase": p["phase"]}, p["seconds"]) for p in TIMINGS.summary()],
+        )
+        metric(
+            "run_duration_seconds",
+            "gauge",
+            "Wall time of the last run.",
+            [("", {}, time.monotonic() - self.started)],
+        )
+        metric("run_exit_code", "gauge", "Exit code of the last run.", [("", {}, exit_code)])
+        metric(
+            "last_run_timestamp_seconds",
+            "gauge",
+            "When the last run finished, in Unix time.",
+            [("", {}, time.time())],
+        )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str, exit_code: int) -> None:
+        """Write the metrics file atomically, so a collector never reads half of it.
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(self.render(exit_code), encoding="utf-8")
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+
+def prometheus_escape(value) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_metric(value) -> str:
+    """Format a sample value, keeping integers integral."""
+    if isinstance(value, int):
+        return str(value)
+    return repr(round(value, 6))
+
+
+def run_headless(args: argparse.Namespace) -> int:
+    """Run a search or batch without prompts or tables, returning an exit code."""
+    if args.command == "rehydrate":
+        return run_rehydrate(args)
+    if args.command == "export":
+        return run_store_export(args)
+    if args.command == "runs":
+        return run_list_runs(args)
+    if args.command == "find":
+        return run_find(args)
+
+    try:
+        config = apply_cli_overrides(load_config(), args)
+    except ValueError as e:
+        emit_event("error", message=str(e))
+        return EXIT_ERROR
+
+    if args.command == "daemon":
+        return run_daemon(args, config)
+    return run_harvest_with_metrics(args, config, config["metrics_file"])
+
+
+def run_harvest_with_metrics(args: argparse.Namespace, config: dict, metrics_file: str) -> int:
+    """Run a headless search or batch, writing its metrics to metrics_file if given."""
+    if not metrics_file:
+        return run_harvest(args, config)
+
+    label = Path(args.grid).stem if args.command == "batch" else args.term
+    metrics = RunMetrics(label)
+    TIMINGS.reset()
+    code = EXIT_ERROR
+    try:
+        code = run_harvest(args, config, metrics)
+    finally:
+        try:
+            metrics.write(metrics_file, code)
+        except OSError as e:
+            emit_event("error", message=f"Could not write metrics: {e}")
+    return code
+
+
+def run_harvest(args: argparse.Namespace, config: dict, metrics: RunMetrics | None = None) -> int:
+    """Run a headless search or batch and export its jobs, returning an exit code."""
+    if args.upsert and (args.stream or args.output in (None, "-")):
+        emit_event("error", message="--upsert needs an -o file and can't be used with --stream")
+        return EXIT_ERROR
+
+    started_at = time.time()
+    if args.command == "batch":
+        try:
+            grid = load_search_grid(args.grid)
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            emit_event("error", message=f"Could not load search grid: {e}")
+            return EXIT_ERROR
+        config = {**config, **{k: v for k, v in grid.items() if k in DEFAULT_CONFIG}}
+        queries = build_search_queries(grid, config["job_boards"])
+        label = Path(args.grid).stem
+        location = ""
+        stream = iter_search_results(
+            queries,
+            config,
+            config["batch_timeout"],
+            config["batch_max_workers"],
+            config["batch_board_concurrency"],
+        )
+    else:
+        location = args.location or config["default_location"]
+        queries = [(board, args.term, location) for board in config["job_boards"]]
+        label = args.term
+        stream = iter_board_results(config["job_boards"], args.term, location, config)
+
+    seen_index = SeenUrlIndex.load(SEEN_INDEX_PATH) if incremental_enabled(config) else None
+    export_format = "ndjson" if args.stream else args.format
+    extension = ".ndjson" if export_format == "ndjson" else ".json"
+    if not args.output and (args.compress or config["export_compression"]):
+        extension += f".{args.compress or config['export_compression']}"
+    filename = args.output or default_export_filename(label, extension)
+    if not args.output and config["export_dir"]:
+        try:
+            Path(config["export_dir"]).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            emit_event("error", message=f"Could not create export directory: {e}")
+            return EXIT_ERROR
+        filename = str(Path(config["export_dir"]) / filename)
+    compression = args.compress or export_compression(filename)
+    level = config["export_compression_level"] if args.level is None else args.level
+
+    emit_event("start", command=args.command, queries=len(queries))
+    if args.stream:
+        try:
+            results, stats, interrupted = stream_headless_export(
+                stream, filename, config, seen_index, compression, level
+            )
+        except OSError as e:
+            emit_event("error", message=f"Export failed: {e}")
+            return EXIT_ERROR
+    else:
+        results, interrupted = collect_headless_results(stream)
+
+    save_rate_limit_state(config)
 
-        # Handle salary (check for NaN values)
-        salary = ""
-        min_sal = job.get("min_amount")
-        max_sal = job.get("max_amount")
+    jobs = merge_job_rows(results)
+    if metrics is not None:
+        metrics.results = results
+        metrics.jobs_scraped = sum(len(result.rows) for result in results)
+    if config["dedupe"] and not args.stream:
+        with TIMINGS.phase("dedupe") as phase:
+            phase.rows = len(jobs)
+            jobs = dedupe_jobs(jobs, config["dedupe_threshold"])
+        if metrics is not None:
+            metrics.jobs_unique = len(jobs)
+    run_id = save_search_run(jobs, args.command, label, location, config, started_at)
+    extra = {} if run_id is None else {"run_id": run_id}
 
-        def is_valid_number(val):
-            """Check if value is a valid number (not None, not NaN)."""
-            if val is None:
-                return False
+    if not args.stream:
+        if seen_index is not None:
+            jobs = drop_seen_jobs(jobs, seen_index)
+
+        stats = None
+        if jobs:
+            cleansheet_jobs = externalize_descriptions(
+                iter_cleansheet_jobs(jobs), config["description_store"]
+            )
+            compact = args.compact or config["export_compact"]
             try:
-                return not math.isnan(float(val))
-            except (ValueError, TypeError):
-                return False
+                if args.upsert:
+                    stats, added, updated = upsert_export(
+                        cleansheet_jobs, filename, compact=compact, level=level
+                    )
+                    extra.update(added=added, updated=updated)
+                else:
+                    stats = write_export(
+                        cleansheet_jobs,
+                        filename,
+                        export_format,
+                        compact=compact,
+                        compression=compression,
+                        level=level,
+                    )
+            except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+                emit_event("error", message=f"Export failed: {e}")
+                return EXIT_ERROR
+            if seen_index is not None:
+                remember_exported_jobs(jobs, seen_index)
+    # Only now are the queries' jobs safely exported
+    record_harvest_runs(results, started_at, config)
+
+    if metrics is not None:
+        metrics.export = stats
+    failed = sum(1 for result in results if result.status != "ok")
+    elapsed = round(time.time() - started_at, 3)
+    if stats is None or not stats.jobs:
+        emit_event("done", jobs=0, failed_queries=failed, elapsed=elapsed)
+        return EXIT_INTERRUPTED if interrupted else EXIT_NO_JOBS
+
+    emit_event(
+        "done",
+        jobs=stats.jobs,
+        output=filename,
+        failed_queries=failed,
+        elapsed=elapsed,
+        raw_bytes=stats.raw_bytes,
+        file_bytes=stats.file_bytes,
+        compression=stats.compression,
+        write_seconds=round(stats.elapsed, 3),
+        **extra,
+    )
+    if interrupted:
+        return EXIT_INTERRUPTED
+    return EXIT_PARTIAL if failed else EXIT_OK
+
+
+def jittered(interval: float, jitter: float, rng: random.Random) -> float:
+    """Return interval varied at random by up to a fraction `jitter` either way."""
+    jitter = min(max(jitter, 0.0), 1.0)
+    return interval * rng.uniform(1 - jitter, 1 + jitter)
+
 
+def grid_schedule(path: str, config: dict) -> tuple[float, float]:
+    """Return a grid's (interval, jitter), which the grid file may override."""
+    try:
+        grid = load_search_grid(path)
+    except (OSError, json.JSONDecodeError, ValueError):
+        grid = {}  # Reported by the run itself
+    settings = {**config, **grid}
+    return float(settings["daemon_interval"]), float(settings["daemon_jitter"])
+
+
+def run_daemon(args: argparse.Namespace, config: dict) -> int:
+    """Run search grids over and over on jittered intervals until stopped.
+
+    Each grid runs like `batch`, one run at a time, then waits its interval
+    (varied by the jitter so runs drift apart) before running again. First runs
+    are spread evenly over one interval rather than all starting at once. The
+    process stays up between runs, so imports, per-board rate limiter state and
+    the search cache are reused, and config.json is read again before each run.
+    Ctrl-C or SIGTERM stops it between or during runs.
+
+    Returns:
+        EXIT_OK once stopped, or EXIT_ERROR if a grid can't be loaded at startup
+    """
+    if args.output or args.upsert:
+        emit_event("error", message="The daemon names its own exports; use --output-dir")
+        return EXIT_ERROR
+    for path in args.grids:
         try:
-            if is_valid_number(min_sal) and is_valid_number(max_sal):
-                salary = f"${int(min_sal):,} - ${int(max_sal):,}"
-            elif is_valid_number(min_sal):
-                salary = f"${int(min_sal):,}+"
-            elif is_valid_number(max_sal):
-                salary = f"Up to ${int(max_sal):,}"
-        except (ValueError, TypeError):
-            salary = ""
-
-        cleansheet_job = {
-            "id": str(uuid.uuid4()),
-            "company": str(job.get("company", "")),
-            "title": str(job.get("title", "")),
-            "location": str(job.get("location", "")),
-            "url": str(job.get("job_url", "")),
-            "description": str(job.get("description", "")),
-            "salary": salary,
-            "datePosted": date_posted,
-            "source": str(job.get("site", "")),
-            "status": "Saved",
-            "tags": [],
-        }
-        cleansheet_jobs.append(cleansheet_job)
+            load_search_grid(path)
+        except (OSError, json.JSONDecodeError, ValueError) as e:
+            emit_event("error", message=f"Could not load search grid {path}: {e}")
+            return EXIT_ERROR
 
-    # Wrap in Cleansheet import format
-    export_data = {"exportType": "jobspy_harvest", "jobs": cleansheet_jobs}
+    # Import the scraping stack while waiting for the first run, once for every run
+    preload_scraper()
+    rng = random.Random()
+    now = time.monotonic()
+    schedule = []
+    for i, path in enumerate(args.grids):
+        interval, _ = grid_schedule(path, config)
+        heapq.heappush(schedule, (now + interval * i / len(args.grids), i, path))
 
-    # Write file
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+
+    previous_handler = signal.signal(signal.SIGTERM, stop)
+    emit_event("daemon", grids=args.grids, pid=os.getpid())
+    runs = 0
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        while not args.runs or runs < args.runs:
+            due, i, path = heapq.heappop(schedule)
+            time.sleep(max(0.0, due - time.monotonic()))
 
-        console.print(f"\n[green]Exported {len(cleansheet_jobs)} jobs to {filename}[/]")
-        console.print("[dim]Import this file into Cleansheet Job Opportunities[/]")
+            run_config = apply_cli_overrides(load_config(), args)
+            run_args = argparse.Namespace(**{**vars(args), "command": "batch", "grid": path})
+            metrics_file = run_config["metrics_file"]
+            if metrics_file:
+                # One file per grid, so their series don't replace each other
+                metrics_path = Path(metrics_file)
+                metrics_file = str(
+                    metrics_path.with_name(f"{metrics_path.stem}_{Path(path).stem}.prom")
+                )
+            code = run_harvest_with_metrics(run_args, run_config, metrics_file)
+            runs += 1
+            if code == EXIT_INTERRUPTED:
+                break
+
+            delay = jittered(*grid_schedule(path, run_config), rng)
+            heapq.heappush(schedule, (time.monotonic() + delay, i, path))
+            emit_event("scheduled", grid=path, next_run=round(time.time() + delay, 3))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous_handler)
+    emit_event("stopped", runs=runs)
+    return EXIT_OK
+
+
+def emit_result_event(result: BoardResult) -> None:
+    """Report one finished query as a "board" progress event."""
+    emit_event(
+        "board",
+        board=result.board,
+        search_term=result.search_term,
+        location=result.location,
+        status=result.status,
+        rows=len(result.rows),
+        elapsed=round(result.elapsed, 3),
+        cache=result.cache,
+        error=result.error,
+    )
+
+
+def collect_headless_results(stream) -> tuple[list, bool]:
+    """Gather every BoardResult from a search, stopping early on Ctrl-C.
+
+    Returns:
+        Tuple of (list of BoardResults, whether the run was interrupted)
+    """
+    results = []
+    try:
+        for result in stream:
+            results.append(result)
+            emit_result_event(result)
+    except KeyboardInterrupt:
+        emit_event("cancelled", completed=len(results))
+        return results, True
+    return results, False
 
+
+def stream_headless_export(
+    stream,
+    filename: str,
+    config: dict,
+    seen_index: SeenUrlIndex | None,
+    compression: str = "",
+    level: int | None = None,
+) -> tuple[list, ExportStats, bool]:
+    """Write each query's new jobs as NDJSON the moment the query finishes.
+
+    Near-duplicate detection needs every row up front, so while streaming,
+    duplicates are only matched on exact URL or company/title/location keys
+    (or on the raw URL alone with dedupe off).
+
+    Returns:
+        Tuple of (list of BoardResults, ExportStats, whether the run was interrupted)
+
+    Raises:
+        OSError: If the output cannot be written
+    """
+    results = []
+    written_rows = []
+    seen_keys = set()
+    written_ids = set()
+    store = DescriptionStore(DESCRIPTION_STORE_DIR)
+    interrupted = False
+    start = time.perf_counter()
+    f = open_export(filename, compression, level)
+    try:
+        writer = ExportWriter(f, "ndjson")
+        try:
+            for result in stream:
+                results.append(result)
+                emit_result_event(result)
+
+                rows = result.rows
+                urls = rows.column("job_url")
+                postings = zip(
+                    urls,
+                    rows.column("company"),
+                    rows.column("title"),
+                    rows.column("location"),
+                    strict=True,
+                )
+                keep = []
+                for i, posting in enumerate(postings):
+                    if seen_index is not None and is_seen_url(urls[i], seen_index):
+                        continue
+                    if config["dedupe"]:
+                        keys = posting_keys(*posting)
+                    else:
+                        keys = [("raw_url", urls[i])] if urls[i] else []
+                    if any(key in seen_keys for key in keys):
+                        continue
+                    seen_keys.update(keys)
+                    keep.append(i)
+
+                new_rows = rows.take(keep)
+                new_jobs = iter_cleansheet_jobs(new_rows, written_ids)
+                for job in externalize_descriptions(new_jobs, config["description_store"], store):
+                    writer.write(job)
+                written_rows.append(new_rows)
+        except KeyboardInterrupt:
+            interrupted = True
+            emit_event("cancelled", completed=len(results))
+        writer.close()
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+    stats = ExportStats(
+        jobs=writer.count,
+        raw_bytes=writer.raw_bytes,
+        file_bytes=None if filename == "-" else os.path.getsize(filename),
+        elapsed=time.perf_counter() - start,
+        compression=compression,
+    )
+    # Streamed writes overlap the scrape, so this phase is part of its time too
+    TIMINGS.add("export", stats.elapsed, stats.jobs, stats.raw_bytes)
+    exported = JobRows.concat(written_rows)
+    if seen_index is not None and len(exported):
+        remember_exported_jobs(exported, seen_index)
+    return results, stats, interrupted
+
+
+def start_profile() -> cProfile.Profile:
+    """Start profiling the main thread and timing phases from zero."""
+    TIMINGS.reset()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def finish_profile(profiler: cProfile.Profile, filename: str, headless: bool = False) -> None:
+    """Stop profiling, write the pstats dump and report the phase timings."""
+    profiler.disable()
+    error = None
+    try:
+        profiler.dump_stats(filename)
     except OSError as e:
-        console.print(f"[red]Export failed: {e}[/]")
+        error = f"Could not write profile: {e}"
+
+    if headless:
+        fields = {"error": error} if error else {"output": filename}
+        emit_event("profile", **fields, phases=TIMINGS.summary())
+        return
+    display_phase_timings(TIMINGS.summary())
+    if error:
+        console.print(f"[yellow]{error}[/]")
+    else:
+        console.print(
+            f"[dim]Profile written to {filename} (view with: python -m pstats {filename})[/]"
+        )
+
+
+def display_phase_timings(phases: list) -> None:
+    """Display time, rows and bytes per phase, with each phase's parts indented."""
+    if not phases:
+        return
+    table = Table(title="Phase Timings", box=box.SIMPLE)
+    table.add_column("Phase")
+    table.add_column("Calls", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Rows", justify="right")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Rows/s", justify="right")
+    for phase in phases:
+        parent, _, part = phase["phase"].partition(".")
+        seconds = phase["seconds"]
+        rate = phase["rows"] / seconds if phase["rows"] and seconds > 0 else None
+        table.add_row(
+            f"  [dim]{part}[/]" if part else f"[bold]{parent}[/]",
+            str(phase["calls"]),
+            f"{seconds:.3f}s",
+            f"{phase['rows']:,}" if phase["rows"] else "",
+            format_bytes(phase["bytes"]) if phase["bytes"] else "",
+            f"{rate:,.0f}" if rate else "",
+        )
+    console.print(table)
 
 
-def main():
-    """Main application loop."""
+def main(argv: list | None = None):
+    """Main application loop, or a headless run when command-line arguments are given."""
+    if argv:
+        args = build_arg_parser().parse_args(argv)
+        profile = getattr(args, "profile", None)
+        profiler = start_profile() if profile else None
+        # Nothing but the export itself may reach stdout in headless mode
+        console.quiet = True
+        try:
+            return run_headless(args)
+        finally:
+            console.quiet = False
+            if profiler is not None:
+                finish_profile(profiler, profile, headless=True)
+
+    # Load the scraping stack while the user reads the menu
+    preload_scraper()
     display_banner()
 
     config = load_config()
+    profiler = start_profile() if config.get("profile") else None
     jobs = []
     last_search_term = ""
+    harvest_runs = {}
 
     while True:
         choice = display_main_menu()
 
         if choice == "1":
-            jobs, last_search_term = search_jobs(config)
+            harvest_runs = {}
+            jobs, last_search_term = search_jobs(config, harvest_runs)
         elif choice == "2":
             config = display_settings_menu(config)
         elif choice == "3":
-            export_jobs(jobs, last_search_term)
+            export_jobs(
+                jobs,
+                last_search_term,
+                incremental=incremental_enabled(config),
+                compact=config.get("export_compact", False),
+                compression=config.get("export_compression", ""),
+                compression_level=config.get("export_compression_level", EXPORT_COMPRESSION_LEVEL),
+                description_store=config.get("description_store", "off"),
+                harvest_runs=harvest_runs,
+            )
         elif choice == "4":
+            if profiler is not None:
+                finish_profile(profiler, str(PROFILE_PATH))
             console.print("\n[bold blue]Goodbye![/]\n")
             break
+        elif choice == "5":
+            harvest_runs = {}
+            jobs, last_search_term = batch_search(config, harvest_runs)
+        elif choice in ("6", "7"):
+            load = load_saved_search if choice == "6" else search_saved_jobs
+            saved_jobs, saved_label = load(config)
+            if saved_jobs:
+                jobs, last_search_term = saved_jobs, saved_label
+                harvest_runs = {}
+        elif choice == "8":
+            browse_jobs(jobs)
+
+
+def cli() -> None:
+    """Console script entry point."""
+    sys.exit(main(sys.argv[1:]))
 
 
 if __name__ == "__main__":
-    main()
+    cli()
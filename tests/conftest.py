@@ -7,6 +7,34 @@ import pandas as pd
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_session(tmp_path, monkeypatch):
+    """Keep tests away from the real config.json and cache, and unthrottle boards."""
+    import jobpacker
+
+    monkeypatch.setattr(jobpacker, "CONFIG_PATH", tmp_path / "config.json")
+    monkeypatch.setattr(jobpacker, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(jobpacker, "HARVEST_STATE_PATH", tmp_path / "harvest_state.json")
+    monkeypatch.setattr(jobpacker, "SEEN_INDEX_PATH", tmp_path / "seen_urls.idx")
+    monkeypatch.setattr(jobpacker, "DESCRIPTION_STORE_DIR", tmp_path / "descriptions")
+    monkeypatch.setattr(jobpacker, "JOB_STORE_PATH", tmp_path / "jobs.db")
+    monkeypatch.setattr(jobpacker, "PROFILE_PATH", tmp_path / "jobpacker.prof")
+    monkeypatch.setattr(
+        jobpacker,
+        "DEFAULT_RATE_LIMITS",
+        {
+            board: {"rate": 1000.0, "burst": 1000, "concurrency": 8, "max_concurrency": 8}
+            for board in jobpacker.ALL_JOB_BOARDS
+        },
+    )
+    jobpacker.RATE_LIMITERS.clear()
+    jobpacker.RECORDINGS.clear()
+    jobpacker.TIMINGS.reset()
+    yield
+    jobpacker.RATE_LIMITERS.clear()
+    jobpacker.RECORDINGS.clear()
+
+
 @pytest.fixture
 def default_config():
     """Return the default configuration dict."""
@@ -17,6 +45,33 @@ def default_config():
         "remote_only": False,
         "job_type": None,
         "job_boards": ["indeed", "linkedin", "glassdoor", "zip_recruiter", "google"],
+        "board_timeout": 120,
+        "search_timeout": 300,
+        "batch_max_workers": 8,
+        "batch_board_concurrency": 2,
+        "batch_timeout": 3600,
+        "rate_limits": {},
+        "rate_limit_latency_target": 30,
+        "cache_ttl": 3600,
+        "cache_stale_ttl": 86400,
+        "cache_max_mb": 200,
+        "incremental": False,
+        "dedupe": True,
+        "dedupe_threshold": 0.8,
+        "export_compact": False,
+        "export_compression": "",
+        "export_compression_level": 6,
+        "description_store": "off",
+        "job_store": True,
+        "record_dir": "",
+        "replay_dir": "",
+        "replay_speed": "original",
+        "mock_board_url": "",
+        "profile": False,
+        "metrics_file": "",
+        "export_dir": "",
+        "daemon_interval": 3600,
+        "daemon_jitter": 0.1,
     }
 
 
@@ -30,6 +85,33 @@ def custom_config():
         "remote_only": True,
         "job_type": "fulltime",
         "job_boards": ["indeed", "linkedin"],
+        "board_timeout": 60,
+        "search_timeout": 90,
+        "batch_max_workers": 4,
+        "batch_board_concurrency": 1,
+        "batch_timeout": 600,
+        "rate_limits": {"linkedin": {"rate": 0.1}},
+        "rate_limit_latency_target": 20,
+        "cache_ttl": 600,
+        "cache_stale_ttl": 0,
+        "cache_max_mb": 50,
+        "incremental": False,
+        "dedupe": True,
+        "dedupe_threshold": 0.8,
+        "export_compact": False,
+        "export_compression": "",
+        "export_compression_level": 6,
+        "description_store": "off",
+        "job_store": True,
+        "record_dir": "",
+        "replay_dir": "",
+        "replay_speed": "original",
+        "mock_board_url": "",
+        "profile": False,
+        "metrics_file": "",
+        "export_dir": "",
+        "daemon_interval": 3600,
+        "daemon_jitter": 0.1,
     }
 
 
@@ -0,0 +1,250 @@
+"""Tests for batch search grids and the query scheduler."""
+
+import io
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+
+@pytest.fixture
+def grid_file(tmp_path):
+    """Create a search grid file with two terms and two locations."""
+    grid = {
+        "search_terms": ["python developer", "data engineer"],
+        "locations": ["New York, NY", "Remote"],
+        "job_boards": ["indeed", "linkedin"],
+        "results_per_site": 5,
+    }
+    path = tmp_path / "morning.json"
+    path.write_text(json.dumps(grid))
+    return path
+
+
+class TestLoadSearchGrid:
+    """Tests for load_search_grid function."""
+
+    def test_loads_valid_grid(self, grid_file):
+        """Should return the parsed grid."""
+        import jobpacker
+
+        grid = jobpacker.load_search_grid(grid_file)
+
+        assert grid["search_terms"] == ["python developer", "data engineer"]
+        assert grid["locations"] == ["New York, NY", "Remote"]
+
+    def test_rejects_missing_terms(self, tmp_path):
+        """A grid without search_terms should raise ValueError."""
+        import jobpacker
+
+        path = tmp_path / "grid.json"
+        path.write_text(json.dumps({"locations": ["USA"]}))
+
+        with pytest.raises(ValueError, match="search_terms"):
+            jobpacker.load_search_grid(path)
+
+    def test_rejects_blank_location(self, tmp_path):
+        """Blank locations should raise ValueError."""
+        import jobpacker
+
+        path = tmp_path / "grid.json"
+        path.write_text(json.dumps({"search_terms": ["python"], "locations": ["  "]}))
+
+        with pytest.raises(ValueError, match="locations"):
+            jobpacker.load_search_grid(path)
+
+    def test_rejects_unknown_board(self, tmp_path):
+        """Boards outside ALL_JOB_BOARDS should raise ValueError."""
+        import jobpacker
+
+        path = tmp_path / "grid.json"
+        path.write_text(
+            json.dumps({"search_terms": ["a"], "locations": ["b"], "job_boards": ["monster"]})
+        )
+
+        with pytest.raises(ValueError, match="monster"):
+            jobpacker.load_search_grid(path)
+
+
+class TestBuildSearchQueries:
+    """Tests for build_search_queries function."""
+
+    def test_full_cross_product(self):
+        """Should produce terms x locations x boards queries."""
+        import jobpacker
+
+        grid = {"search_terms": ["a", "b"], "locations": ["x", "y", "z"]}
+
+        queries = jobpacker.build_search_queries(grid, ["indeed", "linkedin"])
+
+        assert len(queries) == 12
+        assert len(set(queries)) == 12
+
+    def test_boards_vary_fastest(self):
+        """Consecutive queries should alternate between boards."""
+        import jobpacker
+
+        grid = {"search_terms": ["a"], "locations": ["x", "y"]}
+
+        queries = jobpacker.build_search_queries(grid, ["indeed", "linkedin"])
+
+        assert [board for board, _, _ in queries] == ["indeed", "linkedin", "indeed", "linkedin"]
+
+
+class TestSearchScheduler:
+    """Tests for iter_search_results concurrency limits."""
+
+    def _track_concurrency(self, sample_jobspy_dataframe):
+        lock = threading.Lock()
+        running = {"total": 0, "peak_total": 0}
+        per_board = {}
+        peak_board = {}
+
+        def fake_scrape(site_name, **kwargs):
+            board = site_name[0]
+            with lock:
+                running["total"] += 1
+                running["peak_total"] = max(running["peak_total"], running["total"])
+                per_board[board] = per_board.get(board, 0) + 1
+                peak_board[board] = max(peak_board.get(board, 0), per_board[board])
+            time.sleep(0.03)
+            with lock:
+                running["total"] -= 1
+                per_board[board] -= 1
+            return sample_jobspy_dataframe
+
+        return fake_scrape, running, peak_board
+
+    def test_respects_per_board_limit(self, default_config, sample_jobspy_dataframe, monkeypatch):
+        """No board should ever exceed board_concurrency running queries."""
+        import jobpacker
+
+        monkeypatch.setattr(jobpacker, "DEADLINE_POLL_INTERVAL", 0.01)
+        fake_scrape, _, peak_board = self._track_concurrency(sample_jobspy_dataframe)
+        queries = [("indeed", f"term {i}", "USA") for i in range(6)]
+        queries += [("linkedin", f"term {i}", "USA") for i in range(6)]
+
+        with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+            results = list(jobpacker.iter_search_results(queries, default_config, 60, 8, 2))
+
+        assert len(results) == 12
+        assert all(r.status == "ok" for r in results)
+        assert max(peak_board.values()) <= 2
+
+    def test_respects_global_limit(self, default_config, sample_jobspy_dataframe, monkeypatch):
+        """No more than max_workers queries should run at once."""
+        import jobpacker
+
+        monkeypatch.setattr(jobpacker, "DEADLINE_POLL_INTERVAL", 0.01)
+        fake_scrape, running, _ = self._track_concurrency(sample_jobspy_dataframe)
+        queries = [(board, "python", "USA") for board in jobpacker.ALL_JOB_BOARDS] * 2
+
+        with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+            results = list(jobpacker.iter_search_results(queries, default_config, 60, 3))
+
+        assert len(results) == 10
+        assert running["peak_total"] <= 3
+
+    def test_results_carry_query(self, default_config, sample_jobspy_dataframe):
+        """Each result should record the term and location it was run for."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            results = list(
+                jobpacker.iter_search_results(
+                    [("indeed", "python", "Remote")], default_config, 60, 2
+                )
+            )
+
+        assert (results[0].search_term, results[0].location) == ("python", "Remote")
+
+
+class TestMergeJobRows:
+    """Tests for merge_job_rows function."""
+
+    def test_drops_repeated_urls(self, sample_jobspy_jobs):
+        """The same job_url returned by two queries should appear once."""
+        import jobpacker
+
+        results = [
+            jobpacker.BoardResult("indeed", rows=list(sample_jobspy_jobs)),
+            jobpacker.BoardResult("indeed", rows=list(sample_jobspy_jobs)),
+        ]
+
+        jobs = jobpacker.merge_job_rows(results)
+
+        assert len(jobs) == len(sample_jobspy_jobs)
+
+    def test_keeps_rows_without_url(self):
+        """Rows without a job_url cannot be matched and should all be kept."""
+        import jobpacker
+
+        results = [jobpacker.BoardResult("google", rows=[{"title": "A"}, {"title": "B"}])]
+
+        assert len(jobpacker.merge_job_rows(results)) == 2
+
+
+class TestBatchSearch:
+    """Tests for the interactive batch_search function."""
+
+    def test_runs_grid_and_returns_merged_jobs(
+        self, default_config, grid_file, sample_jobspy_dataframe, monkeypatch
+    ):
+        """Should scrape every query and return the merged jobs with the grid name."""
+        import jobpacker
+
+        # Progress bars need a real console to measure, so render into a buffer
+        monkeypatch.setattr(jobpacker, "console", Console(file=io.StringIO()))
+
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(grid_file)):
+            with patch.object(
+                jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe
+            ) as mock_scrape:
+                with patch.object(jobpacker, "display_jobs_table"):
+                    jobs, label = jobpacker.batch_search(default_config)
+
+        # 2 terms x 2 locations x 2 boards from the grid file
+        assert mock_scrape.call_count == 8
+        assert all(call.kwargs["results_wanted"] == 5 for call in mock_scrape.call_args_list)
+        assert len(jobs) == len(sample_jobspy_dataframe)
+        assert label == "morning"
+
+    def test_grid_settings_key_the_harvest_state(
+        self, default_config, tmp_path, sample_jobspy_dataframe, monkeypatch
+    ):
+        """A grid's remote_only should apply to the incremental window it records and reads."""
+        import jobpacker
+
+        monkeypatch.setattr(jobpacker, "console", Console(file=io.StringIO()))
+        grid_file = tmp_path / "remote.json"
+        grid = {"search_terms": ["py"], "locations": ["USA"], "job_boards": ["linkedin"]}
+        grid_file.write_text(json.dumps({**grid, "remote_only": True}))
+        config = {**default_config, "incremental": True}
+
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(grid_file)):
+            with patch.object(
+                jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe
+            ) as mock_scrape:
+                with patch.object(jobpacker, "display_jobs_table"):
+                    harvest_runs = {}
+                    jobpacker.batch_search(config, harvest_runs)
+                    jobpacker.save_harvest_runs(harvest_runs)
+                    jobpacker.batch_search(config)
+
+        assert [call.kwargs["hours_old"] for call in mock_scrape.call_args_list] == [
+            None,
+            1 + jobpacker.INCREMENTAL_OVERLAP_HOURS,
+        ]
+
+    def test_bad_grid_file_returns_empty(self, default_config, tmp_path, mock_console):
+        """An unreadable grid should print an error and return no jobs."""
+        import jobpacker
+
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(tmp_path / "missing.json")):
+            jobs, label = jobpacker.batch_search(default_config)
+
+        assert (jobs, label) == ([], "")
+        mock_console.print.assert_called()
@@ -0,0 +1,110 @@
+"""Tests for the benchmark suite and its synthetic data."""
+
+import json
+from datetime import date
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture(scope="module")
+def frame():
+    """Return 2,000 synthetic rows."""
+    from benchmarks.synthetic import synthetic_jobs
+
+    return synthetic_jobs(2000)
+
+
+class TestSyntheticJobs:
+    """Tests for the synthetic jobspy results."""
+
+    def test_same_seed_same_rows(self):
+        """Generation should be reproducible."""
+        from benchmarks.synthetic import synthetic_jobs
+
+        pd.testing.assert_frame_equal(synthetic_jobs(50, seed=3), synthetic_jobs(50, seed=3))
+
+    def test_looks_like_jobspy_results(self, frame):
+        """Rows should have unique URLs, missing salaries, mixed dates and markdown."""
+        assert len(frame) == 2000
+        assert frame["job_url"].is_unique
+        assert 0.4 < frame["min_amount"].isna().mean() < 0.8
+        assert {type(value) for value in frame["date_posted"]} >= {date, str, type(None)}
+        assert frame["description"].dropna().str.startswith("## About the role").all()
+        assert frame["description"].isna().any()
+
+    def test_converts_and_dedupes(self, frame):
+        """The rows should go through conversion, and reposts should be merged."""
+        import jobpacker
+
+        jobs = jobpacker.JobRows.from_frame(frame)
+
+        assert len(jobpacker.to_cleansheet_jobs(jobs[:100])) == 100
+        assert len(jobpacker.dedupe_jobs(jobs)) < len(jobs)
+
+
+class TestBenchmarkRunner:
+    """Tests for running benchmarks and comparing them with a baseline."""
+
+    def test_parse_sizes(self):
+        """Size labels and plain numbers should both be accepted."""
+        import argparse
+
+        from benchmarks.bench import parse_sizes
+
+        assert parse_sizes("1k, 250") == [("1k", 1000), ("250", 250)]
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_sizes("huge")
+
+    def test_compare_ignores_noise(self):
+        """Only changes beyond both the tolerance and the noise floor should count."""
+        from benchmarks.bench import compare
+
+        baseline = {
+            "a/1k": {"seconds": 0.001, "peak_mb": 0.5},
+            "b/1k": {"seconds": 1.0, "peak_mb": 10.0},
+        }
+        results = {
+            "a/1k": {"seconds": 0.003, "peak_mb": 1.2},
+            "b/1k": {"seconds": 1.5, "peak_mb": 20.0},
+            "c/1k": {"seconds": 9.0, "peak_mb": 90.0},
+        }
+
+        assert compare(results, baseline) == [
+            "b/1k: 1.000s -> 1.500s",
+            "b/1k: 10.0 MB -> 20.0 MB",
+        ]
+
+    def test_save_then_compare(self, tmp_path, capsys, monkeypatch):
+        """Saved results should become the baseline the next run is checked against."""
+        from benchmarks import bench
+
+        baseline = tmp_path / "baseline.json"
+        args = ["--sizes", "200", "-k", "to_rows", "--baseline", str(baseline)]
+
+        assert bench.main([*args, "--save", "--repeat", "1"]) == 0
+        saved = json.loads(baseline.read_text())
+        assert list(saved["results"]) == ["frame_to_rows/200"]
+        assert saved["results"]["frame_to_rows/200"]["rows"] == 200
+
+        saved["results"]["frame_to_rows/200"].update(seconds=1e-9, peak_mb=0.0)
+        baseline.write_text(json.dumps(saved))
+        monkeypatch.setattr(bench, "MIN_SECONDS", 0)
+        assert bench.main([*args, "--tolerance", "0", "--no-memory"]) == 1
+        assert "Regression: frame_to_rows/200" in capsys.readouterr().out
+
+    def test_benchmarks_do_not_touch_real_files(self, tmp_path):
+        """Every benchmark should run against a scratch directory."""
+        import jobpacker
+        from benchmarks import bench
+
+        config_path = jobpacker.CONFIG_PATH
+        results = bench.run_benchmarks(
+            [("100", 100)], list(bench.BENCHMARKS), memory=False, repeat=1
+        )
+
+        assert set(results) == {
+            f"{name}/100" if sized else name for name, (_, sized) in bench.BENCHMARKS.items()
+        }
+        assert jobpacker.CONFIG_PATH == config_path
+        assert not config_path.exists()
@@ -0,0 +1,204 @@
+"""Tests for the on-disk search result cache."""
+
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+
+def make_cache(tmp_path, ttl=60, stale_ttl=0, max_bytes=10_000_000):
+    """Build a ResultCache in a temporary directory."""
+    import jobpacker
+
+    return jobpacker.ResultCache(tmp_path / "cache", ttl, stale_ttl, max_bytes)
+
+
+def age_entry(cache, key, seconds):
+    """Pretend an entry was created `seconds` ago."""
+    import pickle
+
+    path = cache.directory / f"{key}.pkl"
+    with open(path, "rb") as f:
+        entry = pickle.load(f)
+    entry["created"] -= seconds
+    with open(path, "wb") as f:
+        pickle.dump(entry, f)
+
+
+class TestCacheKey:
+    """Tests for ResultCache.key."""
+
+    def test_key_ignores_case_and_whitespace(self, default_config):
+        """Equivalent searches should share a key."""
+        import jobpacker
+
+        first = jobpacker.ResultCache.key("indeed", "Python Dev", "USA", default_config)
+        second = jobpacker.ResultCache.key("indeed", " python dev ", "usa", default_config)
+
+        assert first == second
+
+    def test_key_depends_on_search_settings(self, default_config):
+        """Board, remote_only, job_type and results_per_site should change the key."""
+        import jobpacker
+
+        base = jobpacker.ResultCache.key("indeed", "python", "USA", default_config)
+        variants = [
+            jobpacker.ResultCache.key("linkedin", "python", "USA", default_config),
+            jobpacker.ResultCache.key(
+                "indeed", "python", "USA", {**default_config, "remote_only": True}
+            ),
+            jobpacker.ResultCache.key(
+                "indeed", "python", "USA", {**default_config, "job_type": "contract"}
+            ),
+            jobpacker.ResultCache.key(
+                "indeed", "python", "USA", {**default_config, "results_per_site": 99}
+            ),
+        ]
+
+        assert base not in variants
+        assert len(set(variants)) == len(variants)
+
+
+class TestResultCache:
+    """Tests for ResultCache storage, expiry and eviction."""
+
+    def test_round_trip_preserves_dataframe(self, tmp_path, sample_jobspy_dataframe):
+        """Cached results should come back unchanged."""
+        cache = make_cache(tmp_path)
+
+        cache.put("abc", sample_jobspy_dataframe)
+        results, age = cache.get("abc")
+
+        pd.testing.assert_frame_equal(results, sample_jobspy_dataframe)
+        assert age < 5
+
+    def test_missing_entry_returns_none(self, tmp_path):
+        """Unknown keys should miss."""
+        assert make_cache(tmp_path).get("nope") is None
+
+    def test_entry_past_stale_ttl_misses(self, tmp_path, sample_jobspy_dataframe):
+        """Entries older than the stale window should not be served."""
+        cache = make_cache(tmp_path, ttl=60, stale_ttl=120)
+        cache.put("abc", sample_jobspy_dataframe)
+
+        age_entry(cache, "abc", 300)
+
+        assert cache.get("abc") is None
+
+    def test_evicts_least_recently_used(self, tmp_path, sample_jobspy_dataframe):
+        """Going over max_bytes should delete the least recently used entry first."""
+        cache = make_cache(tmp_path)
+        cache.put("old", sample_jobspy_dataframe)
+        cache.put("new", sample_jobspy_dataframe)
+        entry_size = (cache.directory / "old.pkl").stat().st_size
+
+        # Make "old" the least recently used, then shrink the cache to fit two entries
+        past = time.time() - 100
+        os.utime(cache.directory / "old.pkl", (past, past))
+        cache.max_bytes = entry_size * 2 + 1
+        cache.put("third", sample_jobspy_dataframe)
+
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
+        assert cache.get("third") is not None
+
+    def test_corrupt_entry_misses(self, tmp_path):
+        """Unreadable files should be treated as a miss."""
+        cache = make_cache(tmp_path)
+        cache.directory.mkdir(parents=True)
+        (cache.directory / "bad.pkl").write_bytes(b"not a pickle")
+
+        assert cache.get("bad") is None
+
+
+class TestFetchBoard:
+    """Tests for fetch_board cache integration."""
+
+    def test_repeat_search_skips_board(self, default_config, sample_jobspy_dataframe):
+        """A second identical search should be served from cache."""
+        import jobpacker
+
+        mock_scrape = MagicMock(return_value=sample_jobspy_dataframe)
+
+        with patch.object(jobpacker, "scrape_jobs", mock_scrape):
+            _, first = jobpacker.fetch_board("indeed", "python", "USA", default_config)
+            results, second = jobpacker.fetch_board("indeed", "python", "USA", default_config)
+
+        assert mock_scrape.call_count == 1
+        assert (first, second) == ("", "hit")
+        assert len(results) == len(sample_jobspy_dataframe)
+
+    def test_empty_results_not_cached(self, default_config):
+        """Empty results may be a block and should not be cached."""
+        import jobpacker
+
+        mock_scrape = MagicMock(return_value=pd.DataFrame())
+
+        with patch.object(jobpacker, "scrape_jobs", mock_scrape):
+            jobpacker.fetch_board("indeed", "python", "USA", default_config)
+            jobpacker.fetch_board("indeed", "python", "USA", default_config)
+
+        assert mock_scrape.call_count == 2
+
+    def test_disabled_cache_always_scrapes(self, default_config, sample_jobspy_dataframe):
+        """cache_ttl of 0 should bypass the cache."""
+        import jobpacker
+
+        config = {**default_config, "cache_ttl": 0}
+        mock_scrape = MagicMock(return_value=sample_jobspy_dataframe)
+
+        with patch.object(jobpacker, "scrape_jobs", mock_scrape):
+            jobpacker.fetch_board("indeed", "python", "USA", config)
+            _, status = jobpacker.fetch_board("indeed", "python", "USA", config)
+
+        assert mock_scrape.call_count == 2
+        assert status == ""
+
+    def test_incremental_window_not_served_to_full_search(
+        self, default_config, sample_jobspy_dataframe
+    ):
+        """An incremental fetch's narrow window should not be cached for ordinary searches."""
+        import jobpacker
+
+        incremental = {**default_config, "incremental": True}
+        result = jobpacker.BoardResult("google", search_term="python", location="USA")
+        jobpacker.record_harvest_runs([result], time.time() - 60, incremental)
+        mock_scrape = MagicMock(
+            side_effect=[sample_jobspy_dataframe.head(1), sample_jobspy_dataframe]
+        )
+
+        with patch.object(jobpacker, "scrape_jobs", mock_scrape):
+            jobpacker.fetch_board("google", "python", "USA", incremental)
+            results, status = jobpacker.fetch_board("google", "python", "USA", default_config)
+
+        assert mock_scrape.call_count == 2
+        assert mock_scrape.call_args.kwargs["hours_old"] is None
+        assert status == ""
+        assert len(results) == len(sample_jobspy_dataframe)
+
+    def test_stale_entry_served_and_refreshed(self, default_config, sample_jobspy_dataframe):
+        """Stale entries should be returned at once and refreshed in the background."""
+        import jobpacker
+
+        config = {**default_config, "cache_ttl": 60, "cache_stale_ttl": 3600}
+        cache = jobpacker.ResultCache.from_config(config)
+        key = jobpacker.ResultCache.key("indeed", "python", "USA", config)
+        cache.put(key, sample_jobspy_dataframe)
+        age_entry(cache, key, 120)
+
+        fresh = sample_jobspy_dataframe.head(1)
+        with patch.object(jobpacker, "scrape_jobs", return_value=fresh) as mock_scrape:
+            results, status = jobpacker.fetch_board("indeed", "python", "USA", config)
+            assert status == "stale"
+            assert len(results) == len(sample_jobspy_dataframe)
+
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                cached = cache.get(key)
+                if cached is not None and cached[1] < 60:
+                    break
+                time.sleep(0.01)
+
+        mock_scrape.assert_called_once()
+        assert len(cache.get(key)[0]) == 1
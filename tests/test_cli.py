@@ -0,0 +1,289 @@
+"""Tests for the headless command-line mode."""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+
+def read_events(capsys):
+    """Return the JSON progress events written to stderr."""
+    return [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+
+
+class TestArgParser:
+    """Tests for build_arg_parser function."""
+
+    def test_search_requires_term(self):
+        """A search without --term should be a usage error."""
+        import jobpacker
+
+        with pytest.raises(SystemExit) as exc:
+            jobpacker.build_arg_parser().parse_args(["search"])
+
+        assert exc.value.code == 2
+
+    def test_overrides_apply_to_config(self, default_config):
+        """Command-line options should override the saved settings."""
+        import jobpacker
+
+        args = jobpacker.build_arg_parser().parse_args(
+            ["search", "-t", "python", "-b", "indeed,google", "-n", "5", "--remote"]
+        )
+
+        config = jobpacker.apply_cli_overrides(default_config, args)
+
+        assert config["job_boards"] == ["indeed", "google"]
+        assert config["results_per_site"] == 5
+        assert config["remote_only"] is True
+        assert default_config["results_per_site"] == 15
+
+    def test_unknown_board_rejected(self, default_config):
+        """Boards outside ALL_JOB_BOARDS should raise ValueError."""
+        import jobpacker
+
+        args = jobpacker.build_arg_parser().parse_args(["search", "-t", "x", "-b", "monster"])
+
+        with pytest.raises(ValueError, match="monster"):
+            jobpacker.apply_cli_overrides(default_config, args)
+
+
+class TestHeadlessSearch:
+    """Tests for headless search runs."""
+
+    def test_writes_export_and_returns_ok(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """A successful search should write the file and exit 0."""
+        import jobpacker
+
+        output = tmp_path / "out.json"
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            code = jobpacker.main(["search", "-t", "python", "-b", "indeed", "-o", str(output)])
+
+        assert code == jobpacker.EXIT_OK
+        data = json.loads(output.read_text())
+        assert data["exportType"] == "jobspy_harvest"
+        assert len(data["jobs"]) == len(sample_jobspy_dataframe)
+        events = read_events(capsys)
+        assert [e["event"] for e in events] == ["start", "board", "done"]
+        assert events[-1]["jobs"] == len(sample_jobspy_dataframe)
+
+    def test_ndjson_to_stdout(self, capsys, sample_jobspy_dataframe):
+        """--format ndjson -o - should stream one job per stdout line and nothing else."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            code = jobpacker.main(
+                ["search", "-t", "python", "-b", "indeed", "-o", "-", "-f", "ndjson"]
+            )
+
+        lines = capsys.readouterr().out.splitlines()
+        assert code == jobpacker.EXIT_OK
+        assert len(lines) == len(sample_jobspy_dataframe)
+        assert all("title" in json.loads(line) for line in lines)
+
+    def test_no_jobs_exit_code(self, tmp_path, capsys):
+        """An empty search should write nothing and exit with EXIT_NO_JOBS."""
+        import jobpacker
+
+        output = tmp_path / "out.json"
+        with patch.object(jobpacker, "scrape_jobs", return_value=pd.DataFrame()):
+            code = jobpacker.main(["search", "-t", "python", "-b", "indeed", "-o", str(output)])
+
+        assert code == jobpacker.EXIT_NO_JOBS
+        assert not output.exists()
+
+    def test_failed_board_exit_code(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """Jobs written while another board failed should exit with EXIT_PARTIAL."""
+        import jobpacker
+
+        def fake_scrape(site_name, **kwargs):
+            if site_name == ["linkedin"]:
+                raise RuntimeError("blocked")
+            return sample_jobspy_dataframe
+
+        output = tmp_path / "out.json"
+        with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+            code = jobpacker.main(
+                ["search", "-t", "python", "-b", "indeed,linkedin", "-o", str(output)]
+            )
+
+        assert code == jobpacker.EXIT_PARTIAL
+        assert output.exists()
+        boards = {e["board"]: e for e in read_events(capsys) if e["event"] == "board"}
+        assert boards["linkedin"]["status"] == "error"
+        assert "blocked" in boards["linkedin"]["error"]
+
+    def test_bad_board_exit_code(self, capsys):
+        """An unknown board should report an error event and exit 1."""
+        import jobpacker
+
+        code = jobpacker.main(["search", "-t", "python", "-b", "monster"])
+
+        assert code == jobpacker.EXIT_ERROR
+        assert read_events(capsys)[0]["event"] == "error"
+
+    def test_incremental_skips_exported_jobs(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """A second incremental run with nothing new should exit with EXIT_NO_JOBS."""
+        import jobpacker
+
+        argv = ["search", "-t", "python", "-b", "indeed", "--incremental", "-o"]
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            first = jobpacker.main(argv + [str(tmp_path / "a.json")])
+            second = jobpacker.main(argv + [str(tmp_path / "b.json")])
+
+        assert (first, second) == (jobpacker.EXIT_OK, jobpacker.EXIT_NO_JOBS)
+
+    def test_failed_export_keeps_window(
+        self, default_config, tmp_path, capsys, sample_jobspy_dataframe
+    ):
+        """A run whose export fails should not move the next run's incremental window."""
+        import jobpacker
+
+        jobpacker.save_config({**default_config, "cache_ttl": 0})
+        argv = ["search", "-t", "python", "-b", "linkedin", "--incremental", "-o"]
+        with patch.object(
+            jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe
+        ) as mock_scrape:
+            failed = jobpacker.main(argv + [str(tmp_path / "missing" / "a.json")])
+            jobpacker.main(argv + [str(tmp_path / "b.json")])
+            jobpacker.main(argv + [str(tmp_path / "c.json")])
+
+        windows = [call.kwargs["hours_old"] for call in mock_scrape.call_args_list]
+        assert failed == jobpacker.EXIT_ERROR
+        assert windows == [None, None, 1 + jobpacker.INCREMENTAL_OVERLAP_HOURS]
+
+    def test_console_restored(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """The shared console should be usable again after a headless run."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(["search", "-t", "python", "-b", "indeed", "-o", str(tmp_path / "o")])
+
+        assert jobpacker.console.quiet is False
+
+    def test_stuck_board_does_not_keep_process_alive(self, tmp_path):
+        """A board that never answers should not stop the process exiting after its timeout."""
+        import jobpacker
+
+        script = tmp_path / "stuck.py"
+        script.write_text(textwrap.dedent(f"""
+                import sys, threading
+                from pathlib import Path
+                sys.path.insert(0, {str(Path(jobpacker.__file__).parent)!r})
+                import jobpacker
+
+                tmp = Path({str(tmp_path)!r})
+                for name in ("CONFIG_PATH", "CACHE_DIR", "HARVEST_STATE_PATH", "SEEN_INDEX_PATH",
+                             "DESCRIPTION_STORE_DIR", "JOB_STORE_PATH"):
+                    setattr(jobpacker, name, tmp / name.lower())
+                jobpacker.scrape_jobs = lambda **kwargs: threading.Event().wait()
+                jobpacker.save_config({{**jobpacker.DEFAULT_CONFIG, "board_timeout": 0.2}})
+                sys.exit(jobpacker.main(["search", "-t", "python", "-b", "indeed", "-o", "-"]))
+                """))
+
+        process = subprocess.run([sys.executable, str(script)], capture_output=True, timeout=60)
+
+        assert process.returncode == jobpacker.EXIT_NO_JOBS
+        assert b'"status": "timeout"' in process.stderr
+
+
+class TestHeadlessBatch:
+    """Tests for headless batch runs."""
+
+    def test_runs_grid(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """Every grid query should run and the merged jobs should be written."""
+        import jobpacker
+
+        grid = tmp_path / "grid.json"
+        grid.write_text(
+            json.dumps({"search_terms": ["a", "b"], "locations": ["USA"], "job_boards": ["indeed"]})
+        )
+        output = tmp_path / "out.json"
+
+        with patch.object(
+            jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe
+        ) as mock_scrape:
+            code = jobpacker.main(["batch", str(grid), "-o", str(output)])
+
+        assert code == jobpacker.EXIT_OK
+        assert mock_scrape.call_count == 2
+        assert len(json.loads(output.read_text())["jobs"]) == len(sample_jobspy_dataframe)
+
+    def test_missing_grid_exit_code(self, tmp_path, capsys):
+        """An unreadable grid file should exit 1."""
+        import jobpacker
+
+        assert jobpacker.main(["batch", str(tmp_path / "nope.json")]) == jobpacker.EXIT_ERROR
+
+
+class TestHeadlessStreaming:
+    """Tests for --stream and --compact."""
+
+    def test_stream_writes_rows_as_boards_finish(self, capsys, sample_jobspy_jobs):
+        """Each board's new rows should be written before the next board is reported."""
+        import jobpacker
+
+        def fake_results(*args, **kwargs):
+            yield jobpacker.BoardResult("indeed", rows=jobpacker.JobRows.coerce(sample_jobspy_jobs))
+            assert len(capsys.readouterr().out.splitlines()) == len(sample_jobspy_jobs)
+            # The same postings again from another board are dropped
+            yield jobpacker.BoardResult("google", rows=jobpacker.JobRows.coerce(sample_jobspy_jobs))
+
+        with patch.object(jobpacker, "iter_board_results", side_effect=fake_results):
+            code = jobpacker.main(["search", "-t", "python", "--stream", "-o", "-"])
+
+        assert code == jobpacker.EXIT_OK
+        assert capsys.readouterr().out == ""
+
+    def test_stream_to_file_is_ndjson(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """--stream should write one job per line even without --format ndjson."""
+        import jobpacker
+
+        output = tmp_path / "out.ndjson"
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            code = jobpacker.main(
+                ["search", "-t", "python", "-b", "indeed,google", "--stream", "-o", str(output)]
+            )
+
+        lines = output.read_text().splitlines()
+        assert code == jobpacker.EXIT_OK
+        assert len(lines) == len(sample_jobspy_dataframe)
+        assert read_events(capsys)[-1]["jobs"] == len(sample_jobspy_dataframe)
+
+    def test_compact_json(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """--compact should write the JSON document on a single line."""
+        import jobpacker
+
+        output = tmp_path / "out.json"
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(
+                ["search", "-t", "python", "-b", "indeed", "--compact", "-o", str(output)]
+            )
+
+        text = output.read_text()
+        assert "\n" not in text
+        assert len(json.loads(text)["jobs"]) == len(sample_jobspy_dataframe)
+
+    def test_compress_flag(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """--compress should compress the named output and report its size."""
+        import gzip
+
+        import jobpacker
+
+        output = tmp_path / "out.json"
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(
+                ["search", "-t", "python", "-b", "indeed", "--compress", "gz", "-o", str(output)]
+            )
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            assert len(json.load(f)["jobs"]) == len(sample_jobspy_dataframe)
+        done = read_events(capsys)[-1]
+        assert done["compression"] == "gz"
+        assert done["file_bytes"] == output.stat().st_size
+        assert done["raw_bytes"] > 0
@@ -0,0 +1,108 @@
+"""Tests for the harvest daemon."""
+
+import json
+import random
+import signal
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def grids(tmp_path):
+    """Write two search grids, the second with its own interval, and return their paths."""
+    morning = tmp_path / "morning.json"
+    morning.write_text(json.dumps({"search_terms": ["python"], "locations": ["USA"]}))
+    remote = tmp_path / "remote.json"
+    remote.write_text(
+        json.dumps({"search_terms": ["data"], "locations": ["Remote"], "daemon_interval": 0.01})
+    )
+    return [str(morning), str(remote)]
+
+
+def events(err: str) -> list:
+    """Parse the JSON events written to stderr."""
+    return [json.loads(line) for line in err.splitlines()]
+
+
+class TestSchedule:
+    """Tests for jittered() and grid_schedule()."""
+
+    def test_jitter_stays_in_range(self):
+        """Delays should vary around the interval by at most the jitter."""
+        import jobpacker
+
+        rng = random.Random(0)
+        delays = [jobpacker.jittered(100, 0.2, rng) for _ in range(200)]
+
+        assert all(80 <= delay <= 120 for delay in delays)
+        assert len({round(delay) for delay in delays}) > 10
+        assert jobpacker.jittered(100, 0, rng) == 100
+
+    def test_grid_overrides_config(self, grids, default_config):
+        """A grid's own interval should win over config.json."""
+        import jobpacker
+
+        config = {**default_config, "daemon_interval": 60, "daemon_jitter": 0.5}
+
+        assert jobpacker.grid_schedule(grids[0], config) == (60.0, 0.5)
+        assert jobpacker.grid_schedule(grids[1], config) == (0.01, 0.5)
+
+
+class TestDaemon:
+    """Tests for the daemon command."""
+
+    def test_runs_grids_into_output_dir(
+        self, grids, tmp_path, capsys, sample_jobspy_dataframe, monkeypatch
+    ):
+        """Grids should run on their intervals, exporting into the output directory."""
+        import jobpacker
+
+        out = tmp_path / "exports"
+        args = ["daemon", *grids, "--interval", "60", "--runs", "4", "--no-store"]
+        monkeypatch.setattr(
+            jobpacker, "default_export_filename", lambda label, ext: f"{label}{ext}"
+        )
+        with (
+            patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe),
+            patch.object(jobpacker, "preload_scraper") as preload,
+        ):
+            code = jobpacker.main(
+                [*args, "--output-dir", str(out), "--metrics", str(tmp_path / "jp.prom")]
+            )
+
+        log = events(capsys.readouterr().err)
+        runs = [event["output"] for event in log if event["event"] == "done"]
+        assert code == jobpacker.EXIT_OK
+        preload.assert_called_once()
+        assert log[0]["event"] == "daemon"
+        assert log[-1] == {**log[-1], "event": "stopped", "runs": 4}
+        # The first run of each grid, then the grid with the short interval again
+        assert runs[:2] == [str(out / "morning.json"), str(out / "remote.json")]
+        assert runs[2:] == [str(out / "remote.json")] * 2
+        assert (tmp_path / "jp_morning.prom").exists()
+        assert (tmp_path / "jp_remote.prom").exists()
+        assert signal.getsignal(signal.SIGTERM) is signal.SIG_DFL
+
+    def test_rejects_bad_grid_and_output_file(self, grids, tmp_path, capsys):
+        """Grids are checked up front, and exports can't all go to one -o file."""
+        import jobpacker
+
+        missing = str(tmp_path / "missing.json")
+        assert jobpacker.main(["daemon", grids[0], missing]) == jobpacker.EXIT_ERROR
+        assert "missing.json" in capsys.readouterr().err
+        assert jobpacker.main(["daemon", grids[0], "-o", "jobs.json"]) == jobpacker.EXIT_ERROR
+        assert "--output-dir" in capsys.readouterr().err
+
+    def test_interrupt_stops_between_runs(self, grids, capsys):
+        """Ctrl-C while waiting should stop the daemon cleanly."""
+        import jobpacker
+
+        with (
+            patch.object(jobpacker, "preload_scraper"),
+            patch.object(jobpacker.time, "sleep", side_effect=KeyboardInterrupt),
+        ):
+            code = jobpacker.main(["daemon", *grids])
+
+        assert code == jobpacker.EXIT_OK
+        assert events(capsys.readouterr().err)[-1]["runs"] == 0
@@ -0,0 +1,204 @@
+"""Tests for cross-board duplicate detection."""
+
+import pytest
+
+DESCRIPTION = (
+    "We are looking for a senior backend engineer to design, build and operate the "
+    "services that power our payments platform. You will work with Python, Postgres "
+    "and Kafka, mentor other engineers, and own reliability for critical systems that "
+    "process millions of transactions every day across many countries and currencies."
+)
+
+
+@pytest.fixture
+def posting():
+    """Return one fully populated jobspy row."""
+    return {
+        "title": "Senior Backend Engineer",
+        "company": "Acme Payments, Inc.",
+        "location": "Austin, TX",
+        "job_url": "https://www.indeed.com/viewjob?jk=abc123",
+        "description": DESCRIPTION,
+        "date_posted": "2025-01-15",
+        "min_amount": 150000,
+        "max_amount": 190000,
+        "site": "indeed",
+    }
+
+
+class TestNormalization:
+    """Tests for the text normalization helpers."""
+
+    def test_normalize_company_drops_suffixes(self):
+        """Legal suffixes and punctuation should not affect company matching."""
+        import jobpacker
+
+        assert jobpacker.normalize_company("Acme Payments, Inc.") == "acme payments"
+        assert jobpacker.normalize_company("ACME Payments LLC") == "acme payments"
+
+    def test_normalize_text_handles_missing_values(self):
+        """None and NaN should normalize to an empty string."""
+        import jobpacker
+
+        assert jobpacker.normalize_text(None) == ""
+        assert jobpacker.normalize_text(float("nan")) == ""
+
+    def test_exact_keys_skip_incomplete_posting_key(self):
+        """The company/title/location key needs all three fields."""
+        import jobpacker
+
+        keys = jobpacker.exact_job_keys({"title": "Engineer", "job_url": "https://x.com/1"})
+
+        assert keys == [("url", "https://x.com/1")]
+
+    def test_word_hash_is_not_salted(self):
+        """Word hashes must be the same whatever PYTHONHASHSEED is."""
+        import jobpacker
+
+        assert jobpacker.word_hash("python") == 12810737210631960232
+
+    def test_batched_signatures_match_single(self, monkeypatch):
+        """Signing descriptions in batches should give each one its own signature."""
+        import numpy as np
+
+        import jobpacker
+
+        monkeypatch.setattr(jobpacker, "DEDUPE_BATCH_WORDS", 60)
+        descriptions = [
+            DESCRIPTION,
+            None,
+            "too short",
+            DESCRIPTION.replace("Python", "Rust"),
+            DESCRIPTION,
+            DESCRIPTION + " Remote friendly.",
+        ]
+
+        rows, signatures = jobpacker.minhash_signatures(descriptions)
+
+        assert rows == [0, 3, 4, 5]
+        for i, signature in zip(rows, signatures, strict=True):
+            single = jobpacker.minhash_signatures([descriptions[i]])[1][0]
+            assert np.array_equal(signature, single)
+        assert np.array_equal(signatures[0], signatures[2])
+        assert not np.array_equal(signatures[0], signatures[1])
+
+
+class TestDedupeJobs:
+    """Tests for dedupe_jobs function."""
+
+    def test_same_url_merged(self, posting):
+        """Copies with the same canonical URL should collapse to one."""
+        import jobpacker
+
+        copy = {**posting, "job_url": posting["job_url"] + "&utm_source=feed", "title": "x"}
+
+        assert len(jobpacker.dedupe_jobs([posting, copy])) == 1
+
+    def test_same_company_title_location_merged(self, posting):
+        """Different boards listing the same posting should collapse to one."""
+        import jobpacker
+
+        linkedin = {
+            **posting,
+            "company": "ACME Payments LLC",
+            "job_url": "https://www.linkedin.com/jobs/view/999",
+            "description": "",
+            "site": "linkedin",
+        }
+
+        deduped = jobpacker.dedupe_jobs([linkedin, posting])
+
+        assert len(deduped) == 1
+        assert deduped[0]["site"] == "indeed"  # Richer copy wins
+        assert deduped[0]["other_sources"] == ["linkedin"]
+        assert deduped[0]["other_urls"] == ["https://www.linkedin.com/jobs/view/999"]
+
+    def test_near_duplicate_descriptions_merged(self, posting):
+        """Lightly edited descriptions at the same company should collapse."""
+        import jobpacker
+
+        google = {
+            **posting,
+            "title": "Sr. Backend Engineer (Payments)",
+            "location": "Austin, Texas",
+            "job_url": "https://www.google.com/jobs/1",
+            "description": DESCRIPTION + " Apply today!",
+            "site": "google",
+        }
+
+        assert len(jobpacker.dedupe_jobs([posting, google])) == 1
+
+    def test_similar_descriptions_at_other_company_kept(self, posting):
+        """Shared boilerplate at a different company is not a duplicate."""
+        import jobpacker
+
+        other = {
+            **posting,
+            "company": "Globex",
+            "title": "Platform Engineer",
+            "job_url": "https://www.indeed.com/viewjob?jk=zzz",
+        }
+
+        assert len(jobpacker.dedupe_jobs([posting, other])) == 2
+
+    def test_distinct_jobs_kept_in_order(self, sample_jobspy_jobs):
+        """Unrelated jobs should all survive in their original order."""
+        import jobpacker
+
+        deduped = jobpacker.dedupe_jobs(sample_jobspy_jobs)
+
+        assert [job["job_url"] for job in deduped] == [job["job_url"] for job in sample_jobspy_jobs]
+        assert all("other_sources" not in job for job in deduped)
+
+    def test_does_not_mutate_input(self, posting):
+        """Merged rows should be copies, leaving the input rows untouched."""
+        import jobpacker
+
+        copy = {**posting, "site": "linkedin"}
+        jobpacker.dedupe_jobs([posting, copy])
+
+        assert "other_sources" not in posting
+
+    def test_scales_to_thousands_of_rows(self, posting):
+        """Thousands of rows sharing boilerplate should dedupe quickly and correctly."""
+        import time
+
+        import jobpacker
+
+        jobs = []
+        for i in range(2000):
+            jobs.append(
+                {
+                    **posting,
+                    "company": f"Company {i % 1000}",
+                    "title": f"Engineer {i}",
+                    "job_url": f"https://example.com/job/{i % 1000}",
+                }
+            )
+
+        start = time.monotonic()
+        deduped = jobpacker.dedupe_jobs(jobs)
+
+        assert len(deduped) == 1000
+        assert time.monotonic() - start < 10
+
+
+class TestDedupeSearchResults:
+    """Tests for the dedupe stage wrapper."""
+
+    def test_disabled_returns_input(self, default_config, posting, mock_console):
+        """dedupe=False should skip the stage."""
+        import jobpacker
+
+        jobs = [posting, dict(posting)]
+
+        assert jobpacker.dedupe_search_results(jobs, {**default_config, "dedupe": False}) is jobs
+
+    def test_reports_merged_count(self, default_config, posting, mock_console):
+        """The number of merged postings should be reported."""
+        import jobpacker
+
+        result = jobpacker.dedupe_search_results([posting, dict(posting)], default_config)
+
+        assert len(result) == 1
+        mock_console.print.assert_called_once()
@@ -0,0 +1,167 @@
+"""Tests for the content-addressed description store and rehydration."""
+
+import json
+from unittest.mock import patch
+
+
+def cleansheet_jobs(descriptions):
+    """Build minimal Cleansheet jobs with the given descriptions."""
+    return [
+        {"id": str(i), "title": f"Job {i}", "description": text, "tags": []}
+        for i, text in enumerate(descriptions)
+    ]
+
+
+class TestDescriptionStore:
+    """Tests for DescriptionStore."""
+
+    def test_put_and_get(self, tmp_path):
+        """Stored text should come back under its hash."""
+        import jobpacker
+
+        store = jobpacker.DescriptionStore(tmp_path / "store")
+        key, new = store.put("Build payment systems.")
+
+        assert new is True
+        assert store.get(key) == "Build payment systems."
+        assert key in store
+
+    def test_normalized_copies_share_one_entry(self, tmp_path):
+        """Line endings and trailing whitespace should not create new entries."""
+        import jobpacker
+
+        store = jobpacker.DescriptionStore(tmp_path / "store")
+        first, _ = store.put("Line one\nLine two")
+        second, new = store.put("Line one   \r\nLine two\n\n")
+
+        assert first == second
+        assert new is False
+        assert len(list((tmp_path / "store").rglob("*.txt"))) == 1
+
+    def test_seen_by_a_new_instance(self, tmp_path):
+        """Entries should persist across store instances."""
+        import jobpacker
+
+        key, _ = jobpacker.DescriptionStore(tmp_path / "store").put("Text")
+
+        assert jobpacker.DescriptionStore(tmp_path / "store").put("Text") == (key, False)
+
+    def test_missing_key_returns_none(self, tmp_path):
+        """Unknown hashes should return None."""
+        import jobpacker
+
+        assert jobpacker.DescriptionStore(tmp_path / "store").get("00" * 16) is None
+
+
+class TestExternalizeDescriptions:
+    """Tests for externalize_descriptions."""
+
+    def test_off_passes_through(self):
+        """The default mode should leave jobs unchanged."""
+        import jobpacker
+
+        jobs = cleansheet_jobs(["A"])
+
+        assert list(jobpacker.externalize_descriptions(iter(jobs), "off")) == jobs
+        assert "descriptionHash" not in jobs[0]
+
+    def test_hash_mode_replaces_every_description(self):
+        """Hash mode should carry only hashes."""
+        import jobpacker
+
+        jobs = list(jobpacker.externalize_descriptions(iter(cleansheet_jobs(["A", "B"])), "hash"))
+
+        assert [job["description"] for job in jobs] == ["", ""]
+        assert all(len(job["descriptionHash"]) == 32 for job in jobs)
+
+    def test_first_mode_inlines_only_first_sight(self):
+        """First mode should inline text the store has not seen before."""
+        import jobpacker
+
+        first = list(jobpacker.externalize_descriptions(iter(cleansheet_jobs(["A", "A"])), "first"))
+        second = list(jobpacker.externalize_descriptions(iter(cleansheet_jobs(["A"])), "first"))
+
+        assert [job["description"] for job in first] == ["A", ""]
+        assert second[0]["description"] == ""
+        assert first[0]["descriptionHash"] == second[0]["descriptionHash"]
+
+    def test_empty_description_has_no_hash(self):
+        """Jobs without a description should not get a hash."""
+        import jobpacker
+
+        jobs = list(jobpacker.externalize_descriptions(iter(cleansheet_jobs([""])), "hash"))
+
+        assert "descriptionHash" not in jobs[0]
+
+
+class TestRehydrate:
+    """Tests for rebuilding full exports."""
+
+    def test_round_trip(self, tmp_path):
+        """A hashed export should rehydrate to the original descriptions."""
+        import jobpacker
+
+        original = cleansheet_jobs(["Alpha text", "Beta text", "Alpha text"])
+        slim = tmp_path / "slim.json.gz"
+        full = tmp_path / "full.json"
+        jobpacker.write_export(
+            jobpacker.externalize_descriptions(iter([dict(job) for job in original]), "hash"),
+            str(slim),
+        )
+
+        stats, missing = jobpacker.rehydrate_export(str(slim), str(full))
+
+        assert missing == []
+        assert stats.jobs == 3
+        assert json.loads(full.read_text())["jobs"] == original
+
+    def test_missing_description_reported(self, tmp_path):
+        """Hashes absent from the store should be reported and left empty."""
+        import jobpacker
+
+        source = tmp_path / "slim.ndjson"
+        job = {"id": "1", "description": "", "descriptionHash": "ab" * 16}
+        source.write_text(json.dumps(job) + "\n")
+
+        _, missing = jobpacker.rehydrate_export(str(source), str(tmp_path / "full.json"))
+
+        assert missing == ["ab" * 16]
+
+    def test_export_jobs_uses_store(self, tmp_path, sample_jobspy_jobs, mock_console):
+        """export_jobs should write hashes when the store is enabled."""
+        import jobpacker
+
+        output = tmp_path / "out.json"
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(output)):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test", description_store="hash")
+
+        jobs = json.loads(output.read_text())["jobs"]
+        assert all(job["description"] == "" and job["descriptionHash"] for job in jobs)
+
+    def test_cli_rehydrate(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """The rehydrate command should restore a headless hashed export."""
+        import jobpacker
+
+        slim = tmp_path / "harvest.json"
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(
+                ["search", "-t", "python", "-b", "indeed", "--description-store", "hash"]
+                + ["-o", str(slim)]
+            )
+
+        code = jobpacker.main(["rehydrate", str(slim)])
+
+        full = json.loads((tmp_path / "harvest_full.json").read_text())["jobs"]
+        assert code == jobpacker.EXIT_OK
+        assert [job["description"] for job in full] == list(sample_jobspy_dataframe["description"])
+        assert all("descriptionHash" not in job for job in full)
+
+    def test_cli_rehydrate_refuses_to_overwrite_source(self, tmp_path, capsys):
+        """Rehydrating onto the source file should fail without touching it."""
+        import jobpacker
+
+        source = tmp_path / "slim.json"
+        source.write_text('{"exportType": "jobspy_harvest", "jobs": []}')
+
+        assert jobpacker.main(["rehydrate", str(source), "-o", str(source)]) == jobpacker.EXIT_ERROR
+        assert source.read_text() == '{"exportType": "jobspy_harvest", "jobs": []}'
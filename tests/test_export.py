@@ -6,6 +6,8 @@ import re
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestFilenameGeneration:
     """Tests for export filename generation."""
@@ -394,3 +396,367 @@ class TestExportJobsFunction:
             data = json.load(f)
 
         assert data["jobs"][0]["salary"] == ""
+
+
+class TestColumnarConversion:
+    """Tests for to_cleansheet_jobs matching the per-row conversion."""
+
+    @staticmethod
+    def without_ids(jobs):
+        return [{k: v for k, v in job.items() if k != "id"} for job in jobs]
+
+    def test_matches_per_row_conversion(self):
+        """Column conversion should produce exactly the per-row output."""
+        import jobpacker
+
+        amounts = [None, float("nan"), 150000.0, 85000.75, 0, -12.5, 120000]
+        dates = [datetime(2025, 1, 15), "2025-02-03T10:00:00", None, "", float("nan")]
+        jobs = [
+            {
+                "title": f"Job {i}",
+                "company": None if i % 11 == 0 else f"Company {i % 3}",
+                "location": "Austin, TX",
+                "job_url": f"https://example.com/{i}",
+                "description": "Text",
+                "min_amount": amounts[i % len(amounts)],
+                "max_amount": amounts[(i * 3) % len(amounts)],
+                "date_posted": dates[i % len(dates)],
+                "site": "indeed",
+            }
+            for i in range(60)
+        ]
+        del jobs[4]["company"], jobs[5]["site"]
+
+        rows = jobpacker.to_cleansheet_jobs(jobs)
+        expected = [jobpacker.to_cleansheet_job(job) for job in jobs]
+
+        assert self.without_ids(rows) == self.without_ids(expected)
+        assert [list(job) for job in rows] == [list(job) for job in expected]
+
+    def test_unusual_amounts_match_per_row_rules(self):
+        """String amounts should fall back to the per-row parsing rules."""
+        import jobpacker
+
+        jobs = [
+            {"min_amount": "90000", "max_amount": 100000.0},
+            {"min_amount": "90000.5", "max_amount": None},
+            {"min_amount": "n/a", "max_amount": 5.0},
+        ]
+
+        assert [job["salary"] for job in jobpacker.to_cleansheet_jobs(jobs)] == [
+            jobpacker.cleansheet_salary(job["min_amount"], job["max_amount"]) for job in jobs
+        ]
+
+    def test_ids_match_per_row_conversion(self, sample_jobspy_jobs):
+        """Column and per-row conversion should derive the same IDs."""
+        import jobpacker
+
+        rows = jobpacker.to_cleansheet_jobs(sample_jobspy_jobs)
+
+        assert [job["id"] for job in rows] == [
+            jobpacker.to_cleansheet_job(job)["id"] for job in sample_jobspy_jobs
+        ]
+
+
+class TestStreamingWriter:
+    """Tests for ExportWriter and write_export streaming."""
+
+    JOBS = [
+        {"id": "1", "title": "Café engineer", "tags": [], "salary": ""},
+        {"id": "2", "title": 'Line\nbreak "quoted"', "tags": [], "salary": "$1+"},
+        {"id": "3", "title": "Third", "tags": [], "salary": ""},
+    ]
+
+    def test_indented_output_matches_json_dump(self, tmp_path):
+        """The streamed document should be byte-identical to json.dump(indent=2)."""
+        import jobpacker
+
+        for count in range(len(self.JOBS) + 1):
+            path = tmp_path / f"out{count}.json"
+            jobpacker.write_export(iter(self.JOBS[:count]), str(path))
+
+            expected = json.dumps(
+                {"exportType": "jobspy_harvest", "jobs": self.JOBS[:count]},
+                indent=2,
+                ensure_ascii=False,
+            )
+            assert path.read_text(encoding="utf-8") == expected
+
+    def test_compact_output(self, tmp_path):
+        """Compact mode should write the same document without whitespace."""
+        import jobpacker
+
+        for count in (0, len(self.JOBS)):
+            path = tmp_path / f"out{count}.json"
+            written = jobpacker.write_export(iter(self.JOBS[:count]), str(path), compact=True)
+
+            expected = {"exportType": "jobspy_harvest", "jobs": self.JOBS[:count]}
+            assert written.jobs == count
+            assert json.loads(path.read_text(encoding="utf-8")) == expected
+            assert "\n" not in path.read_text(encoding="utf-8")
+
+    def test_ndjson_flushes_each_job(self):
+        """NDJSON should reach the stream after every job."""
+        import io
+
+        import jobpacker
+
+        out = io.StringIO()
+        out.flush = MagicMock()
+        writer = jobpacker.ExportWriter(out, "ndjson")
+        for job in self.JOBS:
+            writer.write(job)
+        writer.close()
+
+        assert out.flush.call_count == len(self.JOBS)
+        assert [json.loads(line) for line in out.getvalue().splitlines()] == self.JOBS
+
+    def test_memory_stays_flat(self, tmp_path):
+        """Peak memory while exporting should not grow with the number of jobs."""
+        import tracemalloc
+
+        import jobpacker
+
+        def peak_for(count):
+            job = {"title": "Engineer", "description": "x" * 2000, "job_url": "https://e.com"}
+            jobs = jobpacker.JobRows.from_records([job] * count)
+            tracemalloc.start()
+            try:
+                jobpacker.write_export(
+                    jobpacker.iter_cleansheet_jobs(jobs), str(tmp_path / "out.json")
+                )
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small = peak_for(jobpacker.EXPORT_CHUNK_ROWS)
+        large = peak_for(jobpacker.EXPORT_CHUNK_ROWS * 10)
+
+        assert large < small * 2
+
+
+class TestCompressedExport:
+    """Tests for .json.gz / .json.xz exports and size reporting."""
+
+    JOBS = [{"id": str(i), "description": "Repeated description text. " * 40} for i in range(50)]
+
+    def test_gzip_and_xz_round_trip(self, tmp_path):
+        """Compressed exports should decompress to the uncompressed document."""
+        import gzip
+        import lzma
+
+        import jobpacker
+
+        plain = tmp_path / "out.json"
+        jobpacker.write_export(iter(self.JOBS), str(plain))
+
+        for name, opener in (("out.json.gz", gzip.open), ("out.json.xz", lzma.open)):
+            path = tmp_path / name
+            stats = jobpacker.write_export(iter(self.JOBS), str(path), level=1)
+
+            with opener(path, "rt", encoding="utf-8") as f:
+                assert f.read() == plain.read_text(encoding="utf-8")
+            assert stats.compression == name.rsplit(".", 1)[1]
+            assert stats.raw_bytes == plain.stat().st_size
+            assert stats.file_bytes == path.stat().st_size < stats.raw_bytes
+        assert b"\r\n" not in plain.read_bytes()
+
+    def test_describe_reports_sizes_and_throughput(self):
+        """The summary should show raw size, compressed size, ratio and rate."""
+        import jobpacker
+
+        stats = jobpacker.ExportStats(
+            jobs=10,
+            raw_bytes=10 * 1024 * 1024,
+            file_bytes=1024 * 1024,
+            elapsed=2.0,
+            compression="gz",
+        )
+
+        text = stats.describe()
+
+        assert "10.0 MB JSON" in text
+        assert "1.0 MB gz (10.0x smaller)" in text
+        assert "5.0 MB/s" in text
+
+    def test_export_jobs_keeps_compressed_filename(
+        self, tmp_path, sample_jobspy_jobs, mock_console
+    ):
+        """A .json.gz filename should be written compressed, not renamed to .json."""
+        import gzip
+
+        import jobpacker
+
+        output = tmp_path / "jobs.json.gz"
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(output)):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test")
+
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            assert len(json.load(f)["jobs"]) == len(sample_jobspy_jobs)
+
+    def test_default_filename_uses_configured_compression(
+        self, tmp_path, sample_jobspy_jobs, mock_console
+    ):
+        """The suggested filename should carry the configured compression suffix."""
+        import jobpacker
+
+        output = tmp_path / "jobs.json.xz"
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(output)) as mock_ask:
+            jobpacker.export_jobs(sample_jobspy_jobs, "test", compression="xz")
+
+        assert mock_ask.call_args.kwargs["default"].endswith(".json.xz")
+
+
+class TestStableJobIds:
+    """Tests for stable_job_id."""
+
+    def test_same_url_same_id(self):
+        """Tracking parameters and case should not change a job's ID."""
+        import uuid
+
+        import jobpacker
+
+        first = jobpacker.stable_job_id("https://Example.com/job/1?utm_source=x", "A", "B", "C", "")
+        second = jobpacker.stable_job_id("https://example.com/job/1", "Other", "", None, None)
+
+        assert first == second
+        assert uuid.UUID(first).version == 5
+
+    def test_falls_back_to_posting_then_description(self):
+        """Jobs without a URL should get IDs from their content."""
+        import jobpacker
+
+        posting = jobpacker.stable_job_id(None, "Acme, Inc.", "Engineer", "Austin", "x")
+
+        assert posting == jobpacker.stable_job_id("", "ACME", "engineer", "austin", "y")
+        assert posting != jobpacker.stable_job_id("", "Acme", "Engineer", "Dallas", "x")
+        assert jobpacker.stable_job_id(None, None, "", float("nan"), "Text") == (
+            jobpacker.stable_job_id(None, None, None, None, "text")
+        )
+
+    def test_empty_job_gets_random_id(self):
+        """A job with nothing to identify it should not collide with others."""
+        import jobpacker
+
+        assert jobpacker.stable_job_id(None, None, None, None, None) != (
+            jobpacker.stable_job_id(None, None, None, None, None)
+        )
+
+    @pytest.mark.parametrize("mode", [[], ["--stream"], ["--upsert"]])
+    def test_ids_unique_without_dedupe(
+        self, mode, default_config, tmp_path, capsys, sample_jobspy_dataframe
+    ):
+        """The same postings from two boards should be exported once when dedupe is off."""
+        import jobpacker
+
+        def fake_scrape(site_name, **kwargs):
+            frame = sample_jobspy_dataframe.copy()
+            if site_name == ["google"]:  # Same postings, behind tracking links
+                frame["job_url"] += "?utm_source=google"
+            return frame
+
+        jobpacker.save_config({**default_config, "dedupe": False})
+        path = tmp_path / "jobs.ndjson"
+        argv = ["search", "-t", "python", "-b", "indeed,google", "-f", "ndjson", "-o", str(path)]
+        with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+            code = jobpacker.main(argv + mode)
+
+        ids = [json.loads(line)["id"] for line in path.read_text().splitlines()]
+        assert code == jobpacker.EXIT_OK
+        assert len(ids) == len(set(ids)) == len(sample_jobspy_dataframe)
+
+
+class TestUpsertExport:
+    """Tests for merging into an existing export."""
+
+    @staticmethod
+    def job(job_id):
+        """Return a minimal Cleansheet job with the given ID."""
+        return {"id": job_id, "title": "Job", "description": "Text", "status": "Saved", "tags": []}
+
+    def test_missing_file_is_written(self, tmp_path):
+        """Upserting into a new file should write every job."""
+        import jobpacker
+
+        path = tmp_path / "jobs.json"
+        stats, added, updated = jobpacker.upsert_export(iter([self.job("a")]), str(path))
+
+        assert (stats.jobs, added, updated) == (1, 1, 0)
+        assert json.loads(path.read_text())["jobs"] == [self.job("a")]
+
+    def test_updates_in_place_and_appends(self, tmp_path):
+        """Known IDs should update where they are; new IDs should be appended."""
+        import jobpacker
+
+        path = tmp_path / "jobs.json"
+        existing = [self.job("a"), self.job("b"), self.job("c")]
+        existing[1]["status"] = "Applied"
+        existing[1]["tags"] = ["favourite"]
+        jobpacker.write_export(iter(existing), str(path))
+
+        changed = {**self.job("b"), "title": "New title"}
+        stats, added, updated = jobpacker.upsert_export(
+            iter([self.job("c"), changed, self.job("d")]), str(path)
+        )
+
+        jobs = json.loads(path.read_text())["jobs"]
+        assert [job["id"] for job in jobs] == ["a", "b", "c", "d"]
+        assert jobs[1]["title"] == "New title"
+        assert (jobs[1]["status"], jobs[1]["tags"]) == ("Applied", ["favourite"])
+        assert (stats.jobs, added, updated) == (4, 1, 1)
+
+    def test_first_copy_of_an_id_wins(self, tmp_path):
+        """Jobs repeating an ID should be merged once, keeping the first copy."""
+        import jobpacker
+
+        path = tmp_path / "jobs.json"
+        jobpacker.write_export(iter([self.job("a")]), str(path))
+
+        again = [{**self.job("a"), "title": "First"}, {**self.job("a"), "title": "Second"}]
+        stats, added, updated = jobpacker.upsert_export(iter(again), str(path))
+
+        assert json.loads(path.read_text())["jobs"] == [again[0]]
+        assert (stats.jobs, added, updated) == (1, 0, 1)
+
+    def test_keeps_format_and_compression(self, tmp_path):
+        """A compressed NDJSON file should stay compressed NDJSON."""
+        import gzip
+
+        import jobpacker
+
+        path = tmp_path / "jobs.ndjson.gz"
+        jobpacker.write_export(iter([self.job("a")]), str(path), "ndjson")
+
+        jobpacker.upsert_export(iter([self.job("b")]), str(path))
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert [json.loads(line)["id"] for line in f] == ["a", "b"]
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_reexport_keeps_ids(self, tmp_path, sample_jobspy_jobs, mock_console):
+        """Exporting the same jobs twice into one file should change nothing."""
+        import jobpacker
+
+        path = tmp_path / "jobs.json"
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(path)):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test")
+            first = path.read_text()
+            with patch.object(jobpacker.Confirm, "ask", return_value=True):
+                jobpacker.export_jobs(sample_jobspy_jobs, "test")
+
+        assert path.read_text() == first
+
+    def test_cli_upsert(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """--upsert should report added and updated counts."""
+        import jobpacker
+
+        path = tmp_path / "jobs.json"
+        argv = ["search", "-t", "python", "-b", "indeed", "--upsert", "-o", str(path)]
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(argv)
+            code = jobpacker.main(argv)
+
+        done = [json.loads(line) for line in capsys.readouterr().err.splitlines()][-1]
+        assert code == jobpacker.EXIT_OK
+        assert (done["added"], done["updated"]) == (0, 0)
+        assert done["jobs"] == len(sample_jobspy_dataframe)
@@ -0,0 +1,229 @@
+"""Tests for incremental harvesting."""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+
+class TestCanonicalizeJobUrl:
+    """Tests for canonicalize_job_url function."""
+
+    def test_strips_tracking_parameters(self):
+        """utm_* and known tracking parameters should be removed."""
+        import jobpacker
+
+        url = "https://www.linkedin.com/jobs/view/123?refId=abc&trk=foo&utm_source=x"
+
+        assert jobpacker.canonicalize_job_url(url) == "https://www.linkedin.com/jobs/view/123"
+
+    def test_keeps_identifying_parameters_sorted(self):
+        """Parameters that identify the job should survive in a stable order."""
+        import jobpacker
+
+        first = jobpacker.canonicalize_job_url("https://indeed.com/viewjob?jk=1&b=2")
+        second = jobpacker.canonicalize_job_url("https://indeed.com/viewjob?b=2&jk=1")
+
+        assert first == second
+        assert "jk=1" in first
+
+    def test_normalizes_case_fragment_and_slash(self):
+        """Host case, fragments and trailing slashes should not matter."""
+        import jobpacker
+
+        assert jobpacker.canonicalize_job_url(
+            "HTTPS://Example.COM/job/1/#apply"
+        ) == jobpacker.canonicalize_job_url("https://example.com/job/1")
+
+
+class TestSeenUrlIndex:
+    """Tests for the SeenUrlIndex Bloom filter plus exact set."""
+
+    def test_added_urls_are_seen(self):
+        """URLs added to the index should be reported as seen."""
+        import jobpacker
+
+        index = jobpacker.SeenUrlIndex()
+        index.add("https://example.com/job/1")
+
+        assert "https://example.com/job/1" in index
+        assert "https://example.com/job/1?utm_campaign=mail" in index
+        assert "https://example.com/job/2" not in index
+
+    def test_duplicate_add_is_ignored(self):
+        """Adding the same URL twice should store it once."""
+        import jobpacker
+
+        index = jobpacker.SeenUrlIndex()
+        index.add("https://example.com/job/1")
+        index.add("https://example.com/job/1/")
+
+        assert len(index) == 1
+
+    def test_grows_past_capacity(self):
+        """The filter should resize without losing any URL."""
+        import jobpacker
+
+        index = jobpacker.SeenUrlIndex(capacity=16)
+        urls = [f"https://example.com/job/{i}" for i in range(200)]
+        for url in urls:
+            index.add(url)
+
+        assert index.capacity >= 200
+        assert all(url in index for url in urls)
+        assert len(index) == 200
+
+    def test_no_false_negatives_and_exact_confirmation(self):
+        """Unseen URLs must never be reported as seen, even on Bloom collisions."""
+        import jobpacker
+
+        index = jobpacker.SeenUrlIndex(capacity=8)
+        for i in range(8):
+            index.add(f"https://example.com/seen/{i}")
+
+        assert not any(f"https://example.com/new/{i}" in index for i in range(2000))
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        """A saved index should load with the same contents."""
+        import jobpacker
+
+        path = tmp_path / "seen.idx"
+        index = jobpacker.SeenUrlIndex()
+        for i in range(50):
+            index.add(f"https://example.com/job/{i}")
+        index.save(path)
+
+        loaded = jobpacker.SeenUrlIndex.load(path)
+
+        assert len(loaded) == 50
+        assert "https://example.com/job/7" in loaded
+        assert "https://example.com/job/99" not in loaded
+
+    def test_corrupt_file_loads_empty(self, tmp_path):
+        """An unreadable index file should be replaced by an empty index."""
+        import jobpacker
+
+        path = tmp_path / "seen.idx"
+        path.write_bytes(b"garbage")
+
+        assert len(jobpacker.SeenUrlIndex.load(path)) == 0
+
+
+class TestIncrementalWindow:
+    """Tests for last-run tracking and the hours_old window."""
+
+    def test_disabled_returns_none(self, default_config):
+        """Without incremental mode, the full window should be fetched."""
+        import jobpacker
+
+        assert jobpacker.incremental_hours_old("linkedin", "python", "USA", default_config) is None
+
+    def test_never_run_returns_none(self, default_config):
+        """A query's first incremental run should fetch the full window."""
+        import jobpacker
+
+        config = {**default_config, "incremental": True}
+
+        assert jobpacker.incremental_hours_old("linkedin", "python", "USA", config) is None
+
+    def test_window_covers_time_since_last_run(self, default_config):
+        """hours_old should cover the time since the last run plus the overlap."""
+        import jobpacker
+
+        config = {**default_config, "incremental": True}
+        result = jobpacker.BoardResult("linkedin", search_term="python", location="USA")
+        jobpacker.record_harvest_runs([result], time.time() - 5 * 3600 - 60, config)
+
+        hours = jobpacker.incremental_hours_old("linkedin", "Python", "usa", config)
+
+        assert hours == 6 + jobpacker.INCREMENTAL_OVERLAP_HOURS
+
+    def test_failed_queries_not_recorded(self, default_config):
+        """Only successful queries should move the last-run time forward."""
+        import jobpacker
+
+        config = {**default_config, "incremental": True}
+        result = jobpacker.BoardResult("linkedin", status="error", search_term="python")
+        jobpacker.record_harvest_runs([result], time.time(), config)
+
+        assert jobpacker.load_harvest_state()["last_run"] == {}
+
+    def test_indeed_filters_fetch_full_window(self, default_config):
+        """Indeed can't combine hours_old with remote/job type filters."""
+        import jobpacker
+
+        config = {**default_config, "incremental": True, "remote_only": True}
+        result = jobpacker.BoardResult("indeed", search_term="python", location="USA")
+        jobpacker.record_harvest_runs([result], time.time(), config)
+
+        assert jobpacker.incremental_hours_old("indeed", "python", "USA", config) is None
+
+    def test_scrape_board_passes_hours_old(self, default_config, sample_jobspy_dataframe):
+        """The incremental window should reach jobspy's hours_old parameter."""
+        import jobpacker
+
+        config = {**default_config, "incremental": True}
+        result = jobpacker.BoardResult("google", search_term="python", location="USA")
+        jobpacker.record_harvest_runs([result], time.time() - 60, config)
+        mock_scrape = MagicMock(return_value=sample_jobspy_dataframe)
+
+        with patch.object(jobpacker, "scrape_jobs", mock_scrape):
+            jobpacker.scrape_board("google", "python", "USA", config)
+
+        assert mock_scrape.call_args.kwargs["hours_old"] == 1 + jobpacker.INCREMENTAL_OVERLAP_HOURS
+
+
+class TestIncrementalExport:
+    """Tests for dropping already-exported jobs in export_jobs."""
+
+    def test_second_export_skips_seen_jobs(self, tmp_path, sample_jobspy_jobs, mock_console):
+        """Jobs exported once should not be exported again."""
+        import jobpacker
+
+        first_file = tmp_path / "first.json"
+        second_file = tmp_path / "second.json"
+        new_job = {**sample_jobspy_jobs[0], "job_url": "https://example.com/job/new"}
+
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(first_file)):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test", incremental=True)
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(second_file)):
+            jobpacker.export_jobs(sample_jobspy_jobs + [new_job], "test", incremental=True)
+
+        assert len(json.loads(first_file.read_text())["jobs"]) == len(sample_jobspy_jobs)
+        second = json.loads(second_file.read_text())["jobs"]
+        assert [job["url"] for job in second] == ["https://example.com/job/new"]
+
+    def test_nothing_new_writes_no_file(self, tmp_path, sample_jobspy_jobs, mock_console):
+        """An export with only seen jobs should not prompt or write."""
+        import jobpacker
+
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(tmp_path / "a.json")):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test", incremental=True)
+
+        mock_ask = MagicMock()
+        with patch.object(jobpacker.Prompt, "ask", mock_ask):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test", incremental=True)
+
+        mock_ask.assert_not_called()
+
+    def test_non_incremental_export_ignores_index(self, tmp_path, sample_jobspy_jobs, mock_console):
+        """Regular exports should neither filter nor record URLs."""
+        import jobpacker
+
+        output = tmp_path / "out.json"
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(output)):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test")
+
+        assert not jobpacker.SEEN_INDEX_PATH.exists()
+
+    def test_harvest_state_saved_after_export(self, tmp_path, sample_jobspy_jobs, mock_console):
+        """A search's last-run times should only be saved once its jobs are exported."""
+        import jobpacker
+
+        harvest_runs = {"linkedin|python|usa|False|": time.time()}
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(tmp_path / "no/a.json")):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test", True, harvest_runs=harvest_runs)
+        assert not jobpacker.HARVEST_STATE_PATH.exists()
+
+        with patch.object(jobpacker.Prompt, "ask", return_value=str(tmp_path / "a.json")):
+            jobpacker.export_jobs(sample_jobspy_jobs, "test", True, harvest_runs=harvest_runs)
+        assert jobpacker.load_harvest_state()["last_run"] == harvest_runs
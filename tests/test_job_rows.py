@@ -0,0 +1,82 @@
+"""Tests for the columnar JobRows container."""
+
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+
+class TestJobRows:
+    """Tests for building and reading JobRows."""
+
+    def test_from_frame_matches_records(self, sample_jobspy_dataframe):
+        """Rows built from columns should equal DataFrame.to_dict("records")."""
+        import jobpacker
+
+        rows = jobpacker.JobRows.from_frame(sample_jobspy_dataframe)
+
+        assert len(rows) == len(sample_jobspy_dataframe)
+        records = sample_jobspy_dataframe.to_dict("records")
+
+        # repr, because NaN never compares equal to itself
+        assert repr(list(rows)) == repr(records)
+        assert repr(rows[1]) == repr(records[1])
+
+    def test_from_records_keeps_missing_keys_missing(self):
+        """Rows built from dicts should only have their own keys."""
+        import jobpacker
+
+        rows = jobpacker.JobRows.from_records([{"title": "A"}, {"company": "B"}])
+
+        assert list(rows) == [{"title": "A"}, {"company": "B"}]
+        assert rows.column("title") == ["A", None]
+
+    def test_concat_aligns_columns(self):
+        """Parts with different columns should join without inventing values."""
+        import jobpacker
+
+        first = jobpacker.JobRows.from_records([{"title": "A"}])
+        rows = jobpacker.JobRows.concat([first, [{"site": "indeed"}], jobpacker.JobRows()])
+
+        assert list(rows) == [{"title": "A"}, {"site": "indeed"}]
+
+    def test_take_and_slice(self):
+        """take and slicing should select rows in the given order."""
+        import jobpacker
+
+        rows = jobpacker.JobRows.from_records([{"n": i} for i in range(5)])
+
+        assert [row["n"] for row in rows.take([3, 0])] == [3, 0]
+        assert [row["n"] for row in rows[:2]] == [0, 1]
+        assert rows[-1] == {"n": 4}
+        with pytest.raises(IndexError):
+            rows[5]
+
+    def test_with_column_skips_missing_values(self):
+        """_MISSING entries should leave the field out of that row."""
+        import jobpacker
+
+        rows = jobpacker.JobRows.from_records([{"n": 1}, {"n": 2}])
+        rows = rows.with_column("extra", ["x", jobpacker._MISSING])
+
+        assert list(rows) == [{"n": 1, "extra": "x"}, {"n": 2}]
+
+    def test_uses_less_memory_than_records(self):
+        """Columns should take a fraction of the memory of one dict per row."""
+        import jobpacker
+
+        n = 20_000
+        frame = pd.DataFrame({f"field_{i}": [f"value {j}" for j in range(n)] for i in range(20)})
+
+        def traced(build):
+            tracemalloc.start()
+            try:
+                result = build()  # noqa: F841 - kept alive while measuring
+                return tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+
+        columnar = traced(lambda: jobpacker.JobRows.from_frame(frame))
+        records = traced(lambda: frame.to_dict("records"))
+
+        assert columnar < records / 2
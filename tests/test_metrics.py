@@ -0,0 +1,139 @@
+"""Tests for Prometheus textfile metrics from headless runs."""
+
+import urllib.error
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+
+
+def samples(text: str) -> dict:
+    """Parse metrics text into {series: value}."""
+    series = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            series[name] = float(value)
+    return series
+
+
+class TestErrorType:
+    """Tests for error_type()."""
+
+    def test_http_status_or_class_name(self):
+        """HTTP errors should be named by status, anything else by exception class."""
+        import jobpacker
+
+        http = urllib.error.HTTPError("https://example.com", 429, "Too Many Requests", {}, None)
+        response_error = RuntimeError("bad gateway")
+        response_error.response = SimpleNamespace(status_code=502)
+
+        assert jobpacker.error_type(http) == "http_429"
+        assert jobpacker.error_type(response_error) == "http_502"
+        assert jobpacker.error_type(ConnectionError("reset")) == "ConnectionError"
+
+
+class TestRunMetrics:
+    """Tests for RunMetrics."""
+
+    def test_render(self, sample_jobspy_dataframe):
+        """Boards, errors, latency buckets and dedupe should all be reported."""
+        import jobpacker
+
+        sample_job_rows = jobpacker.JobRows.from_frame(sample_jobspy_dataframe)
+        metrics = jobpacker.RunMetrics('python "dev"')
+        metrics.results = [
+            jobpacker.BoardResult("indeed", rows=sample_job_rows, elapsed=0.7),
+            jobpacker.BoardResult("indeed", elapsed=3.0),
+            jobpacker.BoardResult("google", elapsed=0.0, cache="hit"),
+            jobpacker.BoardResult("linkedin", status="error", error_type="http_429", elapsed=0.2),
+            jobpacker.BoardResult("linkedin", status="timeout", elapsed=120.0),
+        ]
+        metrics.jobs_scraped = 4
+        metrics.jobs_unique = 3
+        metrics.export = jobpacker.ExportStats(3, 9000, 1500, 0.1, "gz")
+
+        text = metrics.render(jobpacker.EXIT_PARTIAL)
+        series = samples(text)
+        label = 'harvest="python \\"dev\\""'
+
+        assert series[f'jobpacker_board_requests{{{label},board="indeed",status="ok"}}'] == 2
+        assert series[f'jobpacker_board_rows{{{label},board="indeed"}}'] == len(sample_job_rows)
+        assert series[f'jobpacker_board_rows{{{label},board="linkedin"}}'] == 0
+        assert series[f'jobpacker_board_cache_hits{{{label},board="google"}}'] == 1
+        assert series[f'jobpacker_board_errors{{{label},board="linkedin",type="http_429"}}'] == 1
+        assert series[f'jobpacker_board_errors{{{label},board="linkedin",type="timeout"}}'] == 1
+        bucket = f'jobpacker_scrape_duration_seconds_bucket{{{label},board="indeed",le="%s"}}'
+        assert [series[bucket % le] for le in ("0.5", "1", "2.5", "5", "+Inf")] == [0, 1, 1, 2, 2]
+        assert series[f'jobpacker_scrape_duration_seconds_sum{{{label},board="indeed"}}'] == 3.7
+        # Only successful, uncached queries have latencies
+        assert "google" not in text.split("scrape_duration")[1].split("jobs_scraped")[0]
+        assert "linkedin" not in text.split("scrape_duration")[1].split("jobs_scraped")[0]
+        assert series[f"jobpacker_dedupe_ratio{{{label}}}"] == 0.25
+        assert series[f'jobpacker_export_bytes{{{label},encoding="gz"}}'] == 1500
+        assert series[f"jobpacker_run_exit_code{{{label}}}"] == jobpacker.EXIT_PARTIAL
+        assert "# TYPE jobpacker_scrape_duration_seconds histogram" in text
+
+    def test_write_replaces_file(self, tmp_path):
+        """Writing should replace the file whole and leave no temporary file behind."""
+        import jobpacker
+
+        path = tmp_path / "jobpacker.prom"
+        path.write_text("stale")
+        jobpacker.RunMetrics("python").write(str(path), jobpacker.EXIT_NO_JOBS)
+
+        assert 'jobpacker_run_exit_code{harvest="python"} 3' in path.read_text()
+        assert "jobpacker_dedupe_ratio" not in path.read_text()
+        assert [p.name for p in tmp_path.iterdir()] == ["jobpacker.prom"]
+
+
+class TestHeadlessMetrics:
+    """Tests for --metrics in headless mode."""
+
+    def test_search_writes_metrics(self, tmp_path, sample_jobspy_dataframe):
+        """A search should report every board it queried."""
+        import jobpacker
+
+        path = tmp_path / "search.prom"
+
+        def scrape(site_name, **kwargs):
+            if site_name == ["linkedin"]:
+                raise urllib.error.HTTPError("https://example.com", 429, "Too Many", {}, None)
+            return sample_jobspy_dataframe
+
+        args = ["search", "-t", "python", "-b", "indeed,linkedin", "--metrics", str(path)]
+        with patch.object(jobpacker, "scrape_jobs", side_effect=scrape):
+            code = jobpacker.main([*args, "-o", str(tmp_path / "jobs.json")])
+
+        series = samples(path.read_text())
+        assert code == jobpacker.EXIT_PARTIAL
+        assert series['jobpacker_board_rows{harvest="python",board="indeed"}'] == len(
+            sample_jobspy_dataframe
+        )
+        assert (
+            series['jobpacker_board_errors{harvest="python",board="linkedin",type="http_429"}'] == 1
+        )
+        assert series['jobpacker_export_jobs{harvest="python"}'] == len(sample_jobspy_dataframe)
+        assert series['jobpacker_phase_seconds{harvest="python",phase="scrape"}'] >= 0
+
+    def test_failed_run_still_writes_metrics(self, tmp_path):
+        """A run that fails before searching should still record its exit code."""
+        import jobpacker
+
+        path = tmp_path / "batch.prom"
+        code = jobpacker.main(["batch", str(tmp_path / "missing.json"), "--metrics", str(path)])
+
+        assert code == jobpacker.EXIT_ERROR
+        assert samples(path.read_text())['jobpacker_run_exit_code{harvest="missing"}'] == 1
+
+    def test_metrics_from_config(self, tmp_path, default_config):
+        """metrics_file in config.json should work without --metrics."""
+        import jobpacker
+
+        path = tmp_path / "config.prom"
+        jobpacker.save_config({**default_config, "metrics_file": str(path)})
+        with patch.object(jobpacker, "scrape_jobs", return_value=pd.DataFrame()):
+            code = jobpacker.main(["search", "-t", "python", "-b", "indeed", "-o", "-"])
+
+        assert code == jobpacker.EXIT_NO_JOBS
+        assert samples(path.read_text())['jobpacker_jobs_scraped{harvest="python"}'] == 0
@@ -0,0 +1,140 @@
+"""Tests for the mock job board server and scraping it."""
+
+import json
+import urllib.error
+
+import pytest
+
+
+@pytest.fixture
+def mock_boards():
+    """Start a fast mock board server for one test."""
+    from benchmarks.mock_board import BoardProfile, start_server
+
+    server = start_server(
+        BoardProfile(latency="fixed:0", page_size=10, jobs_per_query=25),
+        {"linkedin": BoardProfile(latency="fixed:0", rate_429=1.0)},
+    )
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestMockBoardServer:
+    """Tests for the mock board server."""
+
+    def test_parse_latency(self):
+        """Every distribution should parse, and nonsense should not."""
+        import random
+
+        from benchmarks.mock_board import parse_latency
+
+        rng = random.Random(1)
+        assert parse_latency("fixed:0.5")(rng) == 0.5
+        assert 1 <= parse_latency("uniform:1,2")(rng) <= 2
+        assert parse_latency("exponential:0.2")(rng) >= 0
+        assert parse_latency("lognormal:0.3,0.5")(rng) > 0
+        with pytest.raises(ValueError):
+            parse_latency("gamma:1")
+
+    def test_pages_until_results_wanted(self, mock_boards):
+        """The scraper should page through the board, stopping at results_wanted."""
+        import jobpacker
+
+        kwargs = {"site_name": ["indeed"], "search_term": "python", "location": "USA"}
+        few = jobpacker.scrape_mock_board(mock_boards.url, 5, results_wanted=15, **kwargs)
+        every = jobpacker.scrape_mock_board(mock_boards.url, 5, results_wanted=100, **kwargs)
+
+        assert len(few) == 15
+        assert len(every) == 25
+        assert every["job_url"].is_unique
+        assert set(every["site"]) == {"indeed"}
+        assert every["job_url"].tolist()[:15] == few["job_url"].tolist()
+        assert mock_boards.stats["requests"] == 5
+
+    def test_errors_are_http_errors(self, mock_boards):
+        """A rate-limited board should answer 429."""
+        import jobpacker
+
+        with pytest.raises(urllib.error.HTTPError, match="429"):
+            jobpacker.scrape_mock_board(
+                mock_boards.url,
+                5,
+                site_name=["linkedin"],
+                search_term="python",
+                location="USA",
+                results_wanted=10,
+            )
+
+
+class TestMockBoardSearches:
+    """Tests for pointing searches at the mock boards."""
+
+    def test_headless_search(self, mock_boards, tmp_path, capsys):
+        """--mock-boards should run the whole pipeline against the mock server."""
+        import jobpacker
+
+        output = tmp_path / "jobs.ndjson"
+        code = jobpacker.main(
+            [
+                "search",
+                "-t",
+                "python",
+                "-b",
+                "indeed,linkedin",
+                "-n",
+                "20",
+                "--mock-boards",
+                mock_boards.url,
+                "-f",
+                "ndjson",
+                "-o",
+                str(output),
+            ]
+        )
+
+        events = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+        boards = {event["board"]: event for event in events if event["event"] == "board"}
+        assert code == jobpacker.EXIT_PARTIAL
+        assert boards["indeed"]["status"] == "ok"
+        assert boards["linkedin"]["status"] == "error"
+        assert len(output.read_text().splitlines()) == 20
+
+    def test_leaves_local_state_alone(self, mock_boards, capsys):
+        """Synthetic jobs should stay out of the cache, job store, harvest state and seen index."""
+        import jobpacker
+
+        code = jobpacker.main(
+            [
+                "search",
+                "-t",
+                "python",
+                "-b",
+                "indeed",
+                "--incremental",
+                "--store",
+                "--mock-boards",
+                mock_boards.url,
+                "-o",
+                "-",
+            ]
+        )
+
+        assert code == jobpacker.EXIT_OK
+        assert not jobpacker.CACHE_DIR.exists()
+        assert not jobpacker.JOB_STORE_PATH.exists()
+        assert not jobpacker.HARVEST_STATE_PATH.exists()
+        assert not jobpacker.SEEN_INDEX_PATH.exists()
+
+    def test_load_test_summary(self, mock_boards):
+        """A load test should account for every query."""
+        from benchmarks.loadtest import build_queries, percentile, run_load
+
+        queries = build_queries(40, ["indeed", "glassdoor"])
+        summary = run_load(mock_boards.url, queries, workers=8, results_per_query=10)
+
+        assert len(set(queries)) == 40
+        assert summary["statuses"] == {"ok": 40}
+        assert summary["rows"] == 400
+        assert summary["p50"] <= summary["p99"] <= summary["max"]
+        assert percentile([3, 1, 2], 0.5) == 2
@@ -0,0 +1,163 @@
+"""Tests for phase timings and the --profile switch."""
+
+import json
+import pstats
+from unittest.mock import patch
+
+import pytest
+
+
+class TestPhaseTimings:
+    """Tests for PhaseTimings."""
+
+    def test_phases_add_up(self):
+        """Repeated phases should sum their time, calls, rows and bytes."""
+        import jobpacker
+
+        timings = jobpacker.PhaseTimings()
+        timings.add("export", 0.5, rows=10, size=1000)
+        with timings.phase("export") as phase:
+            phase.rows = 5
+            phase.bytes = 500
+
+        export = timings.phases["export"]
+        assert (export.calls, export.rows, export.bytes) == (2, 15, 1500)
+        assert export.seconds >= 0.5
+
+    def test_failed_block_is_still_timed(self):
+        """A phase that raises should still be recorded."""
+        import jobpacker
+
+        timings = jobpacker.PhaseTimings()
+        with pytest.raises(ValueError):
+            with timings.phase("store"):
+                raise ValueError("locked")
+
+        assert timings.phases["store"].calls == 1
+
+    def test_timed_iter_counts_items(self):
+        """Only time spent producing items counts, as one call."""
+        import jobpacker
+
+        timings = jobpacker.PhaseTimings()
+        assert list(timings.timed_iter("export.convert", range(3))) == [0, 1, 2]
+
+        convert = timings.phases["export.convert"]
+        assert (convert.calls, convert.rows) == (1, 3)
+
+    def test_summary_puts_parts_after_their_phase(self):
+        """Parts recorded before their phase finishes should still follow it."""
+        import jobpacker
+
+        timings = jobpacker.PhaseTimings()
+        timings.add("scrape.indeed", 1.0, rows=3)
+        timings.add("scrape.google", 2.0)
+        timings.add("scrape", 2.123456, rows=3)
+        timings.add("export.convert", 0.1, rows=3)
+        timings.add("export", 0.2, rows=3, size=900)
+
+        summary = timings.summary()
+
+        assert [phase["phase"] for phase in summary] == [
+            "scrape",
+            "scrape.indeed",
+            "scrape.google",
+            "export",
+            "export.convert",
+        ]
+        assert summary[0] == {
+            "phase": "scrape",
+            "seconds": 2.1235,
+            "calls": 1,
+            "rows": 3,
+            "bytes": 0,
+        }
+
+
+class TestInstrumentation:
+    """Tests for the phases recorded during a run."""
+
+    def test_search_and_export_phases(self, default_config, sample_jobspy_dataframe, tmp_path):
+        """Scrapes should be timed per board, and exports should record rows and bytes."""
+        import jobpacker
+
+        config = {**default_config, "job_boards": ["indeed", "linkedin"]}
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            results = list(
+                jobpacker.iter_board_results(["indeed", "linkedin"], "py", "USA", config)
+            )
+        jobs = jobpacker.JobRows.concat([result.rows for result in results])
+        stats = jobpacker.write_export(
+            jobpacker.iter_cleansheet_jobs(jobs), str(tmp_path / "jobs.json")
+        )
+
+        phases = {phase["phase"]: phase for phase in jobpacker.TIMINGS.summary()}
+        rows = len(sample_jobspy_dataframe)
+        assert phases["scrape"]["rows"] == 2 * rows
+        assert phases["scrape.indeed"]["rows"] == rows
+        assert phases["scrape.to_rows"]["calls"] == 2
+        assert phases["export.convert"]["rows"] == 2 * rows
+        # Both boards returned the same postings, so each ID is written once
+        assert (phases["export"]["rows"], phases["export"]["bytes"]) == (rows, stats.raw_bytes)
+
+
+class TestProfileSwitch:
+    """Tests for --profile and the "profile" setting."""
+
+    def test_headless_profile(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """A profiled run should write a pstats dump and end with a profile event."""
+        import jobpacker
+
+        dump = tmp_path / "run.prof"
+        args = ["search", "-t", "python", "-b", "indeed", "-o", "-", "--profile", str(dump)]
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            assert jobpacker.main(args) == jobpacker.EXIT_OK
+
+        events = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+        profile = events[-1]
+        assert profile["event"] == "profile"
+        assert profile["output"] == str(dump)
+        phases = [phase["phase"] for phase in profile["phases"]]
+        assert {"scrape", "scrape.indeed", "dedupe", "store", "export"} <= set(phases)
+        assert pstats.Stats(str(dump)).total_calls > 0
+
+    def test_headless_profile_default_file(self, capsys, sample_jobspy_dataframe):
+        """--profile without a file should write to PROFILE_PATH."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(["search", "-t", "python", "-b", "indeed", "-o", "-", "--profile"])
+
+        assert jobpacker.PROFILE_PATH.exists()
+
+    def test_unwritable_profile_is_reported(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """A dump that can't be written should not fail the run."""
+        import jobpacker
+
+        dump = tmp_path / "missing" / "run.prof"
+        args = ["search", "-t", "python", "-b", "indeed", "-o", "-", "--profile", str(dump)]
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            assert jobpacker.main(args) == jobpacker.EXIT_OK
+
+        profile = json.loads(capsys.readouterr().err.splitlines()[-1])
+        assert "Could not write profile" in profile["error"]
+
+    def test_interactive_profile_setting(self, default_config, capsys):
+        """With the setting on, leaving the menu should write the dump and show the phases."""
+        import jobpacker
+
+        config = {**default_config, "profile": True}
+        with (
+            patch.object(jobpacker, "preload_scraper"),
+            patch.object(jobpacker, "load_config", return_value=config),
+            patch.object(jobpacker, "display_main_menu", side_effect=["8", "4"]),
+            patch.object(
+                jobpacker, "browse_jobs", lambda jobs: jobpacker.TIMINGS.add("display", 0.1)
+            ),
+        ):
+            jobpacker.main()
+
+        out = capsys.readouterr().out
+        assert jobpacker.PROFILE_PATH.exists()
+        assert "Phase Timings" in out
+        assert "display" in out
@@ -0,0 +1,217 @@
+"""Tests for per-board rate limiting."""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+
+def make_limiter(**overrides):
+    """Build a BoardRateLimiter with test-friendly defaults."""
+    import jobpacker
+
+    settings = {
+        "rate": 1000.0,
+        "burst": 10,
+        "concurrency": 2,
+        "max_concurrency": 4,
+        "latency_target": 1.0,
+    }
+    settings.update(overrides)
+    return jobpacker.BoardRateLimiter(**settings)
+
+
+class TestTokenBucket:
+    """Tests for BoardRateLimiter token bucket behaviour."""
+
+    def test_burst_allows_immediate_requests(self):
+        """Requests up to the burst size should not wait."""
+        limiter = make_limiter(rate=0.001, burst=3, concurrency=4)
+
+        for _ in range(3):
+            assert limiter.acquire(timeout=0)
+            limiter.release(True, 0.0)
+
+    def test_empty_bucket_times_out(self):
+        """With no tokens left, acquire should give up after its timeout."""
+        limiter = make_limiter(rate=0.001, burst=1, concurrency=4)
+
+        assert limiter.acquire(timeout=0)
+        limiter.release(True, 0.0)
+        assert not limiter.acquire(timeout=0.05)
+
+    def test_tokens_refill_over_time(self):
+        """Tokens should refill at the configured rate."""
+        limiter = make_limiter(rate=50.0, burst=1, concurrency=4)
+
+        assert limiter.acquire(timeout=0)
+        limiter.release(True, 0.0)
+        start = time.monotonic()
+        assert limiter.acquire(timeout=1)
+        assert time.monotonic() - start < 0.5
+
+
+class TestConcurrencyWindow:
+    """Tests for the AIMD concurrency controller."""
+
+    def test_blocks_when_window_full(self):
+        """Acquire should wait while the window is full."""
+        limiter = make_limiter(concurrency=1)
+
+        assert limiter.acquire(timeout=0)
+        assert not limiter.acquire(timeout=0.05)
+
+    def test_release_unblocks_waiter(self):
+        """Releasing a slot should wake a waiting request."""
+        limiter = make_limiter(concurrency=1)
+        assert limiter.acquire(timeout=0)
+
+        threading.Timer(0.05, limiter.release, args=(True, 0.0)).start()
+
+        assert limiter.acquire(timeout=1)
+
+    def test_success_increases_additively(self):
+        """Fast successes should widen the window by 1/limit."""
+        limiter = make_limiter(concurrency=2)
+
+        limiter.acquire(timeout=0)
+        limiter.release(True, 0.1)
+
+        assert limiter.limit == 2.5
+
+    def test_error_decreases_multiplicatively(self):
+        """Errors should halve the window."""
+        limiter = make_limiter(concurrency=4)
+
+        limiter.acquire(timeout=0)
+        limiter.release(False, 0.1)
+
+        assert limiter.limit == 2.0
+
+    def test_slow_response_decreases(self):
+        """Responses slower than the latency target should shrink the window."""
+        limiter = make_limiter(concurrency=4, latency_target=1.0)
+
+        limiter.acquire(timeout=0)
+        limiter.release(True, 5.0)
+
+        assert limiter.limit == 2.0
+
+    def test_window_bounds(self):
+        """The window should stay between 1 and max_concurrency."""
+        limiter = make_limiter(concurrency=1, max_concurrency=2)
+
+        for _ in range(10):
+            limiter.acquire(timeout=0)
+            limiter.release(True, 0.0)
+        assert limiter.limit == 2
+
+        for _ in range(10):
+            limiter.acquire(timeout=0)
+            limiter.release(False, 0.0)
+        assert limiter.limit == 1
+
+
+class TestRateLimiterRegistry:
+    """Tests for building, applying and persisting session limiters."""
+
+    def test_config_overrides_defaults(self, default_config):
+        """Per-board config should override built-in settings."""
+        import jobpacker
+
+        config = {**default_config, "rate_limits": {"linkedin": {"rate": 0.05}}}
+
+        settings = jobpacker.rate_limit_settings("linkedin", config)
+
+        assert settings["rate"] == 0.05
+        assert settings["burst"] == jobpacker.DEFAULT_RATE_LIMITS["linkedin"]["burst"]
+
+    def test_limiter_is_shared_per_board(self, default_config):
+        """The same board should get the same limiter across searches."""
+        import jobpacker
+
+        first = jobpacker.get_rate_limiter("indeed", default_config)
+        second = jobpacker.get_rate_limiter("indeed", default_config)
+
+        assert first is second
+
+    def test_scrape_board_reports_empty_results_as_error(self, default_config):
+        """An empty result (how jobspy reports blocks) should shrink the window."""
+        import jobpacker
+
+        limiter = jobpacker.get_rate_limiter("linkedin", default_config)
+        before = limiter.limit
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=pd.DataFrame()):
+            jobpacker.scrape_board("linkedin", "python", "USA", default_config)
+
+        assert limiter.limit < before
+        assert limiter.active == 0
+
+    def test_scrape_board_releases_on_exception(self, default_config):
+        """A scrape that raises should still free its slot."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", side_effect=RuntimeError("boom")):
+            try:
+                jobpacker.scrape_board("indeed", "python", "USA", default_config)
+            except RuntimeError:
+                pass
+
+        assert jobpacker.RATE_LIMITERS["indeed"].active == 0
+
+    def test_state_persists_to_config_file(self, default_config):
+        """Learned concurrency should be written to config.json."""
+        import jobpacker
+
+        config = dict(default_config)
+        limiter = jobpacker.get_rate_limiter("glassdoor", config)
+        limiter.limit = 3.25
+
+        jobpacker.save_rate_limit_state(config)
+
+        saved = json.loads(jobpacker.CONFIG_PATH.read_text())
+        assert saved["rate_limits"]["glassdoor"]["concurrency"] == 3.25
+
+    def test_headless_overrides_are_not_saved(
+        self, default_config, tmp_path, sample_jobspy_dataframe
+    ):
+        """Saving rate limit state after a run should leave every other setting alone."""
+        import jobpacker
+
+        jobpacker.save_config(default_config)
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(
+                [
+                    "search",
+                    "-t",
+                    "python",
+                    "-b",
+                    "indeed",
+                    "-n",
+                    "5",
+                    "--remote",
+                    "--job-type",
+                    "contract",
+                    "--incremental",
+                    "--no-store",
+                    "--metrics",
+                    str(tmp_path / "jobs.prom"),
+                    "--output-dir",
+                    str(tmp_path),
+                ]
+            )
+
+        saved = json.loads(jobpacker.CONFIG_PATH.read_text())
+        assert "concurrency" in saved.pop("rate_limits")["indeed"]
+        assert saved == {k: v for k, v in default_config.items() if k != "rate_limits"}
+
+    def test_persisted_state_seeds_new_limiter(self, default_config):
+        """A saved concurrency should be used as the starting window."""
+        import jobpacker
+
+        config = {**default_config, "rate_limits": {"indeed": {"concurrency": 3}}}
+
+        assert jobpacker.get_rate_limiter("indeed", config).limit == 3
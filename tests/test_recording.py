@@ -0,0 +1,152 @@
+"""Tests for recording board responses and replaying them offline."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def recording_config(default_config, tmp_path):
+    """Return a config that records into a temporary directory."""
+    return {**default_config, "record_dir": str(tmp_path / "recording")}
+
+
+class TestScrapeRecording:
+    """Tests for ScrapeRecording."""
+
+    def test_round_trip(self, recording_config, sample_jobspy_dataframe):
+        """Replayed results should match what the board returned, without scraping."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.scrape_board("indeed", "python", "USA", recording_config)
+
+        jobpacker.RECORDINGS.clear()
+        config = {
+            **recording_config,
+            "record_dir": "",
+            "replay_dir": recording_config["record_dir"],
+        }
+        with patch.object(jobpacker, "scrape_jobs") as mock_scrape:
+            replayed = jobpacker.scrape_board("indeed", " Python ", "usa", config)
+
+        mock_scrape.assert_not_called()
+        pd.testing.assert_frame_equal(replayed, sample_jobspy_dataframe)
+
+    def test_records_query_timing_and_errors(self, recording_config):
+        """Each query should be one index line, failures included."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", side_effect=ConnectionError("403")):
+            with pytest.raises(ConnectionError):
+                jobpacker.scrape_board("linkedin", "python", "USA", recording_config)
+        with patch.object(jobpacker, "scrape_jobs", return_value=None):
+            jobpacker.scrape_board("google", "python", "USA", recording_config)
+
+        index = jobpacker.Path(recording_config["record_dir"]) / "calls.ndjson"
+        calls = [json.loads(line) for line in index.read_text().splitlines()]
+
+        assert [(c["board"], c["rows"], c["error"], c["file"]) for c in calls] == [
+            ("linkedin", 0, "ConnectionError: 403", None),
+            ("google", 0, None, None),
+        ]
+        assert calls[0]["kwargs"]["results_wanted"] == recording_config["results_per_site"]
+        assert calls[0]["elapsed"] >= 0
+
+    def test_replay_timing_and_repeats(self, tmp_path):
+        """Replays should keep the recorded delay unless fast, and start over when exhausted."""
+        import jobpacker
+
+        recording = jobpacker.ScrapeRecording(tmp_path)
+        recording.record("indeed", "python", "USA", {}, recording.started, 0.3, None)
+        recording.record(
+            "indeed", "python", "USA", {}, recording.started, 0.3, error=TimeoutError("slow")
+        )
+
+        start = time.monotonic()
+        assert recording.replay("indeed", "python", "USA") is None
+        assert time.monotonic() - start >= 0.3
+
+        start = time.monotonic()
+        with pytest.raises(RuntimeError, match="TimeoutError: slow"):
+            recording.replay("indeed", "python", "USA", fast=True)
+        assert recording.replay("indeed", "python", "USA", fast=True) is None
+        assert time.monotonic() - start < 0.3
+
+        with pytest.raises(LookupError):
+            recording.replay("indeed", "java", "USA", fast=True)
+
+    def test_replay_skips_cache_and_reports_missing_queries(self, default_config, tmp_path):
+        """Replayed searches should not use the cache, and unrecorded boards should fail."""
+        import jobpacker
+
+        recording = jobpacker.ScrapeRecording(tmp_path)
+        recording.record("indeed", "python", "USA", {}, recording.started, 0.0, None)
+        config = {**default_config, "replay_dir": str(tmp_path), "replay_speed": "fast"}
+
+        with patch.object(jobpacker.ResultCache, "get") as cache_get:
+            results = {
+                result.board: result
+                for result in jobpacker.iter_board_results(
+                    ["indeed", "linkedin"], "python", "USA", config
+                )
+            }
+
+        cache_get.assert_not_called()
+        assert results["indeed"].status == "ok"
+        assert results["linkedin"].status == "error"
+        assert "no recorded linkedin response" in results["linkedin"].error
+
+
+class TestHeadlessReplay:
+    """Tests for --record and --replay in headless mode."""
+
+    def test_replayed_search_exports_the_same_jobs(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """A replay should export exactly what the recorded search exported."""
+        import jobpacker
+
+        recording = tmp_path / "recording"
+        args = ["search", "-t", "python", "-b", "indeed,linkedin", "--no-store", "-o"]
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            assert jobpacker.main([*args, "-", "--record", str(recording)]) == jobpacker.EXIT_OK
+        recorded = capsys.readouterr().out
+
+        jobpacker.RECORDINGS.clear()
+        with patch.object(jobpacker, "scrape_jobs") as mock_scrape:
+            code = jobpacker.main([*args, "-", "--replay", str(recording), "--replay-fast"])
+
+        mock_scrape.assert_not_called()
+        assert code == jobpacker.EXIT_OK
+        assert capsys.readouterr().out == recorded
+
+    def test_replay_leaves_local_state_alone(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """Replayed jobs should stay out of the harvest state, seen index and job store."""
+        import jobpacker
+
+        recording = tmp_path / "recording"
+        args = ["search", "-t", "python", "-b", "linkedin", "-o", "-"]
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main([*args, "--no-store", "--record", str(recording)])
+
+        jobpacker.RECORDINGS.clear()
+        code = jobpacker.main(
+            [*args, "--incremental", "--store", "--replay", str(recording), "--replay-fast"]
+        )
+
+        assert code == jobpacker.EXIT_OK
+        assert not jobpacker.HARVEST_STATE_PATH.exists()
+        assert not jobpacker.SEEN_INDEX_PATH.exists()
+        assert not jobpacker.JOB_STORE_PATH.exists()
+
+    def test_missing_recording(self, tmp_path, capsys):
+        """Replaying a directory with no recording should fail before searching."""
+        import jobpacker
+
+        code = jobpacker.main(["search", "-t", "python", "--replay", str(tmp_path), "-o", "-"])
+
+        assert code == jobpacker.EXIT_ERROR
+        assert "No recording" in capsys.readouterr().err
@@ -19,7 +19,7 @@ class TestSearchJobs:
                 with patch.object(jobpacker, "display_jobs_table"):
                     jobs, search_term = jobpacker.search_jobs(default_config)
 
-        assert isinstance(jobs, list)
+        assert isinstance(jobs, jobpacker.JobRows)
         assert len(jobs) > 0
         assert search_term == "python developer"
 
@@ -50,10 +50,11 @@ class TestSearchJobs:
                 with patch.object(jobpacker, "display_jobs_table"):
                     jobpacker.search_jobs(custom_config)
 
-        # Verify scrape_jobs was called with config values
-        mock_scrape.assert_called_once()
+        # Verify scrape_jobs was called once per board with config values
+        assert mock_scrape.call_count == len(custom_config["job_boards"])
+        called_sites = sorted(call.kwargs["site_name"][0] for call in mock_scrape.call_args_list)
+        assert called_sites == sorted(custom_config["job_boards"])
         call_kwargs = mock_scrape.call_args.kwargs
-        assert call_kwargs["site_name"] == custom_config["job_boards"]
         assert call_kwargs["results_wanted"] == custom_config["results_per_site"]
         assert call_kwargs["is_remote"] == custom_config["remote_only"]
         assert call_kwargs["job_type"] == custom_config["job_type"]
@@ -106,11 +107,249 @@ class TestSearchJobs:
                 with patch.object(jobpacker, "display_jobs_table"):
                     jobs, _ = jobpacker.search_jobs(default_config)
 
-        assert isinstance(jobs, list)
+        assert isinstance(jobs, jobpacker.JobRows)
         assert all(isinstance(job, dict) for job in jobs)
-        # Should have same number of jobs as rows in DataFrame
+        # Every board returned the same rows, so duplicates collapse to one per job
         assert len(jobs) == len(sample_jobspy_dataframe)
 
+    def test_search_keeps_duplicates_when_dedupe_disabled(
+        self, default_config, sample_jobspy_dataframe, mock_console
+    ):
+        """With dedupe off, each board's rows should all be returned."""
+        import jobpacker
+
+        config = {**default_config, "dedupe": False}
+
+        with patch.object(jobpacker.Prompt, "ask", side_effect=["test search", "USA"]):
+            with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+                with patch.object(jobpacker, "display_jobs_table"):
+                    jobs, _ = jobpacker.search_jobs(config)
+
+        assert len(jobs) == len(sample_jobspy_dataframe) * len(config["job_boards"])
+
+
+class TestIterBoardResults:
+    """Tests for the concurrent per-board search engine."""
+
+    def test_yields_each_board_once(self, default_config, sample_jobspy_dataframe):
+        """Should yield one (board, rows) pair per requested board."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            results = list(
+                jobpacker.iter_board_results(
+                    default_config["job_boards"], "python", "USA", default_config
+                )
+            )
+
+        assert sorted(r.board for r in results) == sorted(default_config["job_boards"])
+        assert all(len(r.rows) == len(sample_jobspy_dataframe) for r in results)
+        assert all(r.status == "ok" for r in results)
+
+    def test_scrapes_single_board_per_call(self, default_config, sample_jobspy_dataframe):
+        """Each scrape_jobs call should target exactly one board."""
+        import jobpacker
+
+        mock_scrape = MagicMock(return_value=sample_jobspy_dataframe)
+
+        with patch.object(jobpacker, "scrape_jobs", mock_scrape):
+            list(
+                jobpacker.iter_board_results(
+                    ["indeed", "linkedin"], "python", "USA", default_config
+                )
+            )
+
+        sites = sorted(call.kwargs["site_name"] for call in mock_scrape.call_args_list)
+        assert sites == [["indeed"], ["linkedin"]]
+
+    def test_yields_fast_board_before_slow_board(self, default_config, sample_jobspy_dataframe):
+        """Rows should be handed back as soon as each board finishes."""
+        import time
+
+        import jobpacker
+
+        def fake_scrape(site_name, **kwargs):
+            if site_name == ["linkedin"]:
+                time.sleep(0.2)
+            return sample_jobspy_dataframe
+
+        with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+            order = [
+                result.board
+                for result in jobpacker.iter_board_results(
+                    ["linkedin", "indeed"], "python", "USA", default_config
+                )
+            ]
+
+        assert order == ["indeed", "linkedin"]
+
+    def test_handles_none_results(self, default_config):
+        """Boards returning None should yield an empty row list."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=None):
+            results = list(
+                jobpacker.iter_board_results(["indeed"], "python", "USA", default_config)
+            )
+
+        assert [(r.board, r.rows, r.status) for r in results] == [("indeed", [], "ok")]
+
+    def test_no_boards_yields_nothing(self, default_config):
+        """An empty board list should not start any scrapes."""
+        import jobpacker
+
+        mock_scrape = MagicMock()
+
+        with patch.object(jobpacker, "scrape_jobs", mock_scrape):
+            results = list(jobpacker.iter_board_results([], "python", "USA", default_config))
+
+        assert results == []
+        mock_scrape.assert_not_called()
+
+
+class TestIterSearchResults:
+    """Tests for failures and deadlines in the concurrent search loop."""
+
+    def test_failing_board_does_not_discard_others(self, default_config, sample_jobspy_dataframe):
+        """A board that raises should be reported while other boards keep their rows."""
+        import jobpacker
+
+        def fake_scrape(site_name, **kwargs):
+            if site_name == ["glassdoor"]:
+                raise RuntimeError("403 Forbidden")
+            return sample_jobspy_dataframe
+
+        with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+            results = {
+                r.board: r
+                for r in jobpacker.iter_board_results(
+                    ["indeed", "glassdoor"], "python", "USA", default_config
+                )
+            }
+
+        assert results["indeed"].status == "ok"
+        assert len(results["indeed"].rows) == len(sample_jobspy_dataframe)
+        assert results["glassdoor"].status == "error"
+        assert "403" in results["glassdoor"].error
+
+    def test_board_timeout_abandons_stuck_board(
+        self, default_config, sample_jobspy_dataframe, monkeypatch
+    ):
+        """A board exceeding board_timeout should be reported as timed out."""
+        import threading
+
+        import jobpacker
+
+        release = threading.Event()
+        monkeypatch.setattr(jobpacker, "DEADLINE_POLL_INTERVAL", 0.02)
+        config = {**default_config, "board_timeout": 0.1}
+
+        def fake_scrape(site_name, **kwargs):
+            if site_name == ["linkedin"]:
+                release.wait(5)
+            return sample_jobspy_dataframe
+
+        try:
+            with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+                results = {
+                    r.board: r
+                    for r in jobpacker.iter_board_results(
+                        ["indeed", "linkedin"], "python", "USA", config
+                    )
+                }
+        finally:
+            release.set()
+
+        assert results["indeed"].status == "ok"
+        assert results["linkedin"].status == "timeout"
+        assert results["linkedin"].rows == []
+
+    def test_search_deadline_stops_all_pending_boards(
+        self, default_config, sample_jobspy_dataframe, monkeypatch
+    ):
+        """Boards still running at the global deadline should time out."""
+        import threading
+
+        import jobpacker
+
+        release = threading.Event()
+        monkeypatch.setattr(jobpacker, "DEADLINE_POLL_INTERVAL", 0.02)
+        config = {**default_config, "search_timeout": 0.1}
+
+        def fake_scrape(site_name, **kwargs):
+            release.wait(5)
+            return sample_jobspy_dataframe
+
+        try:
+            with patch.object(jobpacker, "scrape_jobs", side_effect=fake_scrape):
+                results = list(
+                    jobpacker.iter_board_results(["indeed", "linkedin"], "python", "USA", config)
+                )
+        finally:
+            release.set()
+
+        assert {r.status for r in results} == {"timeout"}
+        assert all(r.error == "search deadline reached" for r in results)
+
+
+class TestSearchDashboard:
+    """Tests for the live view shown while boards are searched."""
+
+    @staticmethod
+    def render(dashboard):
+        """Render the dashboard to plain text."""
+        from rich.console import Console
+
+        console = Console(width=160)
+        with console.capture() as capture:
+            console.print(dashboard)
+        return capture.get()
+
+    def test_shows_rows_before_all_boards_finish(self, sample_jobspy_jobs):
+        """Jobs from the first board should be shown while the others still run."""
+        import jobpacker
+
+        dashboard = jobpacker.SearchDashboard(["indeed", "linkedin"])
+        assert dashboard.first_result is None
+        assert "Senior Python Developer" not in self.render(dashboard)
+
+        dashboard.add(jobpacker.BoardResult("indeed", rows=sample_jobspy_jobs[:2], elapsed=1.5))
+        output = self.render(dashboard)
+
+        assert dashboard.first_result is not None
+        assert "Senior Python Developer" in output
+        assert "✓ done" in output
+        assert "2 jobs so far from 1 of 2 boards" in output
+
+    def test_preview_keeps_newest_rows(self, monkeypatch, sample_jobspy_jobs):
+        """Only the newest LIVE_PREVIEW_ROWS jobs should be previewed."""
+        import jobpacker
+
+        monkeypatch.setattr(jobpacker, "LIVE_PREVIEW_ROWS", 2)
+        dashboard = jobpacker.SearchDashboard(["indeed", "linkedin"])
+        dashboard.add(jobpacker.BoardResult("indeed", rows=sample_jobspy_jobs[:3]))
+        dashboard.add(jobpacker.BoardResult("linkedin", status="timeout", error="no response"))
+
+        assert [job["company"] for job in dashboard.recent] == ["Data Inc", "StartupXYZ"]
+        assert dashboard.total == 3
+        assert "⏱ timed out" in self.render(dashboard)
+
+    def test_search_reports_time_to_first_result(
+        self, default_config, sample_jobspy_dataframe, mock_console
+    ):
+        """After a search the time to the first and last board should be shown."""
+        import jobpacker
+
+        with patch.object(jobpacker.Prompt, "ask", side_effect=["python", "USA"]):
+            with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+                with patch.object(jobpacker, "display_jobs_table"):
+                    jobpacker.search_jobs(default_config)
+
+        printed = " ".join(
+            str(call.args[0]) for call in mock_console.print.call_args_list if call.args
+        )
+        assert "First jobs after" in printed
+
 
 class TestDisplayJobsTable:
     """Tests for display_jobs_table function."""
@@ -229,3 +468,42 @@ class TestSelectJobBoards:
         # Should include indices 1 and 2, skip 99
         assert "indeed" in result
         assert "linkedin" in result
+
+
+class TestSearchCancellation:
+    """Tests for partial results when a search is interrupted."""
+
+    def test_ctrl_c_keeps_collected_rows(self, default_config, sample_jobspy_jobs, mock_console):
+        """Ctrl-C should stop the search but keep rows from finished boards."""
+        import jobpacker
+
+        def fake_results(*args, **kwargs):
+            yield jobpacker.BoardResult("indeed", rows=list(sample_jobspy_jobs))
+            raise KeyboardInterrupt
+
+        with patch.object(jobpacker.Prompt, "ask", side_effect=["python", "USA"]):
+            with patch.object(jobpacker, "iter_board_results", side_effect=fake_results):
+                with patch.object(jobpacker, "display_jobs_table"):
+                    jobs, search_term = jobpacker.search_jobs(default_config)
+
+        assert len(jobs) == len(sample_jobspy_jobs)
+        assert search_term == "python"
+
+    def test_summary_reports_unfinished_boards(self, mock_console):
+        """Summary should list boards that timed out, failed or were cancelled."""
+        import jobpacker
+
+        jobpacker.display_search_summary(
+            [
+                jobpacker.BoardResult("indeed", rows=[{}]),
+                jobpacker.BoardResult("linkedin", status="timeout", error="no response"),
+                jobpacker.BoardResult("glassdoor", status="error", error="403"),
+                jobpacker.BoardResult("google", status="cancelled"),
+            ]
+        )
+
+        printed = " ".join(str(call.args[0]) for call in mock_console.print.call_args_list)
+        assert "indeed" not in printed
+        assert "linkedin" in printed
+        assert "glassdoor" in printed
+        assert "google" in printed
@@ -0,0 +1,87 @@
+"""Tests for fast startup and the background import of the scraping stack."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+class TestStartup:
+    """Tests for time-to-menu."""
+
+    def test_import_does_not_load_scraping_stack(self):
+        """Importing jobpacker should not import jobspy, pandas or numpy."""
+        code = (
+            "import sys, jobpacker; "
+            "print([m for m in ('jobspy', 'pandas', 'numpy') if m in sys.modules])"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, timeout=60
+        )
+
+        assert proc.stdout.strip() == "[]"
+
+    def test_menu_shown_before_scraper_import_finishes(self, monkeypatch, mock_console):
+        """The main menu should not wait for the background jobspy import."""
+        import jobpacker
+
+        release = threading.Event()
+        monkeypatch.setattr(jobpacker, "_scraper_loader", None)
+        monkeypatch.setattr(jobpacker, "_import_scraper", lambda: release.wait(10))
+        monkeypatch.delitem(sys.modules, "jobspy", raising=False)
+
+        try:
+            jobpacker.preload_scraper()
+            jobpacker.display_banner()
+            with patch.object(jobpacker.Prompt, "ask", return_value="4"):
+                choice = jobpacker.display_main_menu()
+
+            assert choice == "4"
+            assert jobpacker._scraper_loader.is_alive()
+        finally:
+            release.set()
+        jobpacker._scraper_loader.join(5)
+        assert not jobpacker._scraper_loader.is_alive()
+
+
+class TestLoadScraper:
+    """Tests for the background jobspy loader."""
+
+    def test_load_waits_for_preload(self, monkeypatch):
+        """load_scraper should return jobspy's scrape_jobs once the loader finishes."""
+        import jobspy  # noqa: F401
+
+        import jobpacker
+
+        # Drop jobspy from the module cache (monkeypatch restores it) so the loader runs
+        monkeypatch.setattr(jobpacker, "_scraper_loader", None)
+        monkeypatch.delitem(sys.modules, "jobspy")
+        jobpacker.preload_scraper()
+
+        assert jobpacker.load_scraper() is sys.modules["jobspy"].scrape_jobs
+        assert not jobpacker._scraper_loader.is_alive()
+
+    def test_preload_skipped_when_loaded(self, monkeypatch):
+        """No thread should be started when jobspy is already imported."""
+        import jobspy  # noqa: F401
+
+        import jobpacker
+
+        monkeypatch.setattr(jobpacker, "_scraper_loader", None)
+        jobpacker.preload_scraper()
+
+        assert jobpacker._scraper_loader is None
+
+    def test_scrape_jobs_forwards_arguments(self):
+        """The scrape_jobs wrapper should call jobspy with the same arguments."""
+        import jobpacker
+
+        fake = MagicMock(return_value="results")
+        with patch.object(jobpacker, "load_scraper", return_value=fake):
+            result = jobpacker.scrape_jobs(site_name=["indeed"], search_term="python")
+
+        fake.assert_called_once_with(site_name=["indeed"], search_term="python")
+        assert result == "results"
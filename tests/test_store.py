@@ -0,0 +1,277 @@
+"""Tests for the local SQLite job store."""
+
+import json
+from unittest.mock import patch
+
+
+def open_store():
+    """Open the job store used by the session."""
+    import jobpacker
+
+    return jobpacker.JobStore(jobpacker.JOB_STORE_PATH)
+
+
+class TestJobStore:
+    """Tests for JobStore saving and querying."""
+
+    def test_round_trip_exports_identically(self, sample_jobspy_jobs):
+        """Stored jobs should convert to the same Cleansheet jobs as fresh ones."""
+        import jobpacker
+
+        with open_store() as store:
+            run_id = store.save_run(sample_jobspy_jobs, "search", "python", "USA", ["indeed"])
+            stored = store.query(run_id=run_id)
+
+        assert jobpacker.to_cleansheet_jobs(stored) == jobpacker.to_cleansheet_jobs(
+            sample_jobspy_jobs
+        )
+
+    def test_repeat_runs_store_each_job_once(self, sample_jobspy_jobs):
+        """A job seen by two runs should be one row, linked from both runs."""
+        changed = [{**sample_jobspy_jobs[0], "title": "Staff Python Developer"}]
+
+        with open_store() as store:
+            first = store.save_run(sample_jobspy_jobs, "search", "python", "USA")
+            first_seen = store.conn.execute("SELECT first_seen FROM jobs LIMIT 1").fetchone()[0]
+            second = store.save_run(changed, "search", "python", "USA")
+
+            assert store.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 4
+            assert store.query(run_id=second)[0]["title"] == "Staff Python Developer"
+            assert store.query(run_id=first)[0]["title"] == "Staff Python Developer"
+            assert (
+                store.conn.execute(
+                    "SELECT first_seen FROM jobs WHERE job_url = ?", (changed[0]["job_url"],)
+                ).fetchone()[0]
+                == first_seen
+            )
+
+    def test_runs_newest_first(self, sample_jobspy_jobs):
+        """Runs should list newest first with their job counts."""
+        with open_store() as store:
+            store.save_run(sample_jobspy_jobs, "search", "python", "USA")
+            store.save_run(sample_jobspy_jobs[:1], "batch", "grid")
+
+            runs = store.runs()
+
+        assert [(run["kind"], run["label"], run["jobs"]) for run in runs] == [
+            ("batch", "grid", 1),
+            ("search", "python", 4),
+        ]
+
+    def test_filters(self, sample_jobspy_jobs):
+        """Site, company and posting-date filters should narrow the results."""
+        with open_store() as store:
+            store.save_run(sample_jobspy_jobs, "search", "python", "USA")
+
+            assert [job["site"] for job in store.query(site="linkedin")] == ["linkedin"]
+            assert [job["company"] for job in store.query(company="tech corp")] == ["Tech Corp"]
+            assert [job["company"] for job in store.query(since="2025-01-15")] == [
+                "Tech Corp",
+                "BigTech",
+            ]
+            assert len(store.query(limit=2)) == 2
+
+    def test_wal_mode_and_indexes(self):
+        """The store should use WAL and look jobs up through its indexes."""
+        with open_store() as store:
+            journal = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+            plans = {
+                column: store.conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT data FROM jobs WHERE {column} = ?", ("x",)
+                ).fetchall()[0][3]
+                for column in ("job_url", "site", "date_posted", "company COLLATE NOCASE")
+            }
+
+        assert journal == "wal"
+        assert all("USING INDEX" in plan for plan in plans.values())
+
+    def test_batches_large_runs(self, monkeypatch, sample_jobspy_jobs):
+        """Runs larger than one batch should keep every job in order."""
+        import jobpacker
+
+        monkeypatch.setattr(jobpacker, "STORE_BATCH_ROWS", 3)
+        jobs = [
+            {**sample_jobspy_jobs[i % 4], "job_url": f"https://example.com/job/{i}"}
+            for i in range(10)
+        ]
+
+        with open_store() as store:
+            run_id = store.save_run(jobs, "search", "python")
+            urls = store.query(run_id=run_id).column("job_url")
+
+        assert urls == [job["job_url"] for job in jobs]
+
+
+class TestSavedSearches:
+    """Tests for saving and loading runs from the UI and CLI."""
+
+    def test_search_is_saved(self, default_config, mock_console, mock_scrape_jobs):
+        """An interactive search should be saved as a run."""
+        import jobpacker
+
+        config = {**default_config, "job_boards": ["indeed"]}
+        with patch.object(jobpacker.Prompt, "ask", side_effect=["python", "Austin, TX"]):
+            jobs, _ = jobpacker.search_jobs(config)
+
+        with open_store() as store:
+            run = store.latest_run()
+
+        assert (run["kind"], run["label"], run["location"]) == ("search", "python", "Austin, TX")
+        assert run["jobs"] == len(jobs)
+
+    def test_store_disabled(self, default_config, sample_jobspy_jobs, mock_console):
+        """job_store=False should write nothing."""
+        import jobpacker
+
+        config = {**default_config, "job_store": False}
+
+        assert jobpacker.save_search_run(sample_jobspy_jobs, "search", "x", "", config) is None
+        assert not jobpacker.JOB_STORE_PATH.exists()
+
+    def test_load_saved_search(self, default_config, sample_jobspy_jobs, mock_console):
+        """Picking a saved run should load its jobs for export."""
+        import jobpacker
+
+        jobpacker.save_search_run(sample_jobspy_jobs, "search", "python", "USA", default_config)
+        with patch.object(jobpacker.Prompt, "ask", return_value="1"):
+            jobs, label = jobpacker.load_saved_search(default_config)
+
+        assert label == "python"
+        assert [job["job_url"] for job in jobs] == [job["job_url"] for job in sample_jobspy_jobs]
+
+    def test_load_without_store(self, default_config, mock_console):
+        """With nothing saved, no jobs should be loaded."""
+        import jobpacker
+
+        assert jobpacker.load_saved_search(default_config) == ([], "")
+
+    def test_cli_export_saved_run(self, tmp_path, capsys, sample_jobspy_dataframe):
+        """A headless search should be exportable again without scraping."""
+        import jobpacker
+
+        with patch.object(jobpacker, "scrape_jobs", return_value=sample_jobspy_dataframe):
+            jobpacker.main(["search", "-t", "python", "-b", "indeed", "-o", "-"])
+        fresh = capsys.readouterr().out
+
+        output = tmp_path / "saved.json"
+        with patch.object(jobpacker, "scrape_jobs") as mock_scrape:
+            code = jobpacker.main(["export", "--site", "indeed", "-o", str(output)])
+
+        mock_scrape.assert_not_called()
+        assert code == jobpacker.EXIT_OK
+        assert json.loads(output.read_text())["jobs"] == [
+            job for job in json.loads(fresh)["jobs"] if job["source"] == "indeed"
+        ]
+
+    def test_cli_lists_runs(self, capsys, sample_jobspy_jobs, default_config):
+        """`runs` should print one JSON object per saved run."""
+        import jobpacker
+
+        jobpacker.save_search_run(sample_jobspy_jobs, "search", "python", "USA", default_config)
+        capsys.readouterr()
+
+        code = jobpacker.main(["runs"])
+
+        runs = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert code == jobpacker.EXIT_OK
+        assert [(run["id"], run["label"], run["jobs"]) for run in runs] == [(1, "python", 4)]
+
+    def test_cli_export_without_store(self, capsys):
+        """Exporting before anything was saved should fail cleanly."""
+        import jobpacker
+
+        assert jobpacker.main(["export"]) == jobpacker.EXIT_ERROR
+
+
+class TestFullTextSearch:
+    """Tests for searching stored jobs with FTS5."""
+
+    def test_fts_query_quotes_terms(self):
+        """Punctuation should be quoted away while operators and prefixes survive."""
+        import jobpacker
+
+        assert jobpacker.fts_query('node.js "Senior dev" OR c++ NOT java*') == (
+            '"node js" "Senior dev" OR "c" NOT "java"*'
+        )
+        assert jobpacker.fts_query("!!") == ""
+
+    def test_ranks_title_matches_first(self, sample_jobspy_jobs):
+        """A title match should outrank a description-only match."""
+        jobs = [
+            {**sample_jobspy_jobs[0], "title": "Account Manager", "description": "Uses Python."},
+            {**sample_jobspy_jobs[1], "title": "Python Engineer", "description": "Backend work."},
+        ]
+
+        with open_store() as store:
+            store.save_run(jobs, "search", "python")
+            matches = store.search("python")
+
+        assert matches.column("title") == ["Python Engineer", "Account Manager"]
+        assert "\x02Python\x03" in matches[0]["snippet"]
+
+    def test_stemming_phrases_and_filters(self, sample_jobspy_jobs):
+        """Queries should match word forms and honour phrases, NOT and filters."""
+        with open_store() as store:
+            store.save_run(sample_jobspy_jobs, "search", "python")
+
+            assert store.search("positions").column("company") == ["StartupXYZ"]
+            assert store.search('"junior developer"').column("company") == ["StartupXYZ"]
+            assert store.search("python NOT senior").column("company") == []
+            assert store.search("developer", site="glassdoor").column("site") == ["glassdoor"]
+            assert store.search("level NOT senior").column("company") == ["StartupXYZ"]
+            assert len(store.search("developer", limit=1)) == 1
+            assert not store.search("kubernetes")
+
+    def test_changed_jobs_are_reindexed(self, sample_jobspy_jobs):
+        """Updated text should replace the old text in the index."""
+        first = {**sample_jobspy_jobs[0], "description": "Old stack: Perl."}
+        second = {**sample_jobspy_jobs[0], "description": "New stack: Rust."}
+
+        with open_store() as store:
+            store.save_run([first], "search", "python")
+            store.save_run([first, second, first, second], "search", "python")
+            store.conn.execute("INSERT INTO jobs_fts (jobs_fts) VALUES ('integrity-check')")
+
+            assert len(store.search("rust")) == 1
+            assert not store.search("perl")
+
+    def test_existing_store_is_indexed_on_upgrade(self, monkeypatch, sample_jobspy_jobs):
+        """Jobs saved before the index existed should become searchable."""
+        import jobpacker
+
+        with monkeypatch.context() as patched:
+            patched.setattr(jobpacker.JobStore, "MIGRATIONS", jobpacker.JobStore.MIGRATIONS[:1])
+            with open_store() as store:
+                store.save_run(sample_jobspy_jobs, "search", "python")
+
+        with open_store() as store:
+            assert store.search("cloud").column("company") == ["Data Inc"]
+
+    def test_menu_search(self, default_config, sample_jobspy_jobs, mock_console):
+        """Searching saved jobs from the menu should load the matches."""
+        import jobpacker
+
+        jobpacker.save_search_run(sample_jobspy_jobs, "search", "python", "USA", default_config)
+        with patch.object(jobpacker.Prompt, "ask", return_value="full stack"):
+            jobs, label = jobpacker.search_saved_jobs(default_config)
+
+        assert label == "full stack"
+        assert [job["company"] for job in jobs] == ["BigTech"]
+
+    def test_cli_find(self, tmp_path, capsys, sample_jobspy_jobs, default_config):
+        """`find` should export the matching jobs, best first."""
+        import jobpacker
+
+        jobpacker.save_search_run(sample_jobspy_jobs, "search", "python", "USA", default_config)
+        output = tmp_path / "found.ndjson"
+
+        code = jobpacker.main(["find", "python OR entry", "-f", "ndjson", "-o", str(output)])
+
+        done = json.loads(capsys.readouterr().err.splitlines()[-1])
+        assert code == jobpacker.EXIT_OK
+        assert done["jobs"] == 2 and "query_ms" in done
+        assert [json.loads(line)["company"] for line in output.read_text().splitlines()] == [
+            "Tech Corp",
+            "StartupXYZ",
+        ]
+        assert jobpacker.main(["find", "kubernetes", "-o", "-"]) == jobpacker.EXIT_NO_JOBS
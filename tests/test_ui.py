@@ -213,4 +213,89 @@ class TestMainLoop:
                             jobpacker.main()
 
         # Export should be called with the jobs from search
-        mock_export.assert_called_once_with(test_jobs, "test")
+        mock_export.assert_called_once_with(
+            test_jobs,
+            "test",
+            incremental=False,
+            compact=False,
+            compression="",
+            compression_level=jobpacker.EXPORT_COMPRESSION_LEVEL,
+            description_store="off",
+            harvest_runs={},
+        )
+
+    def test_main_calls_batch_search_on_option_5(self, mock_console):
+        """Should call batch_search and keep its results for export."""
+        import jobpacker
+
+        test_jobs = [{"title": "Batch Job"}]
+        mock_batch = MagicMock(return_value=(test_jobs, "grid"))
+        mock_export = MagicMock()
+
+        with patch.object(jobpacker, "display_banner"):
+            with patch.object(jobpacker, "load_config", return_value={}):
+                with patch.object(jobpacker, "display_main_menu", side_effect=["5", "3", "4"]):
+                    with patch.object(jobpacker, "batch_search", mock_batch):
+                        with patch.object(jobpacker, "export_jobs", mock_export):
+                            jobpacker.main()
+
+        mock_export.assert_called_once_with(
+            test_jobs,
+            "grid",
+            incremental=False,
+            compact=False,
+            compression="",
+            compression_level=jobpacker.EXPORT_COMPRESSION_LEVEL,
+            description_store="off",
+            harvest_runs={},
+        )
+
+    def test_main_loads_saved_search_on_option_6(self, mock_console):
+        """Should keep the jobs of a loaded saved search for export."""
+        import jobpacker
+
+        test_jobs = [{"title": "Saved Job"}]
+        mock_load = MagicMock(return_value=(test_jobs, "python"))
+        mock_export = MagicMock()
+
+        with patch.object(jobpacker, "display_banner"):
+            with patch.object(jobpacker, "load_config", return_value={}):
+                with patch.object(jobpacker, "display_main_menu", side_effect=["6", "3", "4"]):
+                    with patch.object(jobpacker, "load_saved_search", mock_load):
+                        with patch.object(jobpacker, "export_jobs", mock_export):
+                            jobpacker.main()
+
+        assert mock_export.call_args.args == (test_jobs, "python")
+
+    def test_main_searches_saved_jobs_on_option_7(self, mock_console):
+        """Should keep the matches of a saved-job search for export."""
+        import jobpacker
+
+        test_jobs = [{"title": "Matched Job"}]
+        mock_search = MagicMock(return_value=(test_jobs, "rust"))
+        mock_export = MagicMock()
+
+        with patch.object(jobpacker, "display_banner"):
+            with patch.object(jobpacker, "load_config", return_value={}):
+                with patch.object(jobpacker, "display_main_menu", side_effect=["7", "3", "4"]):
+                    with patch.object(jobpacker, "search_saved_jobs", mock_search):
+                        with patch.object(jobpacker, "export_jobs", mock_export):
+                            jobpacker.main()
+
+        assert mock_export.call_args.args == (test_jobs, "rust")
+
+    def test_main_browses_results_on_option_8(self, mock_console):
+        """Should open the results viewer on the current jobs."""
+        import jobpacker
+
+        test_jobs = [{"title": "Test Job"}]
+        mock_browse = MagicMock()
+
+        with patch.object(jobpacker, "display_banner"):
+            with patch.object(jobpacker, "load_config", return_value={}):
+                with patch.object(jobpacker, "display_main_menu", side_effect=["1", "8", "4"]):
+                    with patch.object(jobpacker, "search_jobs", return_value=(test_jobs, "t")):
+                        with patch.object(jobpacker, "browse_jobs", mock_browse):
+                            jobpacker.main()
+
+        mock_browse.assert_called_once_with(test_jobs)
@@ -0,0 +1,174 @@
+"""Tests for the paged results viewer."""
+
+from unittest.mock import patch
+
+import pytest
+from rich.console import Console
+
+
+@pytest.fixture
+def view(sample_jobspy_jobs):
+    """Return a JobsView over the sample jobs, two per page."""
+    import jobpacker
+
+    return jobpacker.JobsView(sample_jobspy_jobs, page_size=2)
+
+
+def companies(view):
+    """Return the companies of every visible row, in view order."""
+    return [view.jobs[i]["company"] for i in view.positions]
+
+
+class TestJobsViewSorting:
+    """Tests for JobsView sorting."""
+
+    def test_unsorted_keeps_search_order(self, view):
+        """Before sorting, rows should be in the order they were found."""
+        assert companies(view) == ["Tech Corp", "Data Inc", "StartupXYZ", "BigTech"]
+
+    def test_date_newest_first_missing_last(self, view):
+        """Dates should sort newest first, with undated rows last either way."""
+        view.sort("date")
+        assert companies(view) == ["BigTech", "Tech Corp", "Data Inc", "StartupXYZ"]
+
+        view.sort("date")
+        assert companies(view) == ["Data Inc", "Tech Corp", "BigTech", "StartupXYZ"]
+
+    def test_salary_by_top_of_range(self, view):
+        """Salaries should sort by the top of the range, or the only amount given."""
+        view.sort("salary")
+
+        assert companies(view) == ["Tech Corp", "Data Inc", "BigTech", "StartupXYZ"]
+
+    def test_text_fields_ignore_case(self, sample_jobspy_jobs):
+        """Company and source sorts should be A to Z ignoring case."""
+        import jobpacker
+
+        jobs = sample_jobspy_jobs + [{**sample_jobspy_jobs[0], "company": "acme"}]
+        view = jobpacker.JobsView(jobs)
+
+        view.sort("company")
+        assert companies(view)[:2] == ["acme", "BigTech"]
+        view.sort("source")
+        assert [view.jobs[i]["site"] for i in view.positions][0] == "glassdoor"
+
+
+class TestJobsViewFiltering:
+    """Tests for JobsView filters and paging."""
+
+    def test_filters_combine_and_clear(self, view):
+        """Filters should match substrings ignoring case and stack."""
+        view.filter("title", "DEVELOPER")
+        assert companies(view) == ["Tech Corp", "StartupXYZ"]
+
+        view.filter("location", "austin")
+        assert companies(view) == ["StartupXYZ"]
+
+        view.clear_filters()
+        assert len(view.positions) == 4
+
+    def test_filter_keeps_sort_order(self, view):
+        """Filtering a sorted view should keep it sorted."""
+        view.sort("date")
+        view.filter("source", "i")
+
+        assert companies(view) == ["BigTech", "Tech Corp", "Data Inc"]
+
+    def test_paging_clamps(self, view):
+        """Jumping past either end should stop at the first or last page."""
+        assert view.page_count == 2
+
+        view.go(10)
+        assert view.page == 1
+        view.go(-3)
+        assert view.page == 0
+
+    def test_render_builds_only_visible_rows(self, view):
+        """The table should hold one row per job on the visible page."""
+        view.go(1)
+        table = view.render()
+
+        console = Console(width=200)
+        with console.capture() as capture:
+            console.print(table)
+
+        assert table.row_count == 2
+        assert "Page 2/2" in capture.get()
+        assert "Junior Developer" in capture.get()
+        assert "Senior Python Developer" not in capture.get()
+
+    def test_large_session_pages_quickly(self):
+        """Sorting, filtering and paging 50k rows should not be slow."""
+        import time
+
+        import jobpacker
+
+        jobs = jobpacker.JobRows(
+            {
+                "title": [f"Engineer {i}" for i in range(50_000)],
+                "company": [f"Company {i % 997}" for i in range(50_000)],
+                "date_posted": [f"2025-01-{i % 28 + 1:02d}" for i in range(50_000)],
+                "max_amount": [float(i % 300) * 1000 for i in range(50_000)],
+                "site": ["indeed"] * 50_000,
+            },
+            50_000,
+        )
+
+        start = time.monotonic()
+        view = jobpacker.JobsView(jobs)
+        view.sort("salary")
+        view.filter("company", "company 1")
+        view.go(view.page_count - 1)
+        view.render()
+
+        assert time.monotonic() - start < 2
+
+
+class TestBrowseCommands:
+    """Tests for the viewer's command line."""
+
+    def test_navigation_commands(self, view):
+        """n, p, page numbers and g N should move between pages."""
+        import jobpacker
+
+        for command, page in [("n", 1), ("p", 0), ("2", 1), ("g 1", 0), ("", 1)]:
+            assert jobpacker.apply_browse_command(view, command)
+            assert view.page == page
+
+    def test_sort_filter_and_quit(self, view, mock_console):
+        """s, f and q should sort, filter and leave the viewer."""
+        import jobpacker
+
+        jobpacker.apply_browse_command(view, "s date")
+        jobpacker.apply_browse_command(view, "f company tech corp")
+        assert companies(view) == ["Tech Corp"]
+        assert view.sort_field == "date"
+
+        jobpacker.apply_browse_command(view, "f")
+        assert len(view.positions) == 4
+        assert not jobpacker.apply_browse_command(view, "q")
+
+    def test_unknown_command(self, view, mock_console):
+        """Unknown commands should be reported and keep the viewer open."""
+        import jobpacker
+
+        assert jobpacker.apply_browse_command(view, "s shoe size")
+        mock_console.print.assert_called_once()
+
+    def test_browse_until_quit(self, sample_jobspy_jobs, mock_console):
+        """browse_jobs should keep prompting until q."""
+        import jobpacker
+
+        with patch.object(jobpacker.Prompt, "ask", side_effect=["s salary", "n", "q"]) as ask:
+            jobpacker.browse_jobs(sample_jobspy_jobs)
+
+        assert ask.call_count == 3
+
+    def test_browse_nothing(self, mock_console):
+        """With no jobs there should be nothing to browse."""
+        import jobpacker
+
+        with patch.object(jobpacker.Prompt, "ask") as ask:
+            jobpacker.browse_jobs([])
+
+        ask.assert_not_called()